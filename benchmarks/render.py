@@ -0,0 +1,394 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Benchmark of the templates rendering, offline.
+
+Every scenario renders a set of compose files in render mode, in a dedicated process, with the AWS API calls
+replayed from the placebo responses in benchmarks/placebo. The wall time of each phase (settings and compose
+content loading, templates generation and stacks processing) and the peak RSS of the process are compared to
+the baselines, and any value above the baseline by more than the tolerance is reported as a regression.
+
+Usage::
+
+    python benchmarks/render.py
+    python benchmarks/render.py --scenario synthetic-100 --repeat 5
+    python benchmarks/render.py --update-baselines
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import sys
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import yaml
+
+HERE = path.abspath(path.dirname(__file__))
+ROOT_DIR = path.dirname(HERE)
+PLACEBO_DIR = path.join(HERE, "placebo")
+BASELINES_FILE = path.join(HERE, "baselines.json")
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_SECONDS = 0.05
+PHASES = ["settings", "set_content", "generate_full_template", "process_stacks"]
+
+USE_CASES = [
+    "sqs/simple_queue.yml",
+    "sns/simple_sns.yml",
+    "dynamodb/tables.yml",
+    "s3/full_s3_bucket_properties.yml",
+    "kinesis/create_only.yml",
+    "elbv2/create_only.yml",
+    "docdb/create_only.yml",
+    "elasticache/create_only.yml",
+    "events/mixed.yml",
+    "alarms/create_only.with_topics.yml",
+    "appmesh/new_mesh.yml",
+    "vpc/new_with_flowlogs.yml",
+]
+
+SYNTHETIC_SIZES = [10, 100, 500]
+MAX_RESOURCES_PER_MODULE = 25
+MAX_FAMILIES = 30
+
+
+def use_case_scenarios() -> dict:
+    """
+    One scenario per representative use-case, rendered along with the blog features, as the behave features do.
+    """
+    base_file = path.join(ROOT_DIR, "use-cases", "blog.features.yml")
+    return {
+        f"use-cases/{use_case}": [
+            base_file,
+            path.join(ROOT_DIR, "use-cases", use_case),
+        ]
+        for use_case in USE_CASES
+    }
+
+
+def synthetic_compose(services_count: int) -> dict:
+    """
+    Generates a compose definition with the given number of services, and a queue for every 5 services, a topic
+    and a table for every 10, granting access to these services.
+    The number of families and of resources of each module are capped so that their stacks stay within the
+    CloudFormation outputs limit: beyond that, the services are spread across the families.
+
+    :param int services_count:
+    :rtype: dict
+    """
+    families_count = min(MAX_FAMILIES, services_count)
+    services = {}
+    for index in range(services_count):
+        services[f"service{index:04d}"] = {
+            "image": "public.ecr.aws/nginx/nginx:latest",
+            "ports": [
+                {"target": 8000 + index, "published": 8000 + index, "protocol": "tcp"}
+            ],
+            "environment": {"INDEX": str(index), "LOGLEVEL": "INFO"},
+            "deploy": {
+                "labels": {"ecs.task.family": f"family{index % families_count:03d}"},
+                "resources": {"reservations": {"cpus": "0.25", "memory": "512M"}},
+            },
+            "x-scaling": {"Range": "1-4"},
+        }
+    names = list(services)
+
+    def resources_services(count: int, access: str) -> list:
+        """
+        Spreads the services across the resources, round-robin.
+        """
+        resources = [{} for _ in range(count)]
+        for index, name in enumerate(names):
+            resources[index % count][name] = {"Access": access}
+        return resources
+
+    compose = {"version": "3.8", "services": services}
+    queues_count = min(MAX_RESOURCES_PER_MODULE, max(1, services_count // 5))
+    compose["x-sqs"] = {
+        f"queue{index:04d}": {"Properties": {}, "Services": queue_services}
+        for index, queue_services in enumerate(
+            resources_services(queues_count, "RWMessages")
+        )
+    }
+    topics_count = min(MAX_RESOURCES_PER_MODULE, max(1, services_count // 10))
+    compose["x-sns"] = {
+        f"topic{index:04d}": {"Properties": {}, "Services": topic_services}
+        for index, topic_services in enumerate(
+            resources_services(topics_count, "Publish")
+        )
+    }
+    compose["x-dynamodb"] = {
+        f"table{index:04d}": {
+            "Properties": {
+                "AttributeDefinitions": [{"AttributeName": "Id", "AttributeType": "S"}],
+                "KeySchema": [{"AttributeName": "Id", "KeyType": "HASH"}],
+                "BillingMode": "PAY_PER_REQUEST",
+            },
+            "Services": table_services,
+        }
+        for index, table_services in enumerate(resources_services(topics_count, "RW"))
+    }
+    return compose
+
+
+def synthetic_scenarios(work_dir: str, sizes: list) -> dict:
+    scenarios = {}
+    for size in sizes:
+        file_path = path.join(work_dir, f"synthetic-{size}.yml")
+        with open(file_path, "w") as compose_fd:
+            yaml.dump(synthetic_compose(size), compose_fd)
+        scenarios[f"synthetic-{size}"] = [file_path]
+    return scenarios
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of the current process. ru_maxrss is in KB on Linux, in bytes on macOS.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if platform.system() == "Darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def render_scenario(files: list, output_dir: str, validation: str) -> dict:
+    """
+    Renders the compose files and returns the wall time of each phase.
+    Runs in the scenario process, so the imports are made here.
+    """
+    import boto3
+    import placebo
+
+    from ecs_composex.common.logging import LOG
+    from ecs_composex.common.settings import ComposeXSettings
+    from ecs_composex.common.stacks import process_stacks
+    from ecs_composex.ecs_composex import generate_full_template
+
+    LOG.setLevel(logging.ERROR)
+    timings = {}
+
+    class BenchmarkSettings(ComposeXSettings):
+        def set_content(self, kwargs, content=None, fully_load=True):
+            start = perf_counter()
+            super().set_content(kwargs, content, fully_load)
+            timings["set_content"] = perf_counter() - start
+
+    session = boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="benchmark",
+        aws_secret_access_key="benchmark",
+    )
+    pill = placebo.attach(session, data_path=PLACEBO_DIR)
+    pill.playback()
+
+    start = perf_counter()
+    settings = BenchmarkSettings(
+        session=session,
+        **{
+            ComposeXSettings.name_arg: "benchmark",
+            ComposeXSettings.command_arg: ComposeXSettings.render_arg,
+            ComposeXSettings.input_file_arg: files,
+            ComposeXSettings.format_arg: "yaml",
+            ComposeXSettings.output_dir_arg: output_dir,
+            ComposeXSettings.validation_arg: validation,
+        },
+    )
+    settings.set_bucket_name_from_account_id()
+    timings["settings"] = perf_counter() - start
+
+    start = perf_counter()
+    root_stack = generate_full_template(settings)
+    timings["generate_full_template"] = perf_counter() - start
+
+    start = perf_counter()
+    process_stacks(root_stack, settings)
+    timings["process_stacks"] = perf_counter() - start
+    return timings
+
+
+def scenario_process(files: list, validation: str, results_queue):
+    """
+    Entrypoint of the scenario process.
+    """
+    sys.stdout = open(path.devnull, "w")
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    try:
+        with TemporaryDirectory() as output_dir:
+            timings = render_scenario(files, output_dir, validation)
+        results_queue.put({"Timings": timings, "PeakRssMb": peak_rss_mb()})
+    except Exception as error:
+        results_queue.put({"Error": f"{type(error).__name__}: {error}"})
+
+
+def run_scenario(files: list, repeat: int, validation: str) -> dict:
+    """
+    Runs the scenario in a new process for every repeat, as the rendering keeps state at the module level,
+    and keeps the fastest time of each phase and the highest peak RSS.
+    """
+    context = multiprocessing.get_context("spawn")
+    best = {"Timings": {}, "PeakRssMb": 0.0}
+    for _ in range(repeat):
+        results_queue = context.Queue()
+        process = context.Process(
+            target=scenario_process, args=(files, validation, results_queue)
+        )
+        process.start()
+        result = results_queue.get()
+        process.join()
+        if "Error" in result:
+            return result
+        for phase, duration in result["Timings"].items():
+            best["Timings"][phase] = min(duration, best["Timings"].get(phase, duration))
+        best["PeakRssMb"] = max(best["PeakRssMb"], result["PeakRssMb"])
+    best["Timings"]["total"] = sum(
+        duration
+        for phase, duration in best["Timings"].items()
+        if phase != "set_content"
+    )
+    return best
+
+
+def compare(results: dict, baselines: dict, tolerance: float) -> list:
+    """
+    Returns the regressions, the values above their baseline by more than the tolerance.
+    Differences of timings below MIN_REGRESSION_SECONDS are ignored, as the shortest phases are too noisy.
+
+    :param dict results: the results, by scenario
+    :param dict baselines: the baselines, by scenario
+    :param float tolerance: ratio above the baseline allowed
+    :rtype: list[str]
+    """
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline or "Error" in result:
+            continue
+        values = dict(result["Timings"])
+        values["PeakRssMb"] = result["PeakRssMb"]
+        references = dict(baseline["Timings"])
+        references["PeakRssMb"] = baseline["PeakRssMb"]
+        for key, value in values.items():
+            reference = references.get(key)
+            if not reference or value <= reference * (1 + tolerance):
+                continue
+            if key != "PeakRssMb" and value - reference < MIN_REGRESSION_SECONDS:
+                continue
+            regressions.append(
+                f"{name} - {key}: {value:.3f} > {reference:.3f} (+{(value / reference - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def print_results(results: dict, baselines: dict) -> None:
+    header = ["Scenario"] + PHASES + ["total", "PeakRssMb"]
+    print(" | ".join(header))
+    for name, result in results.items():
+        if "Error" in result:
+            print(f"{name} | {result['Error']}")
+            continue
+        cells = [name]
+        for phase in PHASES + ["total"]:
+            value = result["Timings"].get(phase, 0.0)
+            reference = baselines.get(name, {}).get("Timings", {}).get(phase)
+            cells.append(
+                f"{value:.3f}s"
+                if not reference
+                else f"{value:.3f}s ({(value / reference - 1) * 100:+.0f}%)"
+            )
+        cells.append(f"{result['PeakRssMb']:.0f}")
+        print(" | ".join(cells))
+
+
+def main_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        "render-benchmark", description="Benchmark of the templates rendering"
+    )
+    parser.add_argument(
+        "--scenario",
+        dest="Scenarios",
+        action="append",
+        help="Scenario to run, i.e. synthetic-100 or use-cases/sqs/simple_queue.yml. Defaults to all.",
+    )
+    parser.add_argument(
+        "--sizes",
+        dest="Sizes",
+        type=int,
+        nargs="+",
+        default=SYNTHETIC_SIZES,
+        help="Number of services of the synthetic scenarios",
+    )
+    parser.add_argument("--repeat", dest="Repeat", type=int, default=3)
+    parser.add_argument(
+        "--validation",
+        dest="Validation",
+        choices=["local", "none"],
+        default="local",
+        help="Templates validation mode",
+    )
+    parser.add_argument(
+        "--baselines", dest="BaselinesFile", default=BASELINES_FILE, type=str
+    )
+    parser.add_argument(
+        "--tolerance",
+        dest="Tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Ratio above the baselines reported as a regression",
+    )
+    parser.add_argument(
+        "--update-baselines",
+        dest="UpdateBaselines",
+        action="store_true",
+        help="Store the results as the new baselines",
+    )
+    parser.add_argument(
+        "--output", dest="OutputFile", type=str, help="Write the results as JSON"
+    )
+    return parser
+
+
+def main() -> int:
+    args = main_parser().parse_args()
+    try:
+        with open(args.BaselinesFile) as baselines_fd:
+            baselines = json.load(baselines_fd)
+    except FileNotFoundError:
+        baselines = {}
+    results = {}
+    with TemporaryDirectory() as work_dir:
+        scenarios = use_case_scenarios()
+        scenarios.update(synthetic_scenarios(work_dir, args.Sizes))
+        for name, files in scenarios.items():
+            if args.Scenarios and name not in args.Scenarios:
+                continue
+            print(f"Running {name}", file=sys.stderr)
+            results[name] = run_scenario(files, args.Repeat, args.Validation)
+    print_results(results, baselines)
+    if args.OutputFile:
+        with open(args.OutputFile, "w") as output_fd:
+            json.dump(results, output_fd, indent=2, sort_keys=True)
+    errors = [name for name, result in results.items() if "Error" in result]
+    if args.UpdateBaselines:
+        baselines.update(
+            {name: result for name, result in results.items() if name not in errors}
+        )
+        with open(args.BaselinesFile, "w") as baselines_fd:
+            json.dump(baselines, baselines_fd, indent=2, sort_keys=True)
+            baselines_fd.write("\n")
+        return 1 if errors else 0
+    regressions = compare(results, baselines, args.Tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
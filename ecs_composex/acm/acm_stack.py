@@ -9,8 +9,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from compose_x_common.aws.acm import ACM_ARN_RE
+
 from ecs_composex.acm.acm_stack_helpers import (
     define_acm_certs,
+    get_cert_config,
     resolve_lookup,
     update_property_stack_with_resource,
 )
@@ -46,6 +49,15 @@ class Certificate(AwsEnvironmentResource):
     Class specifically for ACM Certificate
     """
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": ACM_ARN_RE,
+            "native_lookup_function": get_cert_config,
+            "cfn_resource_type": CfnAcmCertificate.resource_type,
+            "tagging_api_id": "acm:certificate",
+        }
+
     def init_outputs(self):
         """
         Returns the properties from the ACM Certificate
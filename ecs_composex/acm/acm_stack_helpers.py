@@ -14,12 +14,11 @@ if TYPE_CHECKING:
     from .acm_stack import Certificate
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws.acm import ACM_ARN_RE
 from compose_x_common.compose_x_common import keyisset
 from troposphere import Ref
-from troposphere.certificatemanager import Certificate as CfnAcmCertificate
 
 from ecs_composex.acm.acm_params import CERT_ARN, RES_KEY
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.troposphere_tools import (
     add_parameters,
@@ -59,12 +58,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            ACM_ARN_RE,
-            get_cert_config,
-            CfnAcmCertificate.resource_type,
-            "acm:certificate",
-        )
+        resource.resolve_lookup()
         resource.init_outputs()
         resource.generate_cfn_mappings_from_lookup_properties()
         resource.generate_outputs()
@@ -197,7 +191,7 @@ def get_cert_config(
     """
     Retrieves the AWS ACM Certificate details using AWS API
     """
-    client = certificate.lookup_session.client("acm")
+    client = get_cached_client(certificate.lookup_session, "acm")
     cert_config = {}
     try:
         cert_r = client.describe_certificate(CertificateArn=certificate.arn)
@@ -8,6 +8,7 @@ Module to interact with AWS AppMesh API
 from compose_x_common.compose_x_common import keyisset
 
 from ecs_composex.appmesh.appmesh_params import MESH_NAME, MESH_OWNER_ID
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 
 
@@ -53,7 +54,7 @@ def lookup_mesh_by_name(session, mesh_name, mesh_owner=None):
     }
     if mesh_owner is not None:
         r_params["meshOwner"] = mesh_owner
-    client = session.client("appmesh")
+    client = get_cached_client(session, "appmesh")
     try:
         mesh_r = client.describe_mesh(**r_params)["mesh"]
         mesh_info = {
@@ -58,6 +58,16 @@ class ManagedPrometheus(ApiXResource):
         self.ref_parameter = WORKSPACE_ARN
         self.support_defaults = True
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": APS_WORKSPACE_ARN_RE,
+            "native_lookup_function": None,
+            "cfn_resource_type": Workspace.resource_type,
+            "tagging_api_id": "aps:workspace",
+            "use_arn_for_id": True,
+        }
+
     def init_outputs(self):
         self.output_properties = {
             WORKSPACE_ARN: (
@@ -201,13 +211,7 @@ class XStack(ComposeXStack):
             if not keyisset(module.mapping_key, settings.mappings):
                 settings.mappings[module.mapping_key] = {}
             for resource in module.lookup_resources:
-                resource.lookup_resource(
-                    APS_WORKSPACE_ARN_RE,
-                    None,
-                    Workspace.resource_type,
-                    "aps:workspace",
-                    use_arn_for_id=True,
-                )
+                resource.resolve_lookup()
                 settings.mappings[module.mapping_key].update(
                     {resource.logical_name: resource.mappings}
                 )
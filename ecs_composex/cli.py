@@ -9,15 +9,11 @@ import argparse
 import logging
 import sys
 import warnings
+from datetime import datetime, timezone
 
-from ecs_composex.common.aws import deploy, plan
 from ecs_composex.common.logging import LOG
+from ecs_composex.common.profiling import PROFILER
 from ecs_composex.common.settings import ComposeXSettings
-from ecs_composex.common.stacks import process_stacks
-from ecs_composex.compose.compose_services.service_image.docker_opts import (
-    evaluate_ecr_configs,
-)
-from ecs_composex.ecs_composex import generate_full_template
 
 
 class ArgparseHelper(argparse._HelpAction):
@@ -133,6 +129,123 @@ def main_parser():
         required=False,
         action="store_true",
     )
+    base_command_parser.add_argument(
+        "--wait",
+        dest=ComposeXSettings.wait_arg,
+        help="On up, wait for the stack to complete, printing the stacks events."
+        " Exits with a non-zero code if the deployment failed.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--skip-change-set",
+        dest=ComposeXSettings.skip_change_set_arg,
+        help="On plan, only show the changes computed locally from the deployed templates,"
+        " without creating the CloudFormation change set.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--render-workers",
+        dest=ComposeXSettings.render_workers_arg,
+        help="Number of nested stacks to render, upload and validate concurrently. Defaults to 1",
+        type=int,
+        required=False,
+        default=ComposeXSettings.default_render_workers,
+    )
+    base_command_parser.add_argument(
+        "--lookup-workers",
+        dest=ComposeXSettings.lookup_workers_arg,
+        help="Number of x-resources to lookup concurrently before generating the templates. Defaults to 1",
+        type=int,
+        required=False,
+        default=ComposeXSettings.default_lookup_workers,
+    )
+    base_command_parser.add_argument(
+        "--content-addressed-uploads",
+        dest=ComposeXSettings.content_addressed_arg,
+        help="Store files in S3 under their SHA-256 digest. Unchanged files are not uploaded again"
+        " and keep the same URL across executions.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--validation",
+        dest=ComposeXSettings.validation_arg,
+        help="How to validate the templates. remote uses the CloudFormation API, local validates them offline."
+        " Defaults to remote",
+        choices=ComposeXSettings.validation_modes,
+        default=ComposeXSettings.default_validation,
+        required=False,
+    )
+    base_command_parser.add_argument(
+        "--serializer",
+        dest=ComposeXSettings.serializer_arg,
+        help="How to write the templates. default produces the same output as troposphere."
+        " fast uses orjson, if installed, and libyaml, for semantically identical templates.",
+        choices=ComposeXSettings.templates_serializers,
+        default=ComposeXSettings.default_serializer,
+        required=False,
+    )
+    base_command_parser.add_argument(
+        "--lookup-cache-dir",
+        dest=ComposeXSettings.lookup_cache_dir_arg,
+        help="Directory to store lookup API calls results into, to re-use them across executions."
+        " Defaults to COMPOSEX_LOOKUP_CACHE_DIR if set. Disabled otherwise.",
+        required=False,
+        type=str,
+    )
+    base_command_parser.add_argument(
+        "--refresh-cache",
+        dest=ComposeXSettings.refresh_cache_arg,
+        help="Ignore the lookup cache existing entries and store new ones.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--no-cache",
+        dest=ComposeXSettings.no_cache_arg,
+        help="Disable the lookup cache.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--incremental",
+        dest=ComposeXSettings.incremental_arg,
+        help="Do not upload nor validate again the templates and files unchanged since the previous execution."
+        " All the templates are still generated.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--state-file",
+        dest=ComposeXSettings.state_file_arg,
+        help="Path to the incremental rendering state file."
+        f" Defaults to {ComposeXSettings.default_state_dir}/<name>.state.json",
+        required=False,
+        type=str,
+    )
+    base_command_parser.add_argument(
+        "--profile",
+        dest=ComposeXSettings.profile_arg,
+        help="Report the time spent in every phase, module, family and stack, and the AWS API calls made.",
+        required=False,
+        action="store_true",
+    )
+    base_command_parser.add_argument(
+        "--profile-output",
+        dest=ComposeXSettings.profile_output_arg,
+        help="Write the profile report as JSON to the given file. Implies --profile",
+        required=False,
+        type=str,
+    )
+    base_command_parser.add_argument(
+        "--cprofile-output",
+        dest=ComposeXSettings.cprofile_output_arg,
+        help="Profile the execution with cProfile and dump the statistics to the given file. Implies --profile",
+        required=False,
+        type=str,
+    )
     extras_parser.add_argument(
         "--ignore-ecr-findings",
         dest=ComposeXSettings.ecr_arg,
@@ -195,22 +308,52 @@ def main():
     settings.set_bucket_name_from_account_id()
     LOG.debug(settings)
 
+    # The templates generation modules are only imported for the commands rendering templates,
+    # so that version, init and config do not pay for their import.
+    from ecs_composex.common.aws import deploy, plan
+    from ecs_composex.common.aws_cache import get_client
+    from ecs_composex.common.stacks import process_stacks
+    from ecs_composex.common.stacks_diff import local_plan
+    from ecs_composex.common.stacks_waiter import wait_for_stack
+    from ecs_composex.compose.compose_services.service_image.docker_opts import (
+        evaluate_ecr_configs,
+    )
+    from ecs_composex.ecs_composex import generate_full_template
+
     if settings.deploy and not settings.upload:
         LOG.warning(
             "You must update the templates in order to deploy. We won't be deploying."
         )
         settings.deploy = False
-    scan_results = evaluate_ecr_configs(settings)
+    with PROFILER.phase("ecr_scan"):
+        scan_results = evaluate_ecr_configs(settings)
     if scan_results:
         return scan_results
-    root_stack = generate_full_template(settings)
-    process_stacks(root_stack, settings)
+    with PROFILER.phase("generate_full_template"):
+        root_stack = generate_full_template(settings)
+    with PROFILER.phase("process_stacks"):
+        process_stacks(root_stack, settings)
 
+    result = 0
     if settings.deploy:
-        deploy(settings, root_stack)
+        deploy_start = datetime.now(timezone.utc)
+        with PROFILER.phase("deploy"):
+            stack_id = deploy(settings, root_stack)
+        if settings.wait and stack_id:
+            with PROFILER.phase("wait"):
+                result = wait_for_stack(
+                    get_client(settings.session, "cloudformation"),
+                    stack_id,
+                    since=deploy_start,
+                )
     elif settings.plan:
-        plan(settings, root_stack)
-    return 0
+        with PROFILER.phase("local_plan"):
+            local_plan(settings, root_stack)
+        if not settings.skip_change_set:
+            with PROFILER.phase("plan"):
+                plan(settings, root_stack)
+    PROFILER.finish()
+    return result
 
 
 if __name__ == "__main__":
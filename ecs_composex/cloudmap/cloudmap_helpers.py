@@ -14,15 +14,14 @@ if TYPE_CHECKING:
 
 from compose_x_common.aws.cloudmap import get_all_dns_namespaces
 from compose_x_common.compose_x_common import keyisset
-from troposphere.servicediscovery import PrivateDnsNamespace
 
 from ecs_composex.cloudmap.cloudmap_params import (
     LAST_DOT_RE,
     PRIVATE_DNS_ZONE_ID,
     PRIVATE_DNS_ZONE_NAME,
     PRIVATE_NAMESPACE_ID,
-    ZONES_PATTERN,
 )
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.exceptions import ComposeBaseException, IncompatibleOptions
 
@@ -38,12 +37,7 @@ def resolve_lookup(lookup_resources, settings, module: XResourceModule):
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            ZONES_PATTERN,
-            lookup_service_discovery_namespace,
-            PrivateDnsNamespace.resource_type,
-            "",
-        )
+        resource.resolve_lookup()
         resource.init_outputs()
         resource.generate_cfn_mappings_from_lookup_properties()
         resource.generate_outputs()
@@ -109,7 +103,7 @@ def lookup_service_discovery_namespace(
     :return: The properties we need
     :rtype: dict
     """
-    client = session.client("servicediscovery")
+    client = get_cached_client(session, "servicediscovery")
     try:
         namespaces = get_all_dns_namespaces(session)
         if zone.zone_name not in [z["Name"] for z in namespaces]:
@@ -44,6 +44,7 @@ from .cloudmap_params import (
     PRIVATE_DNS_ZONE_ID,
     PRIVATE_DNS_ZONE_NAME,
     PRIVATE_NAMESPACE_ID,
+    ZONES_PATTERN,
 )
 from .cloudmap_x_resources import handle_resource_cloudmap_settings
 
@@ -76,6 +77,15 @@ class PrivateNamespace(AwsEnvironmentResource):
             )
         self.requires_vpc = True
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": ZONES_PATTERN,
+            "native_lookup_function": lookup_service_discovery_namespace,
+            "cfn_resource_type": PrivateDnsNamespace.resource_type,
+            "tagging_api_id": "",
+        }
+
     def init_outputs(self):
         """
         Returns the properties outputs mappings.
@@ -25,6 +25,7 @@ from ecs_composex.cognito_userpool.cognito_params import (
     USERPOOL_ID,
     USERPOOL_NAME,
 )
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -48,7 +49,7 @@ def get_userpool_config(userpool, account_id, resource_id):
     :param str resource_id: The Userpool ARN
     :return:
     """
-    client = userpool.lookup_session.client("cognito-idp")
+    client = get_cached_client(userpool.lookup_session, "cognito-idp")
     userpool_attributes_mapping = {
         USERPOOL_ARN: "UserPool::Arn",
         USERPOOL_ID: "UserPool::Id",
@@ -80,6 +81,15 @@ class UserPool(AwsEnvironmentResource, ApiXResource):
         super().__init__(name, definition, module, settings)
         self.arn_parameter = USERPOOL_ARN
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": USER_POOL_RE,
+            "native_lookup_function": get_userpool_config,
+            "cfn_resource_type": CfnUserPool.resource_type,
+            "tagging_api_id": "cognito-idp",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             USERPOOL_ID: (self.logical_name, self.cfn_resource, Ref, None),
@@ -107,12 +117,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            USER_POOL_RE,
-            get_userpool_config,
-            CfnUserPool.resource_type,
-            "cognito-idp",
-        )
+        resource.resolve_lookup()
         resource.init_outputs()
         resource.generate_cfn_mappings_from_lookup_properties()
         resource.generate_outputs()
@@ -8,21 +8,28 @@ import re
 import secrets
 from copy import deepcopy
 from string import ascii_lowercase
-from time import sleep
+from threading import Lock, RLock
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws import get_assume_role_session, validate_iam_role_arn
+from compose_x_common.aws import validate_iam_role_arn
 from compose_x_common.aws.arns import ARNS_PER_TAGGINGAPI_TYPE
 from compose_x_common.compose_x_common import keyisset
 from tabulate import tabulate
 
+from ecs_composex.common.aws_cache import get_cached_client, get_client
+from ecs_composex.common.aws_sessions import SESSIONS_BROKER
 from ecs_composex.common.logging import LOG
+from ecs_composex.common.stacks_waiter import (
+    get_change_set_changes,
+    wait_for_change_set,
+)
 from ecs_composex.iam import ROLE_ARN_ARG
 
 
 def get_cross_role_session(session, arn, region_name=None, session_name=None):
     """
-    Function to override ComposeXSettings session to specific session for Lookup
+    Function to override ComposeXSettings session to specific session for Lookup.
+    The assumed-role sessions are shared for the execution, by role ARN and region.
 
     :param boto3.session.Session session: The original session fetching the credentials for X-Role
     :param str arn:
@@ -31,11 +38,9 @@ def get_cross_role_session(session, arn, region_name=None, session_name=None):
     :return: boto3 session from lookup settings
     :rtype: boto3.session.Session
     """
-    if not session_name:
-        session_name = "ComposeX@Lookup"
     try:
-        return get_assume_role_session(
-            session, arn, session_name=session_name, region=region_name
+        return SESSIONS_BROKER.assume_role_session(
+            session, arn, region_name=region_name, session_name=session_name
         )
     except ClientError:
         LOG.error(f"Failed to use the Role ARN {arn}")
@@ -96,6 +101,30 @@ def define_tagsgroups_filter_tags(tags) -> list:
     raise TypeError("Tags must be one of", [list, dict], "Got", type(tags))
 
 
+TAGGING_API_MAX_TYPE_FILTERS = 100
+ARN_RESOURCE_TYPE_RE = re.compile(
+    r"^arn:[^:]+:(?P<service>[^:]+):[^:]*:[^:]*:(?P<type>[^:/]+)?"
+)
+
+
+def get_all_resources_tag_mappings(session, **kwargs) -> list:
+    """
+    Lists all the resources matching the Tagging API filters, going over all the pages.
+
+    :param boto3.session.Session session: The boto3 session for API calls
+    :param kwargs: ResourceTypeFilters and TagFilters for the get_resources API call
+    :rtype: list[dict]
+    """
+    client = get_cached_client(session, "resourcegroupstaggingapi")
+    mappings = []
+    while True:
+        resources_r = client.get_resources(**kwargs)
+        mappings += resources_r.get("ResourceTagMappingList", [])
+        if not keyisset("PaginationToken", resources_r):
+            return mappings
+        kwargs["PaginationToken"] = resources_r["PaginationToken"]
+
+
 def get_resources_from_tags(session, aws_resource_search, search_tags):
     """
 
@@ -105,17 +134,185 @@ def get_resources_from_tags(session, aws_resource_search, search_tags):
     :return:
     """
     try:
-        client = session.client("resourcegroupstaggingapi")
-        resources_r = client.get_resources(
-            ResourceTypeFilters=[aws_resource_search], TagFilters=search_tags
-        )
-        return resources_r
+        return {
+            "ResourceTagMappingList": get_all_resources_tag_mappings(
+                session,
+                ResourceTypeFilters=[aws_resource_search],
+                TagFilters=search_tags,
+            )
+        }
     except ClientError as error:
         LOG.error(error)
         LOG.error("Not processing this resource. Skipping")
         return None
 
 
+def resource_type_matches(arn: str, resource_type: str) -> bool:
+    """
+    Whether the ARN is one of a Tagging API resource type filter, i.e. rds:cluster or sqs
+
+    :param str arn:
+    :param str resource_type:
+    """
+    parts = ARN_RESOURCE_TYPE_RE.match(arn)
+    if not parts:
+        return False
+    service, _, sub_type = resource_type.partition(":")
+    return parts.group("service") == service and (
+        not sub_type or parts.group("type") == sub_type
+    )
+
+
+def tags_match(tags: dict, search_tags: list) -> bool:
+    """
+    Whether the resource tags match all the Tagging API TagFilters
+
+    :param dict tags: The resource tags
+    :param list search_tags: TagFilters, i.e. [{"Key": "name", "Values": ("value",)}]
+    """
+    for tag_filter in search_tags:
+        if tag_filter["Key"] not in tags:
+            return False
+        values = [str(_value) for _value in tag_filter.get("Values", [])]
+        if values and tags[tag_filter["Key"]] not in values:
+            return False
+    return True
+
+
+class ResourcesTagsIndex:
+    """
+    Index of the resources and their tags, per session and Tagging API resource type, so that all the lookups via
+    tags of an execution are answered with a few paginated API calls instead of one call per lookup.
+
+    :ivar dict resources: list of (ARN, tags) by (client ID, resource type)
+    :ivar dict clients: the clients the index was built with, kept so that their ID cannot be re-used
+    """
+
+    def __init__(self):
+        self.resources: dict = {}
+        self.clients: dict = {}
+        self._types_locks: dict = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.resources.clear()
+            self.clients.clear()
+            self._types_locks.clear()
+
+    def client_id(self, session) -> int:
+        client = get_client(session, "resourcegroupstaggingapi")
+        with self._lock:
+            self.clients[id(client)] = client
+        return id(client)
+
+    def prime(self, session, resource_types: list) -> None:
+        """
+        Lists all the resources of the given types, grouping the types in as few API calls as possible.
+        The API calls are made holding only the locks of the listed types, so that lookups of other types or
+        sessions are not held up, and the types are only listed once.
+
+        :param boto3.session.Session session:
+        :param list[str] resource_types: Tagging API resource types, i.e. rds:cluster or sqs
+        """
+        client_id = self.client_id(session)
+        to_list = sorted(
+            {
+                _type
+                for _type in resource_types
+                if _type and (client_id, _type) not in self.resources
+            }
+        )
+        for count in range(0, len(to_list), TAGGING_API_MAX_TYPE_FILTERS):
+            batch = to_list[count : count + TAGGING_API_MAX_TYPE_FILTERS]
+            types_locks = self.types_locks(client_id, batch)
+            for type_lock in types_locks:
+                type_lock.acquire()
+            try:
+                batch = [
+                    _type for _type in batch if (client_id, _type) not in self.resources
+                ]
+                if batch:
+                    self.list_resources(session, client_id, batch)
+            finally:
+                for type_lock in reversed(types_locks):
+                    type_lock.release()
+
+    def types_locks(self, client_id: int, resource_types: list) -> list:
+        """
+        :return: the locks of the resource types, in the resource types order. Acquiring them in the sorted types
+            order prevents deadlocks between concurrent primes.
+        :rtype: list[threading.Lock]
+        """
+        with self._lock:
+            return [
+                self._types_locks.setdefault((client_id, _type), Lock())
+                for _type in resource_types
+            ]
+
+    def list_resources(self, session, client_id: int, resource_types: list) -> None:
+        try:
+            mappings = get_all_resources_tag_mappings(
+                session, ResourceTypeFilters=resource_types
+            )
+        except ClientError as error:
+            LOG.error(error)
+            LOG.error(f"Failed to list resources for {resource_types}")
+            return
+        types_resources = {}
+        indexed = set()
+        for resource_type in resource_types:
+            types_resources[(client_id, resource_type)] = [
+                (
+                    mapping["ResourceARN"],
+                    {_tag["Key"]: _tag["Value"] for _tag in mapping.get("Tags", [])},
+                )
+                for mapping in mappings
+                if len(resource_types) == 1
+                or resource_type_matches(mapping["ResourceARN"], resource_type)
+            ]
+            indexed.update(
+                _arn for _arn, _ in types_resources[(client_id, resource_type)]
+            )
+        with self._lock:
+            self.resources.update(types_resources)
+        unmatched = [
+            _m["ResourceARN"] for _m in mappings if _m["ResourceARN"] not in indexed
+        ]
+        if unmatched:
+            LOG.debug(f"Could not map {unmatched} to any of {resource_types}")
+            for resource_type in resource_types:
+                if not types_resources[(client_id, resource_type)]:
+                    self.list_resources(session, client_id, [resource_type])
+
+    def find(self, session, resource_type: str, search_tags: list) -> list:
+        """
+        Returns the ARN of the resources of the given type that match the tags
+
+        :param boto3.session.Session session:
+        :param str resource_type: Tagging API resource types, i.e. rds:cluster or sqs
+        :param list search_tags: TagFilters, i.e. [{"Key": "name", "Values": ("value",)}]
+        :rtype: list[str]
+        """
+        if not resource_type:
+            resources_r = get_resources_from_tags(session, resource_type, search_tags)
+            return (
+                [_m["ResourceARN"] for _m in resources_r["ResourceTagMappingList"]]
+                if resources_r
+                else []
+            )
+        self.prime(session, [resource_type])
+        client_id = self.client_id(session)
+        return [
+            arn
+            for arn, tags in self.resources.get((client_id, resource_type), [])
+            if tags_match(tags, search_tags)
+        ]
+
+
+TAGS_INDEX = ResourcesTagsIndex()
+
+
 def handle_multi_results(arns, name, res_type, regexp, allow_multi=False):
     """
     Function to evaluate more than one result to see if we can match an unique name.
@@ -224,12 +421,8 @@ def find_aws_resource_arn_from_tags_api(
     )
     name = info["Name"] if keyisset("Name", info) else None
 
-    resources_r = get_resources_from_tags(session, aws_resource_search, search_tags)
     LOG.debug(search_tags)
-    if not resources_r or not keyisset("ResourceTagMappingList", resources_r):
-        arns = []
-    else:
-        arns = [i["ResourceARN"] for i in resources_r["ResourceTagMappingList"]]
+    arns = TAGS_INDEX.find(session, aws_resource_search, search_tags)
     return handle_search_results(
         arns, name, res_types, aws_resource_search, allow_multi=allow_multi
     )
@@ -333,33 +526,19 @@ def deploy(settings, root_stack):
 
 
 def get_change_set_status(client, change_set_name, settings):
-    pending_statuses = [
-        "CREATE_PENDING",
-        "CREATE_IN_PROGRESS",
-        "DELETE_PENDING",
-        "DELETE_IN_PROGRESS",
-        "REVIEW_IN_PROGRESS",
-    ]
-    success_statuses = ["CREATE_COMPLETE", "DELETE_COMPLETE"]
-    failed_statuses = ["DELETE_FAILED", "FAILED"]
-    ready = False
-    status = None
-    while not ready:
-        status = client.describe_change_set(
-            ChangeSetName=change_set_name, StackName=settings.name
-        )
-        if status["Status"] in failed_statuses:
-            raise SystemExit("Change set is unsucessful", status["Status"])
-        if status["Status"] in pending_statuses:
-            print(
-                "ChangeSet creation in progress. Waiting 10 seconds",
-                end="\r",
-                flush=True,
-            )
-            sleep(10)
-        elif status["Status"] in success_statuses:
-            ready = True
+    """
+    Waits for the change set to be created and prints all its changes, nested stacks changes included.
 
+    :param client: CloudFormation client
+    :param str change_set_name:
+    :param ComposeXSettings settings:
+    :return: the change set description, with all the changes
+    :rtype: dict
+    """
+    status = wait_for_change_set(client, change_set_name, settings.name)
+    status["Changes"] = get_change_set_changes(
+        client, change_set_name, stack_name=settings.name
+    )
     print(
         tabulate(
             [
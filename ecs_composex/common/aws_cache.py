@@ -0,0 +1,308 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Execution scoped pool of boto3 clients and cache of the idempotent AWS API calls (describe, get and list)
+made to look up resources, so that the same client is not created and the same call is not made more than once.
+
+Optionally, the responses are also persisted on disk with a TTL per API call, so that successive executions
+re-use them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+
+import json
+import re
+from copy import deepcopy
+from functools import partial
+from hashlib import sha256
+from os import environ, makedirs, path, replace
+from tempfile import NamedTemporaryFile
+from threading import BoundedSemaphore, Lock, RLock
+from time import time
+
+from ecs_composex.common.logging import LOG
+
+IDEMPOTENT_OPERATIONS_RE = re.compile(r"^(describe|get|list)_")
+NOT_API_OPERATIONS = ["get_paginator", "get_waiter"]
+
+DEFAULT_SERVICE_CONCURRENCY = 4
+SERVICES_CONCURRENCY = {
+    "cloudcontrol": 4,
+    "resourcegroupstaggingapi": 2,
+    "sts": 2,
+}
+
+LOOKUP_CACHE_DIR_ENV = "COMPOSEX_LOOKUP_CACHE_DIR"
+DEFAULT_PERSISTENT_TTL = 900
+PERSISTENT_CACHE_TTLS = {
+    "cloudcontrol.get_resource": 3600,
+    "resourcegroupstaggingapi.get_resources": 3600,
+    "rds.describe_db_engine_versions": 86400,
+    "rds.describe_engine_default_cluster_parameters": 86400,
+    "rds.describe_engine_default_parameters": 86400,
+    "ec2.describe_availability_zones": 86400,
+    "ecr.describe_images": 300,
+    "ecr.list_images": 300,
+    "docker.inspect_distribution": 300,
+    "sts.get_caller_identity": 0,
+    "ssm.get_parameter": 0,
+}
+
+
+class PersistentCache:
+    """
+    Stores the API calls responses as JSON files in a local directory, by account, region, service, operation and
+    arguments. A TTL of 0 for an operation disables persistence of its responses.
+
+    :ivar str cache_dir: the directory to store the responses into
+    :ivar dict ttls: TTL, in seconds, by service.operation
+    :ivar bool refresh: Ignore the stored responses, but store the new ones.
+    """
+
+    def __init__(self, cache_dir: str, ttls: dict = None, refresh: bool = False):
+        self.cache_dir = path.abspath(path.expanduser(cache_dir))
+        self.ttls = deepcopy(PERSISTENT_CACHE_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.refresh = refresh
+
+    def ttl(self, operation: str) -> int:
+        return self.ttls.get(operation, DEFAULT_PERSISTENT_TTL)
+
+    def file_path(
+        self, account_id: str, region: str, operation: str, arguments: str
+    ) -> str:
+        return path.join(
+            self.cache_dir,
+            account_id,
+            region or "global",
+            operation,
+            f"{sha256(arguments.encode('utf-8')).hexdigest()}.json",
+        )
+
+    def get(self, account_id: str, region: str, operation: str, arguments: str):
+        """
+        Returns the stored response if it has not expired, None otherwise.
+        """
+        if self.refresh or not self.ttl(operation):
+            return None
+        file_path = self.file_path(account_id, region, operation, arguments)
+        try:
+            with open(file_path) as cache_fd:
+                cached = json.load(cache_fd)
+        except (OSError, ValueError):
+            return None
+        if time() - cached["Timestamp"] > self.ttl(operation):
+            LOG.debug(f"{operation} - Cached response {file_path} expired")
+            return None
+        return cached["Response"]
+
+    def put(
+        self, account_id: str, region: str, operation: str, arguments: str, response
+    ) -> None:
+        if not self.ttl(operation):
+            return
+        file_path = self.file_path(account_id, region, operation, arguments)
+        makedirs(path.dirname(file_path), exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=path.dirname(file_path), delete=False, suffix=".tmp"
+        ) as cache_fd:
+            json.dump(
+                {"Timestamp": time(), "Response": response}, cache_fd, default=str
+            )
+        replace(cache_fd.name, file_path)
+
+
+class CachedClient:
+    """
+    Proxy to a boto3 client which memoizes the idempotent API calls. Everything else is passed through to the client.
+    """
+
+    def __init__(self, client, cache: AwsApiCache):
+        self._client = client
+        self._cache = cache
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if (
+            callable(attribute)
+            and IDEMPOTENT_OPERATIONS_RE.match(name)
+            and name not in NOT_API_OPERATIONS
+        ):
+            return partial(self._cache.call, self._client, name)
+        return attribute
+
+
+class AwsApiCache:
+    """
+    Keeps one boto3 client per session, region and service, and the responses of the idempotent API calls made with
+    these clients.
+
+    :ivar dict clients: the clients, by (session ID, region, service)
+    :ivar dict responses: the API calls responses, by (client ID, operation, arguments)
+    :ivar dict stats: hits and misses count, by service.operation
+    :ivar PersistentCache persistent: when set, the on-disk cache of the responses
+    :ivar dict services_semaphores: limit the number of concurrent API calls, by service
+    """
+
+    def __init__(self):
+        self.clients: dict = {}
+        self.clients_sessions: dict = {}
+        self.responses: dict = {}
+        self.stats: dict = {}
+        self.persistent: PersistentCache | None = None
+        self.services_semaphores: dict = {}
+        self._calls_locks: dict = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.clients.clear()
+            self.clients_sessions.clear()
+            self.responses.clear()
+            self.stats.clear()
+            self.persistent = None
+            self._calls_locks.clear()
+
+    def set_persistent_cache(
+        self, cache_dir: str = None, refresh: bool = False, disabled: bool = False
+    ) -> None:
+        """
+        Enables the on-disk cache if a directory is given or set via COMPOSEX_LOOKUP_CACHE_DIR, unless disabled.
+        """
+        if cache_dir is None:
+            cache_dir = environ.get(LOOKUP_CACHE_DIR_ENV)
+        if disabled or not cache_dir:
+            self.persistent = None
+            return
+        self.persistent = PersistentCache(cache_dir, refresh=refresh)
+        LOG.info(f"Using lookup cache in {self.persistent.cache_dir}")
+
+    def client(self, session: Session, service_name: str, region_name: str = None):
+        """
+        Returns the client for the session and region. The session is kept along with the client so that its id
+        cannot be re-used during the execution.
+        """
+        key = (id(session), region_name or session.region_name, service_name)
+        with self._lock:
+            if key not in self.clients:
+                client = session.client(service_name, region_name=region_name)
+                self.clients[key] = (session, client)
+                self.clients_sessions[id(client)] = session
+            return self.clients[key][1]
+
+    def service_semaphore(self, service_name: str) -> BoundedSemaphore:
+        with self._lock:
+            if service_name not in self.services_semaphores:
+                self.services_semaphores[service_name] = BoundedSemaphore(
+                    SERVICES_CONCURRENCY.get(service_name, DEFAULT_SERVICE_CONCURRENCY)
+                )
+            return self.services_semaphores[service_name]
+
+    def call_lock(self, key: tuple) -> Lock:
+        with self._lock:
+            if key not in self._calls_locks:
+                self._calls_locks[key] = Lock()
+            return self._calls_locks[key]
+
+    def count(self, stat_key: str, hit: bool) -> None:
+        with self._lock:
+            if stat_key not in self.stats:
+                self.stats[stat_key] = {"hits": 0, "misses": 0}
+            self.stats[stat_key]["hits" if hit else "misses"] += 1
+
+    def call(self, client, operation_name: str, **kwargs):
+        """
+        Returns the response of the API call from cache, or makes the API call and stores it.
+        Concurrent calls with the same arguments wait for the first one to complete instead of calling the API again.
+        The responses are copied so that callers cannot alter the cached values.
+        """
+        if not IDEMPOTENT_OPERATIONS_RE.match(operation_name):
+            raise ValueError(
+                f"{operation_name} is not a describe, get or list operation and cannot be cached"
+            )
+        arguments = json.dumps(kwargs, sort_keys=True, default=str)
+        key = (id(client), operation_name, arguments)
+        service_name = client.meta.service_model.service_name
+        stat_key = f"{service_name}.{operation_name}"
+        with self.call_lock(key):
+            if key in self.responses:
+                self.count(stat_key, hit=True)
+                LOG.debug(f"{operation_name} - {kwargs} - Using cached response")
+                return deepcopy(self.responses[key])
+            response = None
+            persistent_key = None
+            if (
+                self.persistent
+                and self.persistent.ttl(stat_key)
+                and id(client) in self.clients_sessions
+            ):
+                persistent_key = (
+                    get_account_id(self.clients_sessions[id(client)]),
+                    client.meta.region_name,
+                    stat_key,
+                    arguments,
+                )
+                response = self.persistent.get(*persistent_key)
+            if response is not None:
+                self.count(stat_key, hit=True)
+                LOG.debug(f"{operation_name} - {kwargs} - Using lookup cache response")
+            else:
+                with self.service_semaphore(service_name):
+                    response = getattr(client, operation_name)(**kwargs)
+                self.count(stat_key, hit=False)
+                if persistent_key:
+                    self.persistent.put(*persistent_key, response)
+            with self._lock:
+                self.responses[key] = response
+        return deepcopy(response)
+
+    def log_stats(self) -> None:
+        for operation, stats in sorted(self.stats.items()):
+            LOG.debug(
+                f"AWS API cache - {operation} - {stats['hits']} hits, {stats['misses']} misses"
+            )
+
+
+AWS_CACHE = AwsApiCache()
+
+
+def get_client(session: Session, service_name: str, region_name: str = None):
+    """
+    Returns the client for the service from the execution clients pool
+
+    :param boto3.session.Session session:
+    :param str service_name:
+    :param str region_name: Override the session region
+    """
+    return AWS_CACHE.client(session, service_name, region_name)
+
+
+def get_cached_client(
+    session: Session, service_name: str, region_name: str = None
+) -> CachedClient:
+    """
+    Returns the client for the service from the execution clients pool, whose describe, get and list
+    API calls are memoized. Use for lookups only, not for calls polling for a status change.
+
+    :param boto3.session.Session session:
+    :param str service_name:
+    :param str region_name: Override the session region
+    """
+    return CachedClient(get_client(session, service_name, region_name), AWS_CACHE)
+
+
+def get_account_id(session: Session) -> str:
+    """
+    Returns the account ID of the session, calling STS only once per session.
+
+    :param boto3.session.Session session:
+    :rtype: str
+    """
+    return get_cached_client(session, "sts").get_caller_identity()["Account"]
@@ -0,0 +1,129 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Execution scoped broker of the boto3 sessions derived from the execution session: assumed-role sessions, by role
+ARN and region, and sessions with the same credentials in another region. The role is assumed once, and again only
+when the credentials are about to expire.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+
+from threading import RLock
+
+import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+
+from ecs_composex.common.aws_cache import get_client
+from ecs_composex.common.logging import LOG
+
+DEFAULT_ROLE_SESSION_NAME = "ComposeX@Lookup"
+
+
+def create_session(credentials, region_name: str = None) -> Session:
+    """
+    Creates a boto3 session using the given botocore credentials
+
+    :param botocore.credentials.Credentials credentials:
+    :param str region_name:
+    :rtype: boto3.session.Session
+    """
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = credentials
+    return boto3.session.Session(
+        botocore_session=botocore_session, region_name=region_name
+    )
+
+
+class SessionsBroker:
+    """
+    Keeps the sessions derived from the execution sessions, so that the same role is not assumed more than once
+    and that the derived sessions, and their clients and API calls cache, are re-used.
+
+    :ivar dict sessions: the derived sessions, by (source session ID, role ARN, region)
+    :ivar dict sources: the source sessions, kept so that their ID cannot be re-used
+    """
+
+    def __init__(self):
+        self.sessions: dict = {}
+        self.sources: dict = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.sessions.clear()
+            self.sources.clear()
+
+    def regional_session(self, session: Session, region_name: str) -> Session:
+        """
+        :param boto3.session.Session session:
+        :param str region_name:
+        :return: A session with the same credentials, in the given region. The session itself if in that region.
+        :rtype: boto3.session.Session
+        """
+        if not region_name or region_name == session.region_name:
+            return session
+        key = (id(session), None, region_name)
+        with self._lock:
+            if key not in self.sessions:
+                self.sources[id(session)] = session
+                self.sessions[key] = create_session(
+                    session.get_credentials(), region_name
+                )
+            return self.sessions[key]
+
+    def assume_role_session(
+        self,
+        session: Session,
+        role_arn: str,
+        region_name: str = None,
+        session_name: str = None,
+    ) -> Session:
+        """
+        Returns a session which assumes the role with the session credentials, refreshing the credentials before
+        they expire.
+
+        :param boto3.session.Session session: The original session, used to assume the role
+        :param str role_arn:
+        :param str region_name: Name of region for session. Defaults to the original session region
+        :param str session_name: Role session name, used when the role is assumed for the first time
+        :rtype: boto3.session.Session
+        """
+        if not region_name:
+            region_name = session.region_name
+        if not session_name:
+            session_name = DEFAULT_ROLE_SESSION_NAME
+        key = (id(session), role_arn, region_name)
+        with self._lock:
+            if key not in self.sessions:
+                sts_client = get_client(session, "sts")
+
+                def assume_role() -> dict:
+                    LOG.debug(f"Assuming role {role_arn} as {session_name}")
+                    credentials = sts_client.assume_role(
+                        RoleArn=role_arn, RoleSessionName=session_name
+                    )["Credentials"]
+                    return {
+                        "access_key": credentials["AccessKeyId"],
+                        "secret_key": credentials["SecretAccessKey"],
+                        "token": credentials["SessionToken"],
+                        "expiry_time": credentials["Expiration"].isoformat(),
+                    }
+
+                credentials = RefreshableCredentials.create_from_metadata(
+                    metadata=assume_role(),
+                    refresh_using=assume_role,
+                    method="sts-assume-role",
+                )
+                self.sources[id(session)] = session
+                self.sessions[key] = create_session(credentials, region_name)
+            return self.sessions[key]
+
+
+SESSIONS_BROKER = SessionsBroker()
@@ -4,10 +4,17 @@
 """
 Functions to manage a template and wheter it should be stored in S3
 """
+
+from __future__ import annotations
+
 import pprint
-from os.path import abspath
+from hashlib import sha256
+from os.path import abspath, getsize
+from shutil import copyfile
+from threading import Lock
 
 import yaml
+from boto3.s3.transfer import TransferConfig
 from retry import retry
 
 try:
@@ -22,10 +29,129 @@ from botocore.exceptions import ClientError
 from troposphere import Template
 
 from ecs_composex.common import FILE_PREFIX
+from ecs_composex.common.incremental import get_content_digest, get_file_content_digest
 from ecs_composex.common.logging import LOG
+from ecs_composex.common.serializers import (
+    DEFAULT_SERIALIZER,
+    JSON_MIME,
+    YAML_MIME,
+    write_template,
+)
+from ecs_composex.common.templates_validation import (
+    LOCAL_VALIDATION,
+    NO_VALIDATION,
+    TEMPLATE_URL_MAX_SIZE,
+    validate_template_locally,
+)
+from ecs_composex.exceptions import TemplateValidationError
+
+CONTENT_ADDRESSED_PREFIX = "sha256"
+S3_URL_PREFIX = "https://s3.amazonaws.com/"
+DIGEST_METADATA_KEY = "sha256"
+CLIENTS_LOCK = Lock()
+UPLOADED_FILES: dict = {}
+
+READ_CHUNK_SIZE = 1024 * 1024
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD, multipart_chunksize=MULTIPART_THRESHOLD
+)
+
+
+def get_session_client(session, service_name: str):
+    """
+    boto3 sessions are not thread-safe when creating clients. Serializes clients creation so that templates
+    can be uploaded and validated from concurrent workers.
+
+    :param boto3.session.Session session:
+    :param str service_name:
+    """
+    with CLIENTS_LOCK:
+        return session.client(service_name)
+
+
+def get_body_digest(body) -> str:
+    """
+    Returns the SHA-256 hex digest of the file content
+
+    :param str|bytes body:
+    :rtype: str
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return sha256(body).hexdigest()
+
+
+def get_file_digest(file_path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of the file content, reading it by chunks
+
+    :param str file_path:
+    :rtype: str
+    """
+    digest = sha256()
+    with open(file_path, "rb") as file_fd:
+        for chunk in iter(lambda: file_fd.read(READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def object_is_up_to_date(
+    client, bucket_name: str, key: str, digest: str, check_object: bool = True
+) -> bool:
+    """
+    Checks whether the S3 object already has the same content, either because it was uploaded during this execution
+    or because its metadata digest matches.
 
-JSON_MIME = "application/json"
-YAML_MIME = "application/x-yaml"
+    :param client: S3 client
+    :param str bucket_name:
+    :param str key:
+    :param str digest: SHA-256 digest of the content to upload
+    :param bool check_object: Whether the object can exist from a previous execution and should be checked in S3
+    :rtype: bool
+    """
+    if UPLOADED_FILES.get(f"{bucket_name}/{key}") == digest:
+        return True
+    if not check_object:
+        return False
+    try:
+        object_r = client.head_object(Bucket=bucket_name, Key=key)
+    except ClientError as error:
+        if error.response["Error"]["Code"] in [
+            "403",
+            "404",
+            "Forbidden",
+            "NoSuchKey",
+            "NotFound",
+        ]:
+            return False
+        raise
+    if object_r.get("Metadata", {}).get(DIGEST_METADATA_KEY) == digest:
+        UPLOADED_FILES[f"{bucket_name}/{key}"] = digest
+        return True
+    return False
+
+
+def get_object_key(
+    digest: str, file_name: str, settings, prefix=None, content_addressed=None
+) -> str:
+    """
+    Defines the S3 key of the file, with the content digest as prefix for content addressed uploads.
+
+    :param str digest: SHA-256 digest of the content to upload
+    :param str file_name:
+    :param settings:
+    :param str prefix: override default prefix for the file in S3
+    :param bool content_addressed: Use the content digest as the prefix. Defaults to the execution settings.
+    :rtype: str
+    """
+    if content_addressed is None:
+        content_addressed = settings.content_addressed_uploads
+    if content_addressed:
+        prefix = f"{CONTENT_ADDRESSED_PREFIX}/{digest}"
+    elif prefix is None:
+        prefix = FILE_PREFIX
+    return f"{prefix}/{file_name}"
 
 
 def upload_file(
@@ -35,8 +161,11 @@ def upload_file(
     settings,
     prefix=None,
     mime=None,
+    content_addressed=None,
+    digest=None,
 ):
     """Upload template_body to a file in s3 with given prefix and bucket_name
+    Skips the upload if the object already exists with the same content.
 
     :param body: Template body, would come from troposphere template to_json() or to_yaml()
     :type body: str
@@ -46,16 +175,26 @@ def upload_file(
     :type file_name: str
     :param prefix: override default prefix for the file in S3
     :type prefix: str, optional
+    :param content_addressed: Use the content digest as the prefix. Defaults to the execution settings.
+    :type content_addressed: bool, optional
+    :param digest: SHA-256 digest of the body, if already known
+    :type digest: str, optional
     :returns: url_path, the https://s3.amazonaws.com/ URL to the file
     :rtype: str
     """
     if mime is None:
         mime = JSON_MIME
-    if prefix is None:
-        prefix = FILE_PREFIX
-
-    key = f"{prefix}/{file_name}"
-    client = settings.session.client("s3")
+    if content_addressed is None:
+        content_addressed = settings.content_addressed_uploads
+    if digest is None:
+        digest = get_body_digest(body)
+    key = get_object_key(digest, file_name, settings, prefix, content_addressed)
+    client = get_session_client(settings.session, "s3")
+    if object_is_up_to_date(
+        client, bucket_name, key, digest, check_object=content_addressed
+    ):
+        LOG.debug(f"{bucket_name}/{key} content is unchanged. Skipping upload")
+        return f"https://s3.amazonaws.com/{bucket_name}/{key}"
     client.put_object(
         Body=body,
         Key=key,
@@ -63,7 +202,61 @@ def upload_file(
         ContentEncoding="utf-8",
         ContentType=mime,
         ServerSideEncryption="AES256",
+        Metadata={DIGEST_METADATA_KEY: digest},
     )
+    UPLOADED_FILES[f"{bucket_name}/{key}"] = digest
+    return f"https://s3.amazonaws.com/{bucket_name}/{key}"
+
+
+def upload_file_from_path(
+    file_path,
+    bucket_name,
+    file_name,
+    settings,
+    prefix=None,
+    mime=None,
+    content_addressed=None,
+    digest=None,
+):
+    """
+    Same as :func:`upload_file`, streaming the content from the local file. Files over MULTIPART_THRESHOLD
+    are uploaded in parts.
+
+    :param str file_path: path to the local file to upload
+    :param str bucket_name: name of the bucket to upload the file to
+    :param str file_name: Name of the file
+    :param prefix: override default prefix for the file in S3
+    :param content_addressed: Use the content digest as the prefix. Defaults to the execution settings.
+    :param str digest: SHA-256 digest of the file, if already known
+    :returns: url_path, the https://s3.amazonaws.com/ URL to the file
+    :rtype: str
+    """
+    if mime is None:
+        mime = JSON_MIME
+    if content_addressed is None:
+        content_addressed = settings.content_addressed_uploads
+    if digest is None:
+        digest = get_file_digest(file_path)
+    key = get_object_key(digest, file_name, settings, prefix, content_addressed)
+    client = get_session_client(settings.session, "s3")
+    if object_is_up_to_date(
+        client, bucket_name, key, digest, check_object=content_addressed
+    ):
+        LOG.debug(f"{bucket_name}/{key} content is unchanged. Skipping upload")
+        return f"https://s3.amazonaws.com/{bucket_name}/{key}"
+    client.upload_file(
+        Filename=file_path,
+        Bucket=bucket_name,
+        Key=key,
+        ExtraArgs={
+            "ContentEncoding": "utf-8",
+            "ContentType": mime,
+            "ServerSideEncryption": "AES256",
+            "Metadata": {DIGEST_METADATA_KEY: digest},
+        },
+        Config=TRANSFER_CONFIG,
+    )
+    UPLOADED_FILES[f"{bucket_name}/{key}"] = digest
     return f"https://s3.amazonaws.com/{bucket_name}/{key}"
 
 
@@ -71,7 +264,7 @@ class RetryThis(Exception):
     pass
 
 
-@retry(RetryThis, tries=2, delay=5)
+@retry(RetryThis, tries=4, delay=2, backoff=2, jitter=(0, 1))
 def validate_wrapper(session, body: str = None, url: str = None):
     """
 
@@ -80,7 +273,7 @@ def validate_wrapper(session, body: str = None, url: str = None):
     :param url:
     :return:
     """
-    client = session.client("cloudformation")
+    client = get_session_client(session, "cloudformation")
     try:
         if url:
             client.validate_template(TemplateURL=url)
@@ -99,10 +292,12 @@ class FileArtifact:
     It also handles CloudFormation templates validation.
 
     :cvar str url: The URL in S3 where the file will be uploaded to or available from.
-    :cvar str body: The content of the FileArtifact
+    :cvar str body: The content of the FileArtifact. Templates are streamed to the file instead, and their body is
+        only read back from it when needed.
     :cvar troposphere.Template template: the CFN template
     :cvar str file_name: the base name of the file
     :cvar str mime: MIME-type of the file
+    :cvar str serializer: Name of the serializer used to write templates
     :cvar boto3.session.Session session: session for clients to make API calls to AWS
     :cvar bool can_upload: Indicate whether or not config allows for upload to S3.
     :cvar bool no_upload: Turns off upload if True
@@ -127,7 +322,10 @@ class FileArtifact:
         self.content = None
         self.file_name = file_name
         self.body = None
+        self.size = None
         self.url = None
+        self._content_digest = None
+        self.serializer = getattr(settings, "templates_serializer", DEFAULT_SERIALIZER)
         if file_format is None:
             file_format = settings.format
         if template is not None and not isinstance(template, Template):
@@ -160,22 +358,106 @@ class FileArtifact:
     def __repr__(self):
         return self.file_path
 
+    @property
+    def is_streamed(self) -> bool:
+        return isinstance(self.template, Template)
+
+    @property
+    def content_digest(self) -> str | None:
+        if self._content_digest is None:
+            if self.body is not None:
+                self._content_digest = get_content_digest(self.body)
+            elif self.is_streamed and self.size is not None:
+                self._content_digest = get_file_content_digest(self.file_path)
+        return self._content_digest
+
+    @property
+    def body_size(self) -> int:
+        if self.body is not None:
+            return len(self.body)
+        return self.size or 0
+
+    def read_body(self) -> str:
+        """
+        :return: The body of the file, read back from the file for streamed templates
+        :rtype: str
+        """
+        if self.body is None and self.is_streamed and self.size is not None:
+            with open(self.file_path) as template_fd:
+                return template_fd.read()
+        return self.body
+
+    def previous_state(self, settings) -> dict:
+        """
+        With incremental rendering, returns the state recorded for the file by the previous execution,
+        if its content did not change.
+        """
+        render_state = getattr(settings, "render_state", None)
+        if not render_state or self.content_digest is None:
+            return {}
+        return render_state.get(self.file_name, self.content_digest)
+
+    def record_state(self, settings, **properties) -> None:
+        render_state = getattr(settings, "render_state", None)
+        if render_state and self.content_digest is not None:
+            render_state.record(self.file_name, self.content_digest, **properties)
+
+    def previous_upload_exists(self, settings, previous_state: dict) -> bool:
+        """
+        Checks that the object uploaded by the previous execution is still in S3 with the same content.
+
+        :param settings:
+        :param dict previous_state: the state recorded for the file by the previous execution
+        :rtype: bool
+        """
+        previous_url = previous_state.get("Url")
+        previous_digest = previous_state.get("ObjectDigest")
+        if (
+            not previous_url
+            or not previous_digest
+            or not previous_url.startswith(S3_URL_PREFIX)
+        ):
+            return False
+        bucket_name, _, key = previous_url[len(S3_URL_PREFIX) :].partition("/")
+        client = get_session_client(settings.session, "s3")
+        return object_is_up_to_date(client, bucket_name, key, previous_digest)
+
     def upload(self, settings):
         """
         Method to handle uploading the files to S3.
         """
-        self.url = upload_file(
-            body=self.body,
-            settings=settings,
-            bucket_name=settings.bucket_name,
-            file_name=self.file_name,
-            mime=self.mime,
-        )
-        LOG.info(f"{self.file_name} uploaded successfully to {self.url}")
+        previous_state = self.previous_state(settings)
+        if self.previous_upload_exists(settings, previous_state):
+            self.url = previous_state["Url"]
+            digest = previous_state["ObjectDigest"]
+            LOG.info(f"{self.file_name} is unchanged. Using {self.url}")
+        elif self.is_streamed:
+            digest = get_file_digest(self.file_path)
+            self.url = upload_file_from_path(
+                file_path=self.file_path,
+                settings=settings,
+                bucket_name=settings.bucket_name,
+                file_name=self.file_name,
+                mime=self.mime,
+                digest=digest,
+            )
+        else:
+            digest = get_body_digest(self.body)
+            self.url = upload_file(
+                body=self.body,
+                settings=settings,
+                bucket_name=settings.bucket_name,
+                file_name=self.file_name,
+                mime=self.mime,
+                digest=digest,
+            )
+            LOG.info(f"{self.file_name} uploaded successfully to {self.url}")
+        self.record_state(settings, Url=self.url, ObjectDigest=digest)
 
     def write(self, settings):
         """
         Method to write the files to local filesystem based on parameters (directory name etc.)
+        Templates are serialized straight into the file.
         """
         try:
             makedirs(settings.output_dir, exist_ok=True)
@@ -183,55 +465,103 @@ class FileArtifact:
         except FileExistsError:
             LOG.debug(f"Output directory {settings.output_dir} already exists")
         with open(self.file_path, "w") as template_fd:
-            template_fd.write(self.body)
-            if settings.no_upload:
-                LOG.info(
-                    f"Template {self.file_name} written successfully at {abspath(self.file_path)}"
-                )
+            if self.is_streamed:
+                self.stream_template(template_fd)
+            else:
+                template_fd.write(self.body)
+        if self.is_streamed:
+            self.size = getsize(self.file_path)
+            self._content_digest = None
+        self.record_state(settings)
+        if settings.no_upload:
+            LOG.info(
+                f"Template {self.file_name} written successfully at {abspath(self.file_path)}"
+            )
 
-    def validate(self, settings):
+    def stream_template(self, file_obj) -> None:
+        try:
+            write_template(self.template, file_obj, self.mime, self.serializer)
+        except Exception as error:
+            pp = pprint.PrettyPrinter(indent=2)
+            pp.pprint(self.template.to_dict())
+            raise error
+
+    def validate(self, settings, nested_stacks: dict = None):
         """
-        Method to validate the CloudFormation template, either via URL once uploaded to S3 or via TemplateBody
+        Method to validate the CloudFormation template, either locally, or via URL once uploaded to S3 or via
+        TemplateBody. Templates too big to be validated by CFN from the body are validated locally.
+
+        :param ecs_composex.common.settings.ComposeXSettings settings:
+        :param dict nested_stacks: Interface of the nested stacks of the template, used for local validation
         """
+        if settings.templates_validation == NO_VALIDATION:
+            LOG.debug(f"Template {self.file_name} - Validation disabled")
+            return
+        if (
+            self.previous_state(settings).get("Validation")
+            == settings.templates_validation
+        ):
+            LOG.debug(f"Template {self.file_name} is unchanged and was validated")
+            self.record_state(settings, Validation=settings.templates_validation)
+            return
         try:
-            if not settings.no_upload and self.url:
+            if settings.templates_validation == LOCAL_VALIDATION:
+                self.validate_locally(nested_stacks)
+            elif not settings.no_upload and self.url:
                 validate_wrapper(settings.session, url=self.url)
             elif settings.no_upload or not self.url:
                 if not self.file_path:
                     self.write(settings)
                 LOG.debug(f"No upload - Validating template body - {self.file_path}")
-                if len(self.body) >= 51200:
+                if self.body_size >= 51200:
                     LOG.warning(
-                        f"Template body for {self.file_name} is too big for local validation."
-                        " No upload is True, so skipping."
+                        f"Template body for {self.file_name} is too big for validation by CFN."
+                        " No upload is True, so validating locally."
                     )
+                    self.validate_locally(nested_stacks)
                 else:
-                    validate_wrapper(settings.session, body=self.body)
-            LOG.debug(f"Template {self.file_name} was validated successfully by CFN")
-        except ClientError as error:
+                    validate_wrapper(settings.session, body=self.read_body())
+            LOG.debug(f"Template {self.file_name} was validated successfully")
+            self.record_state(settings, Validation=settings.templates_validation)
+        except (ClientError, TemplateValidationError) as error:
             LOG.error(error)
-            with open(f"/tmp/{settings.name}.{settings.format}", "w") as failed_file_fd:
-                failed_file_fd.write(self.body)
-                LOG.error(
-                    f"Failed validation template written at /tmp/{settings.name}.{settings.format}"
-                )
-                raise
+            failed_file_path = f"/tmp/{settings.name}.{settings.format}"
+            if self.body is None and self.is_streamed:
+                copyfile(self.file_path, failed_file_path)
+            else:
+                with open(failed_file_path, "w") as failed_file_fd:
+                    failed_file_fd.write(self.body)
+            LOG.error(f"Failed validation template written at {failed_file_path}")
+            raise
+
+    def validate_locally(self, nested_stacks: dict = None):
+        """
+        Validates the template without calling CloudFormation
+
+        :param dict nested_stacks: Interface of the nested stacks of the template
+        :raises TemplateValidationError:
+        """
+        if not isinstance(self.template, Template):
+            return
+        if self.body_size > TEMPLATE_URL_MAX_SIZE:
+            raise TemplateValidationError(
+                f"{self.file_name} - Template size exceeds {TEMPLATE_URL_MAX_SIZE} bytes"
+            )
+        try:
+            validate_template_locally(
+                self.file_name, self.template.to_dict(), nested_stacks
+            )
+        except TemplateValidationError as error:
+            for template_error in error.args[-1]:
+                LOG.error(template_error)
+            raise
 
     def define_body(self):
         """
         Method to define the body of the file artifact. Sets the mime type that will be used for upload into S3.
+        Templates bodies are not built in memory, they are serialized straight into the file by write()
         """
-        if isinstance(self.template, Template):
-            try:
-                if self.mime == YAML_MIME:
-                    self.body = self.template.to_yaml(clean_up=True, long_form=True)
-                else:
-                    self.body = self.template.to_json()
-            except Exception as error:
-                pp = pprint.PrettyPrinter(indent=2)
-                pp.pprint(self.template.to_dict())
-                raise error
-        elif isinstance(self.content, (list, dict, tuple)):
+        if isinstance(self.content, (list, dict, tuple)):
             try:
                 if self.mime == YAML_MIME:
                     self.body = yaml.dump(self.content, Dumper=Dumper)
@@ -0,0 +1,156 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Incremental rendering. Keeps in a local state file the digest of every file rendered, along with its S3 URL and
+the validation mode it passed, so that the next executions do not upload nor validate again the files which
+content did not change. It only skips the upload and validation: all the templates are still generated, as the
+families and x-resources update each other's templates.
+
+Any change to a family or x-resource changes the body of its stack template, and the TemplateURL of a changed nested
+stack changes the body of its parent template, so only the changed stacks and their ancestors are uploaded and
+validated again.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ecs_composex.common.settings import ComposeXSettings
+
+import json
+from hashlib import sha256
+from os import makedirs, path, replace
+from tempfile import NamedTemporaryFile
+from threading import Lock
+
+from ecs_composex.common import DATE
+from ecs_composex.common.logging import LOG
+
+STATE_VERSION = 1
+
+
+def get_content_digest(body: str) -> str:
+    """
+    Digest of the file content, leaving out the generation date set in the templates metadata, which changes
+    on every execution.
+
+    :param str body:
+    :rtype: str
+    """
+    return sha256(body.replace(DATE, "").encode("utf-8")).hexdigest()
+
+
+def get_file_content_digest(file_path: str) -> str:
+    """
+    Same digest as :func:`get_content_digest`, reading the file line by line instead of loading its whole content.
+
+    :param str file_path:
+    :rtype: str
+    """
+    digest = sha256()
+    with open(file_path, encoding="utf-8") as file_fd:
+        for line in file_fd:
+            digest.update(line.replace(DATE, "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_settings_fingerprint(settings: ComposeXSettings) -> str:
+    """
+    Digest of the execution settings that the rendered files URLs and validation depend on.
+    A state recorded with different settings is not re-used.
+
+    :param ecs_composex.common.settings.ComposeXSettings settings:
+    :rtype: str
+    """
+    values = [
+        settings.name,
+        settings.format,
+        getattr(settings, "bucket_name", None),
+        settings.session.region_name,
+        getattr(settings, "content_addressed_uploads", False),
+    ]
+    return sha256(json.dumps(values, default=str).encode("utf-8")).hexdigest()
+
+
+class RenderState:
+    """
+    State of the files rendered by the previous execution.
+
+    :ivar str file_path: path to the state file
+    :ivar str fingerprint: fingerprint of the execution settings
+    :ivar dict previous: the files states recorded by the previous execution, by file name
+    :ivar dict files: the files states of this execution, by file name
+    """
+
+    def __init__(self, file_path: str, fingerprint: str):
+        self.file_path = path.abspath(path.expanduser(file_path))
+        self.fingerprint = fingerprint
+        self.previous: dict = {}
+        self.files: dict = {}
+        self._lock = Lock()
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.file_path) as state_fd:
+                state = json.load(state_fd)
+        except FileNotFoundError:
+            LOG.info(f"Incremental - No state found at {self.file_path}")
+            return
+        except (OSError, ValueError) as error:
+            LOG.warning(f"Incremental - Ignoring state {self.file_path}: {error}")
+            return
+        if (
+            state.get("Version") != STATE_VERSION
+            or state.get("Fingerprint") != self.fingerprint
+        ):
+            LOG.info("Incremental - Execution settings changed. Rendering all files")
+            return
+        self.previous = state.get("Files", {})
+
+    def get(self, file_name: str, digest: str) -> dict:
+        """
+        Returns the previous state of the file if its content is the same, an empty dict otherwise.
+        """
+        previous = self.previous.get(file_name, {})
+        if previous.get("Digest") != digest:
+            return {}
+        return previous
+
+    def record(self, file_name: str, digest: str, **properties) -> None:
+        with self._lock:
+            if self.files.get(file_name, {}).get("Digest") != digest:
+                self.files[file_name] = {"Digest": digest}
+            self.files[file_name].update(properties)
+
+    def save(self) -> None:
+        """
+        Writes the state of the files rendered during this execution, replacing the previous one.
+        """
+        makedirs(path.dirname(self.file_path), exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=path.dirname(self.file_path), delete=False, suffix=".tmp"
+        ) as state_fd:
+            json.dump(
+                {
+                    "Version": STATE_VERSION,
+                    "Fingerprint": self.fingerprint,
+                    "Files": self.files,
+                },
+                state_fd,
+                indent=2,
+                sort_keys=True,
+            )
+        replace(state_fd.name, self.file_path)
+        unchanged = len(
+            [
+                _name
+                for _name, _file in self.files.items()
+                if self.get(_name, _file["Digest"])
+            ]
+        )
+        LOG.info(
+            f"Incremental - {unchanged}/{len(self.files)} files unchanged. State saved to {self.file_path}"
+        )
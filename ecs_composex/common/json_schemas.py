@@ -0,0 +1,155 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Process wide cache of the JSON schemas validators, for the compose file and the x-resources modules.
+
+Each schema is checked and compiled once, with a resolver whose store is pre-populated with all the
+``specs/*.json`` schemas, so that the ``$ref`` to the common definitions are never read from disk again.
+"""
+
+from __future__ import annotations
+
+from json import loads
+from os import path
+from threading import RLock
+
+import jsonschema
+from importlib_resources import files as pkg_files
+
+COMPOSE_SPEC_FILE = "compose-spec.json"
+
+
+class SchemasValidators:
+    """
+    Compiled JSON schema validators, by schema file path.
+
+    :ivar dict schemas: the parsed schemas, by file path. None if the file does not exist.
+    :ivar dict validators: the compiled validators, by schema file path.
+    """
+
+    def __init__(self):
+        self.schemas: dict = {}
+        self.validators: dict = {}
+        self._store: dict | None = None
+        self._lock = RLock()
+
+    @property
+    def specs_dir(self) -> str:
+        return path.abspath(str(pkg_files("ecs_composex").joinpath("specs")))
+
+    @property
+    def base_uri(self) -> str:
+        return f"file://{self.specs_dir}/"
+
+    @property
+    def store(self) -> dict:
+        """
+        :return: The schemas of the specs directory, by URI, to pre-populate the resolvers with.
+        :rtype: dict
+        """
+        with self._lock:
+            if self._store is None:
+                store = {}
+                for file_path in pkg_files("ecs_composex").joinpath("specs").iterdir():
+                    if file_path.name.endswith(".json"):
+                        store[f"{self.base_uri}{file_path.name}"] = loads(
+                            file_path.read_text(encoding="utf-8-sig")
+                        )
+                self._store = store
+            return self._store
+
+    def clear(self) -> None:
+        with self._lock:
+            self.schemas.clear()
+            self.validators.clear()
+            self._store = None
+
+    def get_schema(self, schema_path: str) -> dict | None:
+        """
+        :param str schema_path: path to the JSON schema file
+        :return: the parsed schema, None if the file does not exist.
+        """
+        schema_path = str(schema_path)
+        with self._lock:
+            if schema_path not in self.schemas:
+                try:
+                    with open(schema_path, encoding="utf-8-sig") as schema_fd:
+                        self.schemas[schema_path] = loads(schema_fd.read())
+                except OSError:
+                    self.schemas[schema_path] = None
+            return self.schemas[schema_path]
+
+    def new_validator(self, schema: dict):
+        """
+        Checks the schema and creates a validator for it, resolving the ``$ref`` from the specs store.
+
+        :param dict schema:
+        :rtype: jsonschema.protocols.Validator
+        """
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        resolver = jsonschema.RefResolver(
+            base_uri=self.base_uri, referrer=schema, store=self.store
+        )
+        return validator_class(schema, resolver=resolver)
+
+    def get_validator(self, schema_path: str):
+        """
+        :param str schema_path: path to the JSON schema file
+        :return: the compiled validator for the schema, None if the file does not exist.
+        :rtype: jsonschema.protocols.Validator
+        """
+        schema_path = str(schema_path)
+        with self._lock:
+            if schema_path not in self.validators:
+                schema = self.get_schema(schema_path)
+                self.validators[schema_path] = (
+                    self.new_validator(schema) if schema is not None else None
+                )
+            return self.validators[schema_path]
+
+    def validate(self, schema_path: str, instance) -> None:
+        """
+        Validates the instance against the schema, compiled once.
+
+        :param str schema_path: path to the JSON schema file
+        :param instance: the definition to validate
+        :raises: jsonschema.exceptions.ValidationError
+        """
+        validator = self.get_validator(schema_path)
+        if validator is None:
+            return
+        with self._lock:
+            error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def validate_many(self, schema_path: str, instances: dict) -> dict:
+        """
+        Validates all the instances against the schema, compiled once.
+
+        :param str schema_path: path to the JSON schema file
+        :param dict instances: the definitions to validate, by name
+        :return: the validation error, by name of the non-conform instances
+        :rtype: dict[str, jsonschema.exceptions.ValidationError]
+        """
+        errors = {}
+        validator = self.get_validator(schema_path)
+        if validator is None:
+            return errors
+        with self._lock:
+            for name, instance in instances.items():
+                error = jsonschema.exceptions.best_match(
+                    validator.iter_errors(instance)
+                )
+                if error is not None:
+                    errors[name] = error
+        return errors
+
+
+SCHEMAS_VALIDATORS = SchemasValidators()
+
+
+def compose_spec_path() -> str:
+    return path.join(SCHEMAS_VALIDATORS.specs_dir, COMPOSE_SPEC_FILE)
@@ -0,0 +1,208 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Execution profiling. When enabled, records the wall time of the execution phases, of every module, family and stack,
+and the count and latency of the AWS API calls, and reports them at the end of the execution.
+Optionally, the execution is also profiled with cProfile, and the statistics dumped for pstats / snakeviz.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+
+import cProfile
+import json
+import threading
+from contextlib import contextmanager
+from os import makedirs, path
+from time import perf_counter
+
+from ecs_composex.common.aws_cache import AWS_CACHE
+from ecs_composex.common.logging import LOG
+
+PHASES = "Phases"
+MODULES = "Modules"
+FAMILIES = "Families"
+STACKS = "Stacks"
+RENDER_STEPS = "RenderSteps"
+CATEGORIES = [PHASES, MODULES, FAMILIES, STACKS, RENDER_STEPS]
+REPORT_TOP = 10
+
+
+class ExecutionProfiler:
+    """
+    Records the durations by category and name. Recording the same name more than once adds up the durations.
+    Phases nested in other phases are named after their parents, i.e. generate_full_template.iam
+
+    :ivar bool enabled:
+    :ivar str output_file: path to write the JSON report to
+    :ivar str cprofile_file: path to dump the cProfile statistics to
+    :ivar dict timings: the durations and count, by category and name
+    :ivar dict api_calls: the count and latency of the AWS API calls, by service.operation
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_file = None
+        self.cprofile_file = None
+        self.timings: dict = {}
+        self.api_calls: dict = {}
+        self.start_time = perf_counter()
+        self._cprofile = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(
+        self, enabled: bool = False, output_file: str = None, cprofile_file: str = None
+    ) -> None:
+        if self._cprofile:
+            self._cprofile.disable()
+        self.enabled = enabled or bool(output_file) or bool(cprofile_file)
+        self.output_file = output_file
+        self.cprofile_file = cprofile_file
+        self.timings = {category: {} for category in CATEGORIES}
+        self.api_calls = {}
+        self.start_time = perf_counter()
+        self._cprofile = None
+        if self.enabled and self.cprofile_file:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def record(self, category: str, name: str, duration: float) -> None:
+        with self._lock:
+            timings = self.timings.setdefault(category, {})
+            if name not in timings:
+                timings[name] = {"Count": 0, "Duration": 0.0}
+            timings[name]["Count"] += 1
+            timings[name]["Duration"] += duration
+
+    @contextmanager
+    def phase(self, name: str, category: str = PHASES):
+        """
+        Times the block and records it under the category and name. Does nothing when disabled.
+
+        :param str name:
+        :param str category:
+        """
+        if not self.enabled:
+            yield
+            return
+        parents = getattr(self._local, "phases", None)
+        if parents is None:
+            parents = self._local.phases = []
+        if category == PHASES:
+            name = ".".join(parents + [name])
+            parents.append(name.split(".")[-1])
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, perf_counter() - start)
+            if category == PHASES:
+                parents.pop()
+
+    def watch_session(self, session: Session) -> None:
+        """
+        Records the count and latency of the API calls made by the clients of the session.
+        """
+        if not self.enabled:
+            return
+        session.events.register_first(
+            "before-call.*.*",
+            self._before_api_call,
+            unique_id="ecs_composex-profiler-before-call",
+        )
+        session.events.register(
+            "after-call.*.*",
+            self._after_api_call,
+            unique_id="ecs_composex-profiler-after-call",
+        )
+
+    @staticmethod
+    def _before_api_call(context: dict = None, **kwargs) -> None:
+        if context is not None:
+            context["ProfilerStart"] = perf_counter()
+
+    def _after_api_call(self, model=None, context: dict = None, **kwargs) -> None:
+        if not context or "ProfilerStart" not in context or model is None:
+            return
+        latency = perf_counter() - context["ProfilerStart"]
+        operation = f"{model.service_model.service_name}.{model.name}"
+        with self._lock:
+            if operation not in self.api_calls:
+                self.api_calls[operation] = {"Count": 0, "Latency": 0.0, "Max": 0.0}
+            stats = self.api_calls[operation]
+            stats["Count"] += 1
+            stats["Latency"] += latency
+            stats["Max"] = max(stats["Max"], latency)
+
+    def report(self) -> dict:
+        """
+        The report of the execution, as a dict.
+        """
+        return {
+            "Total": perf_counter() - self.start_time,
+            **{
+                category: {
+                    name: dict(timing)
+                    for name, timing in self.timings.get(category, {}).items()
+                }
+                for category in CATEGORIES
+            },
+            "AwsApiCalls": {
+                operation: dict(stats) for operation, stats in self.api_calls.items()
+            },
+            "AwsApiCache": {
+                operation: dict(stats) for operation, stats in AWS_CACHE.stats.items()
+            },
+        }
+
+    def log_report(self, report: dict) -> None:
+        LOG.info(f"Profile - Total {report['Total']:.3f}s")
+        for name, timing in report[PHASES].items():
+            LOG.info(f"Profile - {PHASES} - {name}: {timing['Duration']:.3f}s")
+        for category in [MODULES, FAMILIES, STACKS, RENDER_STEPS]:
+            slowest = sorted(
+                report[category].items(),
+                key=lambda item: item[1]["Duration"],
+                reverse=True,
+            )[:REPORT_TOP]
+            for name, timing in slowest:
+                LOG.info(
+                    f"Profile - {category} - {name}: {timing['Duration']:.3f}s ({timing['Count']} calls)"
+                )
+        for operation, stats in sorted(report["AwsApiCalls"].items()):
+            LOG.info(
+                f"Profile - AWS API - {operation}: {stats['Count']} calls, {stats['Latency']:.3f}s"
+                f" (max {stats['Max']:.3f}s)"
+            )
+
+    def finish(self) -> dict | None:
+        """
+        Stops profiling, logs the report and writes it, along with the cProfile statistics, if set to.
+
+        :return: the report, if enabled
+        """
+        if not self.enabled:
+            return None
+        if self._cprofile:
+            self._cprofile.disable()
+            makedirs(path.dirname(path.abspath(self.cprofile_file)), exist_ok=True)
+            self._cprofile.dump_stats(self.cprofile_file)
+            self._cprofile = None
+            LOG.info(f"Profile - cProfile statistics written to {self.cprofile_file}")
+        report = self.report()
+        self.log_report(report)
+        if self.output_file:
+            makedirs(path.dirname(path.abspath(self.output_file)), exist_ok=True)
+            with open(self.output_file, "w") as output_fd:
+                json.dump(report, output_fd, indent=2)
+            LOG.info(f"Profile - Report written to {self.output_file}")
+        return report
+
+
+PROFILER = ExecutionProfiler()
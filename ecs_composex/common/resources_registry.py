@@ -0,0 +1,114 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Registry of the services, families and x-resources of the execution, indexed as they are added, so that they are
+found by name without going over all the modules, services or families.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ecs_composex.compose.compose_services import ComposeService
+    from ecs_composex.compose.x_resources import XResource
+    from ecs_composex.ecs.ecs_family import ComposeFamily
+    from ecs_composex.mods_manager import XResourceModule
+
+
+class ResourcesRegistry:
+    """
+    Indexes of the execution resources.
+
+    :ivar dict modules_resources: the x-resources, by module key (i.e. x-sqs) then resource name, in the modules order
+    :ivar dict arns: the x-resources, by compose-x ARN, x-sqs::queue-name
+    :ivar dict logical_names: the x-resources, by logical name
+    :ivar dict services: the first service defined, by service name
+    :ivar dict families: the families, by family name and by logical name
+    """
+
+    def __init__(self):
+        self.modules_resources: dict[str, dict[str, XResource]] = {}
+        self.arns: dict[str, XResource] = {}
+        self.logical_names: dict[str, XResource] = {}
+        self.services: dict[str, ComposeService] = {}
+        self.families: dict[str, ComposeFamily] = {}
+        self._x_resources: list | None = None
+
+    def register_module(self, module: XResourceModule) -> None:
+        """
+        Adds the module, and its existing resources, to the registry. The module keeps track of the registry to index
+        the resources added to it later on.
+        """
+        self.modules_resources.setdefault(module.res_key, {})
+        module.registry = self
+        for resource_name, resource in module.resources.items():
+            self.add_x_resource(resource, resource_name)
+
+    def clear_modules(self) -> None:
+        self.modules_resources.clear()
+        self.arns.clear()
+        self.logical_names.clear()
+        self._x_resources = None
+
+    def add_x_resource(self, resource: XResource, resource_name: str = None) -> None:
+        if resource is None:
+            return
+        self.modules_resources.setdefault(resource.module.res_key, {})[
+            resource_name or resource.name
+        ] = resource
+        self.arns[f"{resource.module.res_key}::{resource.name}"] = resource
+        if getattr(resource, "logical_name", None):
+            self.logical_names[resource.logical_name] = resource
+        self._x_resources = None
+
+    def remove_module_resources(self, res_key: str) -> None:
+        """
+        Removes the resources of the module, when the module resources are defined again.
+        """
+        for resource in self.modules_resources.get(res_key, {}).values():
+            arn = f"{resource.module.res_key}::{resource.name}"
+            if self.arns.get(arn) is resource:
+                del self.arns[arn]
+            if self.logical_names.get(resource.logical_name) is resource:
+                del self.logical_names[resource.logical_name]
+        if res_key in self.modules_resources:
+            self.modules_resources[res_key] = {}
+        self._x_resources = None
+
+    @property
+    def x_resources(self) -> list[XResource]:
+        """
+        All the x-resources, in the modules order, then in the order they were added to their module.
+        """
+        if self._x_resources is None:
+            self._x_resources = [
+                resource
+                for resources in self.modules_resources.values()
+                for resource in resources.values()
+            ]
+        return list(self._x_resources)
+
+    def get_x_resource(self, res_key: str, resource_name: str) -> XResource | None:
+        return self.arns.get(f"{res_key}::{resource_name}")
+
+    def get_x_resource_from_logical_name(self, logical_name: str) -> XResource | None:
+        return self.logical_names.get(logical_name)
+
+    def add_service(self, service: ComposeService) -> None:
+        """
+        Indexes the service by name. Services duplicated for multiple families keep the same name, the first one
+        is indexed, as the lookup by name did so far.
+        """
+        self.services.setdefault(service.name, service)
+
+    def get_service(self, service_name: str) -> ComposeService | None:
+        return self.services.get(service_name)
+
+    def add_family(self, family: ComposeFamily) -> None:
+        self.families[family.logical_name] = family
+        self.families.setdefault(family.name, family)
+
+    def get_family(self, family_name: str) -> ComposeFamily | None:
+        return self.families.get(family_name)
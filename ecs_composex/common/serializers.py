@@ -0,0 +1,160 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Serializers of the CloudFormation templates into files, by name and MIME type.
+
+* default: the same output as troposphere ``to_json()`` and ``to_yaml(clean_up=True, long_form=True)``, byte for byte.
+* fast: orjson, if installed, for JSON, and the libyaml emitter with the cfn_flip representers for YAML.
+  The templates are semantically identical to the default ones, but JSON is indented with 2 spaces (compact without
+  orjson) and YAML lists are not indented under their key.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from troposphere import Template
+
+import json
+
+import yaml
+from cfn_clean import clean
+from cfn_flip.yaml_dumper import LongCleanDumper
+from cfn_tools._config import config as cfn_flip_config
+from yaml.representer import Representer
+from yaml.resolver import Resolver
+
+from ecs_composex.common.logging import LOG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml.cyaml import CEmitter
+except ImportError:
+    CEmitter = None
+
+JSON_MIME = "application/json"
+YAML_MIME = "application/x-yaml"
+
+DEFAULT_SERIALIZER = "default"
+FAST_SERIALIZER = "fast"
+
+
+def dump_json(data: dict, file_obj) -> None:
+    json.dump(data, file_obj, indent=1, sort_keys=True, separators=(",", ": "))
+
+
+def dump_yaml(data: dict, file_obj, dumper=LongCleanDumper) -> None:
+    yaml.dump(
+        clean(data),
+        file_obj,
+        Dumper=dumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        width=cfn_flip_config.max_col_width,
+    )
+
+
+def dump_json_fast(data: dict, file_obj) -> None:
+    """
+    Encodes the whole template at once, with orjson if installed, otherwise with the compact C encoder of the
+    standard library, both much faster than the indented pure python encoder, then writes it.
+    """
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        file_obj.write(body.decode("utf-8"))
+    else:
+        file_obj.write(json.dumps(data, sort_keys=True, separators=(",", ":")))
+
+
+if CEmitter is not None:
+
+    class LongCleanCDumper(CEmitter, LongCleanDumper):
+        """
+        cfn_flip LongCleanDumper representers with the libyaml emitter, as yaml.CDumper does for yaml.Dumper
+        """
+
+        def __init__(
+            self,
+            stream,
+            default_style=None,
+            default_flow_style=False,
+            canonical=None,
+            indent=None,
+            width=None,
+            allow_unicode=None,
+            line_break=None,
+            encoding=None,
+            explicit_start=None,
+            explicit_end=None,
+            version=None,
+            tags=None,
+            sort_keys=True,
+        ):
+            CEmitter.__init__(
+                self,
+                stream,
+                canonical=canonical,
+                indent=indent,
+                width=width,
+                encoding=encoding,
+                allow_unicode=allow_unicode,
+                line_break=line_break,
+                explicit_start=explicit_start,
+                explicit_end=explicit_end,
+                version=version,
+                tags=tags,
+            )
+            Representer.__init__(
+                self,
+                default_style=default_style,
+                default_flow_style=default_flow_style,
+                sort_keys=sort_keys,
+            )
+            Resolver.__init__(self)
+
+else:
+    LOG.debug("libyaml is not available. YAML templates use the python emitter")
+    LongCleanCDumper = LongCleanDumper
+
+
+def dump_yaml_fast(data: dict, file_obj) -> None:
+    dump_yaml(data, file_obj, dumper=LongCleanCDumper)
+
+
+TEMPLATES_SERIALIZERS = {
+    DEFAULT_SERIALIZER: {JSON_MIME: dump_json, YAML_MIME: dump_yaml},
+    FAST_SERIALIZER: {JSON_MIME: dump_json_fast, YAML_MIME: dump_yaml_fast},
+}
+
+
+def write_template(
+    template: Template,
+    file_obj,
+    mime: str = JSON_MIME,
+    serializer: str = DEFAULT_SERIALIZER,
+) -> None:
+    """
+    Serializes the template straight into the file object, without building the whole body in memory first
+    (except for the fast JSON serializer).
+    With the default serializer, the output is the same as ``template.to_json()`` and
+    ``template.to_yaml(clean_up=True, long_form=True)``
+
+    :param troposphere.Template template:
+    :param file_obj: text file object to write to
+    :param str mime: JSON_MIME or YAML_MIME
+    :param str serializer: Name of the serializer, in TEMPLATES_SERIALIZERS
+    """
+    if serializer not in TEMPLATES_SERIALIZERS:
+        raise KeyError(
+            f"Serializer {serializer} is not valid. Must be one of",
+            list(TEMPLATES_SERIALIZERS.keys()),
+        )
+    dumpers = TEMPLATES_SERIALIZERS[serializer]
+    dumper = dumpers[YAML_MIME] if mime == YAML_MIME else dumpers[JSON_MIME]
+    dumper(template.to_dict(), file_obj)
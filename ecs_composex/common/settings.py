@@ -10,16 +10,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ecs_composex.compose.compose_services import ComposeService
+    from ecs_composex.compose.x_resources import XResource
+    from ecs_composex.ecs.ecs_family import ComposeFamily
     from ecs_composex.ecs_cluster import EcsCluster
 
 from copy import deepcopy
 from datetime import datetime as dt
-from json import loads
 from os import path
 from re import compile, sub
 
 import boto3
-import jsonschema
 import yaml
 
 try:
@@ -30,26 +31,29 @@ except ImportError:
 
 from botocore.exceptions import ClientError
 from cfn_flip.yaml_dumper import LongCleanDumper
-from compose_x_common.aws import get_account_id, validate_iam_role_arn
+from compose_x_common.aws import validate_iam_role_arn
 from compose_x_common.compose_x_common import keyisset, set_else_none
 from compose_x_render.compose_x_render import ComposeDefinition
-from importlib_resources import files as pkg_files
 from troposphere import AWSObject
 
 from ecs_composex import __version__
 from ecs_composex.common import NONALPHANUM
-from ecs_composex.common.aws import get_cross_role_session
+from ecs_composex.common.aws import TAGS_INDEX, get_cross_role_session
+from ecs_composex.common.aws_cache import AWS_CACHE, get_account_id, get_cached_client
+from ecs_composex.common.aws_sessions import SESSIONS_BROKER
+from ecs_composex.common.files import UPLOADED_FILES
+from ecs_composex.common.json_schemas import SCHEMAS_VALIDATORS, compose_spec_path
 from ecs_composex.common.logging import LOG
-from ecs_composex.common.stacks import ComposeXStack
-from ecs_composex.compose.compose_networks import ComposeNetwork
-from ecs_composex.compose.compose_secrets import ComposeSecret
-from ecs_composex.compose.compose_services import ComposeService
-from ecs_composex.compose.compose_volumes import ComposeVolume
-from ecs_composex.compose.x_resources import XResource
-from ecs_composex.ecs.ecs_family import ComposeFamily
+from ecs_composex.common.profiling import PROFILER
+from ecs_composex.common.resources_registry import ResourcesRegistry
+from ecs_composex.common.serializers import DEFAULT_SERIALIZER, TEMPLATES_SERIALIZERS
+from ecs_composex.common.templates_validation import REMOTE_VALIDATION, VALIDATION_MODES
 from ecs_composex.iam import ROLE_ARN_ARG
-from ecs_composex.utils.init_ecs import set_ecs_settings
-from ecs_composex.utils.init_s3 import create_bucket
+
+RESOURCE_ARN_RE = compile(r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)$")
+RESOURCE_ATTRIBUTE_ARN_RE = compile(
+    r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)::(?P<return_value>[\S]+)$"
+)
 
 
 class ComposeXSettings:
@@ -85,6 +89,28 @@ class ComposeXSettings:
     default_format = "json"
     allowed_formats = ["json", "yaml", "text"]
     ecr_arg = "SkipScanEcrImages"
+    render_workers_arg = "RenderWorkers"
+    lookup_workers_arg = "LookupWorkers"
+    content_addressed_arg = "ContentAddressedUploads"
+    validation_arg = "TemplatesValidation"
+    serializer_arg = "TemplatesSerializer"
+    lookup_cache_dir_arg = "LookupCacheDir"
+    refresh_cache_arg = "RefreshLookupCache"
+    no_cache_arg = "NoLookupCache"
+    incremental_arg = "Incremental"
+    state_file_arg = "StateFile"
+    wait_arg = "Wait"
+    skip_change_set_arg = "SkipChangeSet"
+    default_state_dir = ".compose-x"
+    profile_arg = "Profile"
+    profile_output_arg = "ProfileOutput"
+    cprofile_output_arg = "CProfileOutput"
+    validation_modes = VALIDATION_MODES
+    default_validation = REMOTE_VALIDATION
+    templates_serializers = list(TEMPLATES_SERIALIZERS.keys())
+    default_serializer = DEFAULT_SERIALIZER
+    default_render_workers = 1
+    default_lookup_workers = 1
 
     vpc_cidr_arg = "VpcCidr"
     single_nat_arg = "SingleNat"
@@ -136,10 +162,30 @@ class ComposeXSettings:
         """
         Class to init the configuration
         """
+        from ecs_composex.compose.compose_services.env_files_helpers import (
+            ENV_FILES_UPLOADER,
+        )
+
         self.__args = deepcopy(kwargs)
+        PROFILER.reset(
+            keyisset(self.profile_arg, kwargs),
+            output_file=set_else_none(self.profile_output_arg, kwargs),
+            cprofile_file=set_else_none(self.cprofile_output_arg, kwargs),
+        )
+        UPLOADED_FILES.clear()
+        AWS_CACHE.clear()
+        SESSIONS_BROKER.clear()
+        TAGS_INDEX.clear()
+        ENV_FILES_UPLOADER.clear()
+        AWS_CACHE.set_persistent_cache(
+            set_else_none(self.lookup_cache_dir_arg, kwargs),
+            refresh=keyisset(self.refresh_cache_arg, kwargs),
+            disabled=keyisset(self.no_cache_arg, kwargs),
+        )
         self.for_cfn_macro = for_macro
         self.session = boto3.session.Session()
         self.override_session(session, profile_name, kwargs)
+        PROFILER.watch_session(self.session)
         self.aws_region = (
             kwargs[self.region_arg]
             if keyisset(self.region_arg, kwargs)
@@ -157,6 +203,7 @@ class ComposeXSettings:
         self.secrets_mappings = {}
         self.mappings = {}
         self.families: dict[str, ComposeFamily] = {}
+        self.resources_registry = ResourcesRegistry()
         self.account_id = None
         self.output_dir = self.default_output_dir
         self.format = self.default_format
@@ -176,13 +223,50 @@ class ComposeXSettings:
         self.input_file = (
             kwargs[self.input_file_arg] if keyisset(self.input_file_arg, kwargs) else {}
         )
-        self.set_content(kwargs, content)
+        with PROFILER.phase("set_content"):
+            self.set_content(kwargs, content)
         self.set_output_settings(kwargs)
         self.use_appmesh = keyisset("x-appmesh", self.compose_content)
         self.evaluate_private_namespace()
         self.name = kwargs[self.name_arg]
         self._ecs_cluster = None
         self.ignore_ecr_findings = keyisset(self.ecr_arg, kwargs)
+        self.render_workers = self.set_workers(
+            kwargs, self.render_workers_arg, self.default_render_workers
+        )
+        self.lookup_workers = self.set_workers(
+            kwargs, self.lookup_workers_arg, self.default_lookup_workers
+        )
+        self.content_addressed_uploads = keyisset(self.content_addressed_arg, kwargs)
+        self.templates_validation = set_else_none(
+            self.validation_arg, kwargs, alt_value=self.default_validation
+        )
+        if self.templates_validation not in self.validation_modes:
+            raise ValueError(
+                f"{self.validation_arg} must be one of",
+                self.validation_modes,
+                "Got",
+                self.templates_validation,
+            )
+        self.templates_serializer = set_else_none(
+            self.serializer_arg, kwargs, alt_value=self.default_serializer
+        )
+        if self.templates_serializer not in self.templates_serializers:
+            raise ValueError(
+                f"{self.serializer_arg} must be one of",
+                self.templates_serializers,
+                "Got",
+                self.templates_serializer,
+            )
+        self.incremental = keyisset(self.incremental_arg, kwargs)
+        self.wait = keyisset(self.wait_arg, kwargs)
+        self.skip_change_set = keyisset(self.skip_change_set_arg, kwargs)
+        self.state_file = set_else_none(
+            self.state_file_arg,
+            kwargs,
+            alt_value=path.join(self.default_state_dir, f"{self.name}.state.json"),
+        )
+        self.render_state = None
         self.x_resources_void = []
         self.mod_manager = None
         self.root_stack = None
@@ -229,21 +313,18 @@ class ComposeXSettings:
         return x_resources
 
     def find_resource(self, compose_resource_arn: str) -> XResource:
-        resource_attribute_match_re = compile(
-            r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)$"
-        )
-        parts = resource_attribute_match_re.match(compose_resource_arn)
+        parts = RESOURCE_ARN_RE.match(compose_resource_arn)
         if not parts:
             raise ValueError(
                 compose_resource_arn,
                 "does not match",
-                resource_attribute_match_re.pattern,
+                RESOURCE_ARN_RE.pattern,
             )
-        for resource in self.x_resources:
-            if resource.module.res_key == parts.group(
-                "res_key"
-            ) and resource.name == parts.group("res_name"):
-                return resource
+        resource = self.resources_registry.get_x_resource(
+            parts.group("res_key"), parts.group("res_name")
+        )
+        if resource:
+            return resource
         raise LookupError(
             "Unable to find any resource matching",
             compose_resource_arn,
@@ -252,15 +333,10 @@ class ComposeXSettings:
         )
 
     def get_resource_attribute(self, compose_resource_arn: str) -> tuple:
-        import re
-
-        resource_attribute_match_re = re.compile(
-            r"^(?P<res_key>x-[\S]+)::(?P<res_name>[\S]+)::(?P<return_value>[\S]+)$"
-        )
-        parts = resource_attribute_match_re.match(compose_resource_arn)
+        parts = RESOURCE_ATTRIBUTE_ARN_RE.match(compose_resource_arn)
         if not parts:
             LOG.error(
-                f"{compose_resource_arn} if invalid. Must match, {resource_attribute_match_re.pattern}"
+                f"{compose_resource_arn} if invalid. Must match, {RESOURCE_ATTRIBUTE_ARN_RE.pattern}"
             )
             return None, None
         try:
@@ -291,6 +367,8 @@ class ComposeXSettings:
 
     @property
     def stacks(self):
+        from ecs_composex.common.stacks import ComposeXStack
+
         _stacks = {}
         for resource_name, resource in self.root_stack.stack_template.resources.items():
             if isinstance(resource, ComposeXStack) or issubclass(
@@ -309,10 +387,7 @@ class ComposeXSettings:
         Returns: the list of XResource in the execution.
 
         """
-        _resources = []
-        for name, module in self.mod_manager.modules.items():
-            _resources += module.resources_list
-        return _resources
+        return self.resources_registry.x_resources
 
     def evaluate_private_namespace(self):
         """
@@ -345,6 +420,8 @@ class ComposeXSettings:
         """
         Function to parse the settings compose content and define the secrets.
         """
+        from ecs_composex.compose.compose_secrets import ComposeSecret
+
         if not keyisset(ComposeSecret.main_key, self.compose_content):
             return
         for secret_name in self.compose_content[ComposeSecret.main_key]:
@@ -361,6 +438,8 @@ class ComposeXSettings:
         """
         Method to add a x-efs definition to the compose-x definition when a volume is flagged as using NFS/EFS
         """
+        from ecs_composex.compose.compose_volumes import ComposeVolume
+
         if (
             not self.volumes
             or not keyisset(ComposeVolume.main_key, self.compose_content)
@@ -400,6 +479,8 @@ class ComposeXSettings:
         Method configuring the volumes at root level
         :return:
         """
+        from ecs_composex.compose.compose_volumes import ComposeVolume
+
         if not keyisset(ComposeVolume.main_key, self.compose_content):
             LOG.debug("No volumes detected at the root level of compose file")
             return
@@ -415,6 +496,8 @@ class ComposeXSettings:
         """
         Maps top level docker-compose networks with x-vpc subnets when applicable.
         """
+        from ecs_composex.compose.compose_networks import ComposeNetwork
+
         if not keyisset(ComposeNetwork.main_key, self.compose_content):
             LOG.debug("No networks detected at the root level of compose file")
             return
@@ -433,6 +516,14 @@ class ComposeXSettings:
         Method to define the ComposeXResource for each service.
         :return:
         """
+        from ecs_composex.compose.compose_services import ComposeService
+        from ecs_composex.compose.compose_services.service_image import (
+            interpolate_services_images_digests,
+        )
+        from ecs_composex.compose.compose_services.service_image.image_digests import (
+            IMAGES_DIGESTS,
+        )
+
         if not keyisset(ComposeService.main_key, self.compose_content):
             return
         for service_name in self.compose_content[ComposeService.main_key]:
@@ -444,11 +535,15 @@ class ComposeXSettings:
             )
             self.compose_content[ComposeService.main_key][service_name] = service
             self.services.append(service)
-            service.image.interpolate_image_digest(self)
+            self.resources_registry.add_service(service)
+        IMAGES_DIGESTS.clear()
+        interpolate_services_images_digests(self.services, self)
 
     def add_new_family(
         self, family_name: str, service: ComposeService, assigned_services: list
     ) -> None:
+        from ecs_composex.ecs.ecs_family import ComposeFamily
+
         if service in assigned_services:
             LOG.info(
                 f"New family {family_name} - "
@@ -459,12 +554,14 @@ class ComposeXSettings:
             self.families[family.logical_name] = family
             the_service.family = family
             self.services.append(the_service)
+            self.resources_registry.add_service(the_service)
         else:
             family = ComposeFamily([service], family_name)
             service.family = family
             if service not in assigned_services:
                 assigned_services.append(service)
         self.families[family.logical_name] = family
+        self.resources_registry.add_family(family)
 
     def add_service_to_family(
         self, family_name: str, service: ComposeService, assigned_services: list
@@ -477,6 +574,7 @@ class ComposeXSettings:
             )
             the_service = deepcopy(service)
             self.services.append(the_service)
+            self.resources_registry.add_service(the_service)
         else:
             the_service = service
         LOG.debug(f"THE_SERVICE, {hex(id(the_service))}, SERVICE, {hex(id(service))}")
@@ -529,16 +627,9 @@ class ComposeXSettings:
         content_def = ComposeDefinition(files, content)
         self.original_content = content_def.definition
         self.compose_content = deepcopy(content_def.definition)
-        source = pkg_files("ecs_composex").joinpath("specs/compose-spec.json")
+        source = compose_spec_path()
         LOG.info(f"Validating against input schema {source}")
-        resolver = jsonschema.RefResolver(
-            f"file://{path.abspath(path.dirname(source))}/", None
-        )
-        jsonschema.validate(
-            content_def.definition,
-            loads(source.read_text()),
-            resolver=resolver,
-        )
+        SCHEMAS_VALIDATORS.validate(source, content_def.definition)
         if fully_load:
             self.set_secrets()
             self.set_volumes()
@@ -578,6 +669,8 @@ class ComposeXSettings:
             print("ECS ComposeX", __version__)
             exit(0)
         elif command == "init":
+            from ecs_composex.utils.init_ecs import set_ecs_settings
+
             set_ecs_settings(self.session)
             self.init_s3()
             exit(0)
@@ -610,7 +703,7 @@ class ComposeXSettings:
                 )
 
     def import_regional_mapping(self) -> list[dict]:
-        return self.session.client("ec2").describe_availability_zones()[
+        return get_cached_client(self.session, "ec2").describe_availability_zones()[
             "AvailabilityZones"
         ]
 
@@ -631,6 +724,17 @@ class ComposeXSettings:
             else self.default_output_dir
         )
 
+    @staticmethod
+    def set_workers(kwargs, workers_arg: str, default_workers: int) -> int:
+        """
+        Defines how many workers to use for a concurrent processing phase, i.e. rendering the nested stacks
+        or looking up the x-resources.
+        """
+        workers = set_else_none(workers_arg, kwargs, alt_value=default_workers)
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f"{workers_arg} must be a positive integer. Got", workers)
+        return workers
+
     def set_bucket_name_from_account_id(self):
         """
         Defines the default bucket name to use from the AWS Account ID
@@ -639,7 +743,7 @@ class ComposeXSettings:
             return
         if self.account_id is None:
             try:
-                self.account_id = get_account_id(session=self.session)
+                self.account_id = get_account_id(self.session)
                 self.bucket_name = f"ecs-composex-{self.account_id}-{self.aws_region}"
             except ClientError as error:
                 code = error.response["Error"]["Code"]
@@ -661,6 +765,8 @@ class ComposeXSettings:
 
         :return:
         """
+        from ecs_composex.utils.init_s3 import create_bucket
+
         self.set_bucket_name_from_account_id()
         if self.bucket_name:
             create_bucket(self.bucket_name, self.session)
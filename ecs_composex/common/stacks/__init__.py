@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
     from ecs_composex.vpc.vpc_stack import XStack as VpcStack
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from os import path
 
 from compose_x_common.compose_x_common import keyisset
@@ -32,7 +33,10 @@ from troposphere.cloudformation import Stack
 from ecs_composex.common import NONALPHANUM, cfn_conditions
 from ecs_composex.common.cfn_params import ROOT_STACK_NAME_T
 from ecs_composex.common.files import FileArtifact
+from ecs_composex.common.incremental import RenderState, get_settings_fingerprint
 from ecs_composex.common.logging import LOG
+from ecs_composex.common.profiling import PROFILER, RENDER_STEPS, STACKS
+from ecs_composex.common.templates_validation import get_nested_stack_interface
 from ecs_composex.common.troposphere_tools import add_parameters, add_update_mapping
 from ecs_composex.vpc.vpc_params import (
     APP_SUBNETS,
@@ -241,22 +245,31 @@ class ComposeXStack(Stack):
         Function to use when the template is finalized and can be uploaded to S3.
         """
         LOG.debug(f"Rendering {self.title}")
-        self.DependsOn = list(set(self.DependsOn))
-        template_file = FileArtifact(
-            file_name=self.file_name,
-            template=self.stack_template,
-            settings=settings,
-            file_format=settings.format,
-        )
-        template_file.define_body()
-        template_file.write(settings)
-        setattr(self, "TemplateURL", template_file.file_path)
-        if settings.upload:
-            template_file.upload(settings)
-            setattr(self, "TemplateURL", template_file.url)
-            LOG.debug(f"Rendered URL = {template_file.url}")
-        template_file.validate(settings)
-        self.write_config_file(settings)
+        with PROFILER.phase(self.title, STACKS):
+            self.DependsOn = sorted(set(self.DependsOn))
+            template_file = FileArtifact(
+                file_name=self.file_name,
+                template=self.stack_template,
+                settings=settings,
+                file_format=settings.format,
+            )
+            with PROFILER.phase("write", RENDER_STEPS):
+                template_file.write(settings)
+            setattr(self, "TemplateURL", template_file.file_path)
+            if settings.upload:
+                with PROFILER.phase("upload", RENDER_STEPS):
+                    template_file.upload(settings)
+                setattr(self, "TemplateURL", template_file.url)
+                LOG.debug(f"Rendered URL = {template_file.url}")
+            with PROFILER.phase("validate", RENDER_STEPS):
+                template_file.validate(
+                    settings,
+                    nested_stacks={
+                        stack.title: get_nested_stack_interface(stack.stack_template)
+                        for stack in get_nested_stacks(self)
+                    },
+                )
+            self.write_config_file(settings)
 
     def set_vpc_parameters_from_vpc_stack(
         self, vpc_stack: VpcStack, settings: ComposeXSettings, *parameters
@@ -357,10 +370,141 @@ class ComposeXStack(Stack):
                 )
 
 
+def get_nested_stacks(stack: ComposeXStack) -> list[ComposeXStack]:
+    """
+    Lists the ComposeXStack resources directly defined in the given stack template.
+
+    :param ComposeXStack stack:
+    :rtype: list[ComposeXStack]
+    """
+    return [
+        resource
+        for resource in stack.stack_template.resources.values()
+        if isinstance(resource, ComposeXStack)
+        or issubclass(type(resource), ComposeXStack)
+    ]
+
+
+class StacksTreeVisitor:
+    """
+    Walks the nested stacks tree once, depth first, calling the registered hooks on each stack, and on each resource
+    of the stacks templates, so that the finalization passes do not each walk the whole tree.
+
+    Stack hooks are called as hook(stack, parent_stack, depth), before the stack resources.
+    Resource hooks are called as hook(resource, stack, depth), depth being that of the stack the resource is in.
+    The root stack has depth 0. When walking a template, the root stack is None.
+    """
+
+    def __init__(self):
+        self.stack_hooks: list = []
+        self.resource_hooks: list = []
+
+    def add_stack_hook(self, hook) -> None:
+        self.stack_hooks.append(hook)
+
+    def add_resource_hook(self, hook) -> None:
+        self.resource_hooks.append(hook)
+
+    def visit(self, root_stack: ComposeXStack) -> None:
+        self.walk(root_stack, root_stack.stack_template)
+
+    def visit_template(self, root_template: Template) -> None:
+        self.walk(None, root_template)
+
+    def walk(self, root_stack: ComposeXStack | None, root_template: Template) -> None:
+        nodes = [(root_stack, root_template, None, 0)]
+        while nodes:
+            stack, template, parent_stack, depth = nodes.pop()
+            for hook in self.stack_hooks:
+                hook(stack, parent_stack, depth)
+            if template is None:
+                continue
+            nested_stacks = []
+            for resource in template.resources.values():
+                for hook in self.resource_hooks:
+                    hook(resource, stack, depth)
+                if isinstance(resource, ComposeXStack):
+                    nested_stacks.append(
+                        (resource, resource.stack_template, stack, depth + 1)
+                    )
+            nodes += reversed(nested_stacks)
+
+
+def set_parent_stack(
+    stack: ComposeXStack, parent_stack: ComposeXStack | None, depth: int
+) -> None:
+    """
+    Stack hook equivalent of :meth:`ComposeXStack.mark_nested_stacks`
+    """
+    if parent_stack is not None and not parent_stack.is_void:
+        stack.parent_stack = parent_stack
+
+
+def set_root_stack_name_parameter(stack: ComposeXStack, is_root: bool) -> None:
+    """
+    Passes down the root stack name to the nested stack, via the root stack AWS::StackName if the parent is the root
+    stack, or from the parent stack own parameter otherwise.
+
+    :param ComposeXStack stack: the nested stack
+    :param bool is_root: Whether the parent stack of the nested stack is the root stack
+    """
+    if is_root:
+        stack.Parameters.update({ROOT_STACK_NAME_T: Ref(AWS_STACK_NAME)})
+    else:
+        stack.Parameters.update(cfn_conditions.pass_root_stack_name())
+
+
+def process_stacks_concurrently(root_stack, settings, workers: int) -> None:
+    """
+    Renders the nested stacks tree with a pool of workers. Sibling stacks are rendered, uploaded and validated
+    in parallel. A parent stack is only rendered once all of its nested stacks are, so that its template
+    has the final TemplateURL of each of them.
+
+    :param ComposeXStack root_stack: the root stack of the tree to render
+    :param ecs_composex.common.settings.ComposeXSettings settings: The settings for execution
+    :param int workers: maximum number of stacks to render at once
+    """
+    parents: dict = {}
+    pending_children: dict = {}
+    leaves: list = []
+
+    def map_stacks_tree(stack: ComposeXStack, is_root: bool):
+        nested_stacks = get_nested_stacks(stack)
+        pending_children[id(stack)] = len(nested_stacks)
+        if not nested_stacks:
+            leaves.append(stack)
+        for nested_stack in nested_stacks:
+            parents[id(nested_stack)] = (stack, is_root)
+            map_stacks_tree(nested_stack, is_root=False)
+
+    map_stacks_tree(root_stack, is_root=True)
+    LOG.info(f"Rendering {len(pending_children)} stacks with {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(stack.render, settings): stack for stack in leaves}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                stack = futures.pop(future)
+                try:
+                    future.result()
+                except Exception:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                if id(stack) not in parents:
+                    continue
+                parent, parent_is_root = parents[id(stack)]
+                set_root_stack_name_parameter(stack, parent_is_root)
+                pending_children[id(parent)] -= 1
+                if pending_children[id(parent)] == 0:
+                    futures[executor.submit(parent.render, settings)] = parent
+
+
 def process_stacks(root_stack, settings, is_root=True):
     """
     Function to go through all stacks of a given template and update the template
     It will recursively render sub stacks defined.
+    If the settings allow for more than one worker, the stacks are rendered concurrently.
 
     :param root_stack: the root template to iterate over the resources.
     :type root_stack: ecs_composex.common.stacks.ComposeXStack
@@ -368,6 +512,15 @@ def process_stacks(root_stack, settings, is_root=True):
     :type settings: ecs_composex.common.settings.ComposeXSettings
     :param bool is_root: Allows to know whether the stack is parent stack
     """
+    if is_root and getattr(settings, "incremental", False):
+        settings.render_state = RenderState(
+            settings.state_file, get_settings_fingerprint(settings)
+        )
+    if is_root and getattr(settings, "render_workers", 1) > 1:
+        process_stacks_concurrently(root_stack, settings, settings.render_workers)
+        if getattr(settings, "render_state", None):
+            settings.render_state.save()
+        return
     for resource_name, resource in root_stack.stack_template.resources.items():
         if isinstance(resource, ComposeXStack) or issubclass(
             type(resource), ComposeXStack
@@ -375,11 +528,10 @@ def process_stacks(root_stack, settings, is_root=True):
             LOG.debug(resource)
             LOG.debug(resource.title)
             process_stacks(resource, settings, is_root=False)
-            if is_root:
-                resource.Parameters.update({ROOT_STACK_NAME_T: Ref(AWS_STACK_NAME)})
-            else:
-                resource.Parameters.update(cfn_conditions.pass_root_stack_name())
+            set_root_stack_name_parameter(resource, is_root)
         elif isinstance(resource, Stack):
             LOG.warning(resource_name)
             LOG.warning(resource)
     root_stack.render(settings)
+    if is_root and getattr(settings, "render_state", None):
+        settings.render_state.save()
@@ -0,0 +1,349 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Local plan of the changes between the deployed stacks and the rendered templates.
+
+The deployed templates of the root stack and of its nested stacks are fetched once each, and compared resource by
+resource, and property by property, to the rendered templates. Resources whose type changed, or for which a property
+known to require the resource replacement changed, are flagged as likely to be replaced.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ecs_composex.common.settings import ComposeXSettings
+    from ecs_composex.common.stacks import ComposeXStack
+
+from botocore.exceptions import ClientError
+from cfn_flip import load as load_template
+from tabulate import tabulate
+
+from ecs_composex.common.aws_cache import get_client
+from ecs_composex.common.logging import LOG
+from ecs_composex.common.stacks import get_nested_stacks
+
+ADD = "Add"
+MODIFY = "Modify"
+REMOVE = "Remove"
+
+NESTED_STACK_TYPE = "AWS::CloudFormation::Stack"
+RESOURCE_ATTRIBUTES = [
+    "Condition",
+    "DeletionPolicy",
+    "DependsOn",
+    "UpdateReplacePolicy",
+]
+ALL_PROPERTIES = "*"
+REPLACEMENT_PROPERTIES = {
+    "AWS::ApplicationAutoScaling::ScalableTarget": [
+        "ResourceId",
+        "ScalableDimension",
+        "ServiceNamespace",
+    ],
+    "AWS::DynamoDB::Table": ["KeySchema", "LocalSecondaryIndexes", "TableName"],
+    "AWS::EC2::SecurityGroup": ["GroupDescription", "GroupName", "VpcId"],
+    "AWS::EC2::SecurityGroupEgress": ALL_PROPERTIES,
+    "AWS::EC2::SecurityGroupIngress": ALL_PROPERTIES,
+    "AWS::ECS::Cluster": ["ClusterName"],
+    "AWS::ECS::Service": [
+        "Cluster",
+        "LaunchType",
+        "Role",
+        "SchedulingStrategy",
+        "ServiceName",
+    ],
+    "AWS::ECS::TaskDefinition": ALL_PROPERTIES,
+    "AWS::ElasticLoadBalancingV2::LoadBalancer": ["Name", "Scheme", "Type"],
+    "AWS::ElasticLoadBalancingV2::TargetGroup": [
+        "Name",
+        "Port",
+        "Protocol",
+        "ProtocolVersion",
+        "TargetType",
+        "VpcId",
+    ],
+    "AWS::Events::Rule": ["EventBusName", "Name"],
+    "AWS::IAM::ManagedPolicy": ["Description", "ManagedPolicyName", "Path"],
+    "AWS::IAM::Role": ["Path", "RoleName"],
+    "AWS::KMS::Alias": ["AliasName"],
+    "AWS::Kinesis::Stream": ["Name"],
+    "AWS::Logs::LogGroup": ["LogGroupName"],
+    "AWS::RDS::DBCluster": [
+        "DBClusterIdentifier",
+        "DatabaseName",
+        "Engine",
+        "KmsKeyId",
+        "MasterUsername",
+        "StorageEncrypted",
+    ],
+    "AWS::RDS::DBInstance": [
+        "DBClusterIdentifier",
+        "DBInstanceIdentifier",
+        "DBName",
+        "KmsKeyId",
+        "MasterUsername",
+        "StorageEncrypted",
+    ],
+    "AWS::Route53::RecordSet": ["HostedZoneId", "HostedZoneName", "Name"],
+    "AWS::S3::Bucket": ["BucketName", "ObjectLockEnabled"],
+    "AWS::SNS::Topic": ["FifoTopic", "TopicName"],
+    "AWS::SQS::Queue": ["FifoQueue", "QueueName"],
+    "AWS::SecretsManager::Secret": ["Name"],
+    "AWS::ServiceDiscovery::Service": ["Name", "NamespaceId"],
+}
+
+
+class ResourceChange:
+    """
+    Change of a resource between the deployed and the rendered template
+
+    :ivar str logical_id: LogicalResourceId, prefixed with the nested stacks LogicalResourceId
+    :ivar list[str] properties: the properties which changed, as paths, i.e. ContainerDefinitions.0.Image
+    :ivar bool replacement: Whether the change likely replaces the resource
+    """
+
+    def __init__(
+        self,
+        logical_id: str,
+        resource_type: str,
+        action: str,
+        properties: list = None,
+        replacement: bool = False,
+    ):
+        self.logical_id = logical_id
+        self.resource_type = resource_type
+        self.action = action
+        self.properties = properties if properties else []
+        self.replacement = replacement
+
+    def __repr__(self):
+        return f"{self.action} {self.logical_id} ({self.resource_type})"
+
+
+def normalize_scalar(value) -> str:
+    """
+    Template values as CloudFormation sees them, i.e. 80 and "80" are the same value.
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def diff_values(deployed, rendered, path: str = "") -> list:
+    """
+    :return: the paths of the values which differ between the deployed and rendered values
+    :rtype: list[str]
+    """
+    if isinstance(deployed, dict) and isinstance(rendered, dict):
+        changes = []
+        for key in sorted(set(deployed).union(rendered)):
+            key_path = f"{path}.{key}" if path else key
+            if key not in deployed or key not in rendered:
+                changes.append(key_path)
+            else:
+                changes += diff_values(deployed[key], rendered[key], key_path)
+        return changes
+    elif isinstance(deployed, list) and isinstance(rendered, list):
+        if len(deployed) != len(rendered):
+            return [path]
+        changes = []
+        for index, (deployed_item, rendered_item) in enumerate(zip(deployed, rendered)):
+            changes += diff_values(deployed_item, rendered_item, f"{path}.{index}")
+        return changes
+    elif isinstance(deployed, (dict, list)) or isinstance(rendered, (dict, list)):
+        return [path]
+    elif normalize_scalar(deployed) != normalize_scalar(rendered):
+        return [path]
+    return []
+
+
+def as_list(value) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def requires_replacement(resource_type: str, properties: list) -> bool:
+    replacement_properties = REPLACEMENT_PROPERTIES.get(resource_type, [])
+    if replacement_properties == ALL_PROPERTIES:
+        return bool(properties)
+    return any(
+        _property.split(".")[0] in replacement_properties for _property in properties
+    )
+
+
+def diff_resource(logical_id: str, deployed: dict, rendered: dict) -> ResourceChange:
+    """
+    :return: the change of the resource, None if it did not change
+    :rtype: ResourceChange
+    """
+    if deployed["Type"] != rendered["Type"]:
+        return ResourceChange(
+            logical_id, rendered["Type"], MODIFY, ["Type"], replacement=True
+        )
+    deployed_properties = dict(deployed.get("Properties", {}))
+    rendered_properties = dict(rendered.get("Properties", {}))
+    if rendered["Type"] == NESTED_STACK_TYPE:
+        deployed_properties.pop("TemplateURL", None)
+        rendered_properties.pop("TemplateURL", None)
+    properties = diff_values(deployed_properties, rendered_properties)
+    attributes = []
+    for attribute in RESOURCE_ATTRIBUTES:
+        deployed_value = deployed.get(attribute)
+        rendered_value = rendered.get(attribute)
+        if attribute == "DependsOn":
+            deployed_value = sorted(set(as_list(deployed_value)))
+            rendered_value = sorted(set(as_list(rendered_value)))
+        if deployed_value != rendered_value:
+            attributes.append(attribute)
+    if not properties and not attributes:
+        return None
+    return ResourceChange(
+        logical_id,
+        rendered["Type"],
+        MODIFY,
+        attributes + properties,
+        replacement=requires_replacement(rendered["Type"], properties),
+    )
+
+
+def diff_resources(deployed: dict, rendered: dict, prefix: str = None) -> list:
+    """
+    Compares the Resources of the deployed template and of the rendered template
+
+    :param dict deployed: the deployed template Resources
+    :param dict rendered: the rendered template Resources
+    :param str prefix: LogicalResourceId of the nested stack, to prefix the changes LogicalResourceId with
+    :rtype: list[ResourceChange]
+    """
+    changes = []
+    for logical_id in sorted(set(deployed).union(rendered)):
+        change_id = f"{prefix}/{logical_id}" if prefix else logical_id
+        if logical_id not in deployed:
+            changes.append(ResourceChange(change_id, rendered[logical_id]["Type"], ADD))
+        elif logical_id not in rendered:
+            changes.append(
+                ResourceChange(
+                    change_id, deployed[logical_id]["Type"], REMOVE, replacement=True
+                )
+            )
+        else:
+            change = diff_resource(
+                change_id, deployed[logical_id], rendered[logical_id]
+            )
+            if change:
+                changes.append(change)
+    return changes
+
+
+def get_deployed_template(client, stack_name: str) -> dict:
+    """
+    :param client: CloudFormation client
+    :param str stack_name: Name or ID of the stack
+    :return: The template of the stack, None if the stack does not exist
+    :rtype: dict
+    """
+    try:
+        template_body = client.get_template(
+            StackName=stack_name, TemplateStage="Original"
+        )["TemplateBody"]
+    except ClientError as error:
+        if error.response["Error"]["Code"] == "ValidationError":
+            LOG.debug(f"{stack_name} - {error.response['Error']['Message']}")
+            return None
+        raise
+    if isinstance(template_body, str):
+        template_body, _ = load_template(template_body)
+    return template_body
+
+
+def get_deployed_nested_stacks(client, stack_name: str) -> dict:
+    """
+    :param client: CloudFormation client
+    :param str stack_name: Name or ID of the stack
+    :return: the nested stacks ID, by LogicalResourceId
+    :rtype: dict
+    """
+    nested_stacks = {}
+    for page in client.get_paginator("list_stack_resources").paginate(
+        StackName=stack_name
+    ):
+        for resource in page["StackResourceSummaries"]:
+            if resource["ResourceType"] == NESTED_STACK_TYPE and resource.get(
+                "PhysicalResourceId"
+            ):
+                nested_stacks[resource["LogicalResourceId"]] = resource[
+                    "PhysicalResourceId"
+                ]
+    return nested_stacks
+
+
+def diff_stack(
+    client, stack: ComposeXStack, stack_name: str = None, prefix: str = None
+) -> list:
+    """
+    Compares the rendered template of the stack and of its nested stacks to the deployed ones.
+
+    :param client: CloudFormation client
+    :param ComposeXStack stack: the rendered stack
+    :param str stack_name: Name or ID of the deployed stack. None if the stack is not deployed
+    :param str prefix: LogicalResourceId of the nested stack, to prefix the changes LogicalResourceId with
+    :rtype: list[ResourceChange]
+    """
+    deployed = get_deployed_template(client, stack_name) if stack_name else None
+    rendered = stack.stack_template.to_dict()
+    changes = diff_resources(
+        deployed.get("Resources", {}) if deployed else {},
+        rendered.get("Resources", {}),
+        prefix,
+    )
+    deployed_nested_stacks = (
+        get_deployed_nested_stacks(client, stack_name) if deployed else {}
+    )
+    for nested_stack in get_nested_stacks(stack):
+        changes += diff_stack(
+            client,
+            nested_stack,
+            deployed_nested_stacks.get(nested_stack.title),
+            f"{prefix}/{nested_stack.title}" if prefix else nested_stack.title,
+        )
+    return changes
+
+
+def local_plan(settings: ComposeXSettings, root_stack: ComposeXStack) -> list:
+    """
+    Computes and prints the changes between the deployed stacks and the rendered templates.
+
+    :param ComposeXSettings settings:
+    :param ComposeXStack root_stack:
+    :rtype: list[ResourceChange]
+    """
+    changes = diff_stack(
+        get_client(settings.session, "cloudformation"), root_stack, settings.name
+    )
+    print(
+        tabulate(
+            [
+                [
+                    change.logical_id,
+                    change.resource_type,
+                    change.action,
+                    str(change.replacement),
+                    "\n".join(change.properties),
+                ]
+                for change in changes
+            ],
+            [
+                "LogicalResourceId",
+                "ResourceType",
+                "Action",
+                "Replacement",
+                "Properties",
+            ],
+            tablefmt="rst",
+        )
+    )
+    return changes
@@ -0,0 +1,274 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Waiters for the CloudFormation stacks deployments and change sets.
+
+The stacks events of the root stack and of its nested stacks are read incrementally, only fetching the events newer
+than the last one seen, and printed as they come. The polling interval grows while nothing happens, and goes back to
+the shortest interval as soon as new events come in.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from time import monotonic, sleep
+
+from compose_x_common.compose_x_common import keyisset
+
+from ecs_composex.common.logging import LOG
+
+WAIT_MIN_INTERVAL = 2
+WAIT_MAX_INTERVAL = 15
+WAIT_BACKOFF_RATE = 1.5
+STACK_WAIT_TIMEOUT = 3600
+CHANGE_SET_WAIT_TIMEOUT = 900
+
+NESTED_STACK_TYPE = "AWS::CloudFormation::Stack"
+STACK_SUCCESS_STATUSES = [
+    "CREATE_COMPLETE",
+    "UPDATE_COMPLETE",
+    "IMPORT_COMPLETE",
+]
+STACK_FAILED_STATUSES = [
+    "CREATE_FAILED",
+    "DELETE_COMPLETE",
+    "DELETE_FAILED",
+    "ROLLBACK_COMPLETE",
+    "ROLLBACK_FAILED",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "UPDATE_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+    "IMPORT_ROLLBACK_FAILED",
+]
+CHANGE_SET_PENDING_STATUSES = [
+    "CREATE_PENDING",
+    "CREATE_IN_PROGRESS",
+    "DELETE_PENDING",
+    "DELETE_IN_PROGRESS",
+    "REVIEW_IN_PROGRESS",
+]
+CHANGE_SET_SUCCESS_STATUSES = ["CREATE_COMPLETE", "DELETE_COMPLETE"]
+CHANGE_SET_FAILED_STATUSES = ["DELETE_FAILED", "FAILED"]
+
+
+class AdaptiveInterval:
+    """
+    Polling interval, growing while nothing changes, reset when something does.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = WAIT_MIN_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+        rate: float = WAIT_BACKOFF_RATE,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.rate = rate
+        self.interval = min_interval
+
+    def next(self, changed: bool) -> float:
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.rate)
+        return self.interval
+
+
+class StackEventsWatcher:
+    """
+    Reads the events of the root stack and of its nested stacks, as they get created, incrementally.
+
+    :ivar dict last_events: ID of the last event seen, by stack ID
+    :ivar list stacks: the stacks watched, root stack first
+    """
+
+    def __init__(self, client, stack_id: str, since: datetime = None):
+        self.client = client
+        self.root_stack_id = stack_id
+        self.stacks: list = [stack_id]
+        self.last_events: dict = {}
+        self.since = since if since else datetime.now(timezone.utc)
+
+    def stack_new_events(self, stack_id: str) -> list:
+        """
+        :param str stack_id:
+        :return: the events of the stack since the last one seen, oldest first
+        :rtype: list[dict]
+        """
+        events = []
+        last_event_id = self.last_events.get(stack_id)
+        kwargs = {"StackName": stack_id}
+        while True:
+            events_r = self.client.describe_stack_events(**kwargs)
+            for event in events_r["StackEvents"]:
+                if event["EventId"] == last_event_id or event["Timestamp"] < self.since:
+                    break
+                events.append(event)
+            else:
+                if keyisset("NextToken", events_r):
+                    kwargs["NextToken"] = events_r["NextToken"]
+                    continue
+            break
+        if events:
+            self.last_events[stack_id] = events[0]["EventId"]
+        return list(reversed(events))
+
+    def new_events(self) -> list:
+        """
+        :return: the new events of all the stacks, oldest first. Adds the nested stacks found in the events.
+        :rtype: list[dict]
+        """
+        events = []
+        for stack_id in list(self.stacks):
+            for event in self.stack_new_events(stack_id):
+                events.append(event)
+                physical_id = event.get("PhysicalResourceId", "")
+                if (
+                    event["ResourceType"] == NESTED_STACK_TYPE
+                    and physical_id.startswith("arn:")
+                    and physical_id not in self.stacks
+                ):
+                    self.stacks.append(physical_id)
+        return sorted(events, key=lambda _event: _event["Timestamp"])
+
+
+def format_event(event: dict) -> str:
+    """
+    One line summary of the stack event
+    """
+    line = (
+        f"{event['Timestamp'].strftime('%H:%M:%S')} {event['StackName']:<32.32} "
+        f"{event['LogicalResourceId']:<40.40} {event['ResourceStatus']}"
+    )
+    if keyisset("ResourceStatusReason", event):
+        line += f" - {event['ResourceStatusReason']}"
+    return line
+
+
+def get_stack_status(client, stack_id: str) -> str:
+    return client.describe_stacks(StackName=stack_id)["Stacks"][0]["StackStatus"]
+
+
+def wait_for_stack(
+    client,
+    stack_id: str,
+    since: datetime = None,
+    timeout: int = STACK_WAIT_TIMEOUT,
+    interval: AdaptiveInterval = None,
+) -> int:
+    """
+    Waits for the stack create/update to complete, printing the stack and nested stacks events as they come.
+
+    :param client: CloudFormation client
+    :param str stack_id:
+    :param datetime since: Ignore the events older than this. Defaults to now.
+    :param int timeout: seconds to wait for at most
+    :param AdaptiveInterval interval: the polling interval
+    :return: 0 if the stack reached a complete status, 1 otherwise
+    :rtype: int
+    """
+    watcher = StackEventsWatcher(client, stack_id, since)
+    if interval is None:
+        interval = AdaptiveInterval()
+    deadline = monotonic() + timeout
+    while True:
+        events = watcher.new_events()
+        for event in events:
+            print(format_event(event), flush=True)
+        status = get_stack_status(client, stack_id)
+        if status in STACK_SUCCESS_STATUSES:
+            LOG.info(f"{stack_id} - {status}")
+            return 0
+        elif status in STACK_FAILED_STATUSES:
+            LOG.error(f"{stack_id} - {status}")
+            return 1
+        if monotonic() >= deadline:
+            LOG.error(f"{stack_id} - Timed out waiting for completion. {status}")
+            return 1
+        sleep(interval.next(bool(events)))
+
+
+def wait_for_change_set(
+    client,
+    change_set_name: str,
+    stack_name: str,
+    timeout: int = CHANGE_SET_WAIT_TIMEOUT,
+    interval: AdaptiveInterval = None,
+) -> dict:
+    """
+    Waits for the change set to be created.
+
+    :param client: CloudFormation client
+    :param str change_set_name:
+    :param str stack_name:
+    :param int timeout: seconds to wait for at most
+    :param AdaptiveInterval interval: the polling interval
+    :return: the change set description (first page)
+    :rtype: dict
+    :raises: SystemExit if the change set failed or timed out
+    """
+    if interval is None:
+        interval = AdaptiveInterval()
+    deadline = monotonic() + timeout
+    while True:
+        status = client.describe_change_set(
+            ChangeSetName=change_set_name, StackName=stack_name
+        )
+        if status["Status"] in CHANGE_SET_FAILED_STATUSES:
+            raise SystemExit(
+                "Change set is unsucessful",
+                status["Status"],
+                status.get("StatusReason"),
+            )
+        elif status["Status"] in CHANGE_SET_SUCCESS_STATUSES:
+            return status
+        if monotonic() >= deadline:
+            raise SystemExit("Timed out waiting for the change set", status["Status"])
+        delay = interval.next(False)
+        print(
+            f"ChangeSet creation in progress. Waiting {delay:.0f} seconds",
+            end="\r",
+            flush=True,
+        )
+        sleep(delay)
+
+
+def get_change_set_changes(
+    client, change_set_name: str, stack_name: str = None, prefix: str = None
+) -> list:
+    """
+    Lists all the changes of the change set, going over all the pages and into the nested stacks change sets.
+
+    :param client: CloudFormation client
+    :param str change_set_name: Name or ID of the change set
+    :param str stack_name: Name of the stack, if change_set_name is not an ID
+    :param str prefix: LogicalResourceId of the nested stack, to prefix the changes LogicalResourceId with
+    :return: the changes, as returned by describe_change_set
+    :rtype: list[dict]
+    """
+    changes = []
+    kwargs = {"ChangeSetName": change_set_name}
+    if stack_name:
+        kwargs["StackName"] = stack_name
+    while True:
+        change_set_r = client.describe_change_set(**kwargs)
+        for change in change_set_r.get("Changes", []):
+            resource_change = dict(change["ResourceChange"])
+            logical_id = resource_change["LogicalResourceId"]
+            if prefix:
+                resource_change["LogicalResourceId"] = f"{prefix}/{logical_id}"
+            changes.append(dict(change, ResourceChange=resource_change))
+            if resource_change["ResourceType"] == NESTED_STACK_TYPE and keyisset(
+                "ChangeSetId", resource_change
+            ):
+                changes += get_change_set_changes(
+                    client,
+                    resource_change["ChangeSetId"],
+                    prefix=resource_change["LogicalResourceId"],
+                )
+        if not keyisset("NextToken", change_set_r):
+            return changes
+        kwargs["NextToken"] = change_set_r["NextToken"]
@@ -33,7 +33,7 @@ from ecs_composex import __version__ as version
 from ecs_composex.common import NONALPHANUM
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.logging import LOG
-from ecs_composex.common.stacks import ComposeXStack
+from ecs_composex.common.stacks import StacksTreeVisitor
 from ecs_composex.common.troposphere_tools import add_parameters
 
 
@@ -176,53 +176,57 @@ def default_tags():
     return Tags(CreatedByComposeX=True, **{"compose-x:version": version})
 
 
-def apply_tags_to_resources(settings, resource, params, xtags):
+def get_tags_and_parameters(settings) -> tuple:
     """
+    Defines the tags to add to the resources, and the parameters for their values, from x-tags
 
     :param ecs_composex.common.settings.ComposeXSettings settings: Execution settings
-    :param resource: The resource to add the tags to
+    :return: the parameters, if any, and the tags
+    :rtype: tuple
+    """
+    if not keyisset("x-tags", settings.compose_content):
+        return None, default_tags()
+    tags = settings.compose_content["x-tags"]
+    xtags = define_extended_tags(tags)
+    xtags += default_tags()
+    return generate_tags_parameters(tags), xtags
+
+
+def add_tags_hooks(visitor: StacksTreeVisitor, settings, params=None, xtags=None):
+    """
+    Registers the hooks adding the tags parameters to the nested stacks templates, and the tags to their resources.
+    The resources of the root template are not tagged, they get the tags from the stack.
+
+    :param StacksTreeVisitor visitor:
+    :param ecs_composex.common.settings.ComposeXSettings settings: Execution settings
     :param list params: Parameters to add to template if any
     :param troposphere.Tags xtags: List of Tags to add to the resources.
-    :return:
-    """
-    if isinstance(resource, ComposeXStack) or issubclass(type(resource), ComposeXStack):
-        LOG.debug(resource)
-        LOG.debug(resource.title)
-        add_all_tags(resource.stack_template, settings, params, xtags)
-        if params:
-            add_parameters(resource.stack_template, params)
-        if (
-            not resource
-            or not hasattr(resource, "stack_template")
-            or not resource.stack_template
-        ):
-            return
-        for stack_resource in resource.stack_template.resources.values():
-            add_object_tags(stack_resource, xtags)
+    """
+    if not params or not xtags:
+        params, xtags = get_tags_and_parameters(settings)
+
+    def add_stack_tags_parameters(stack, parent_stack, depth: int) -> None:
+        if depth and params and stack.stack_template:
+            add_parameters(stack.stack_template, params)
+
+    def add_resource_tags(resource, stack, depth: int) -> None:
+        if depth:
+            add_object_tags(resource, xtags)
+
+    visitor.add_stack_hook(add_stack_tags_parameters)
+    visitor.add_resource_hook(add_resource_tags)
 
 
 def add_all_tags(root_template, settings, params=None, xtags=None):
     """
     Function to go through all stacks of a given template and update the template
-    It will recursively render sub stacks defined.
-    If there are no substacks, it will go over the resources of the template add the tags.
+    It will go over all the nested stacks and add the tags to their resources.
 
     :param troposphere.Template root_template: the root template to iterate over the resources.
     :param ecs_composex.common.settings.ComposeXSettings settings: Execution settings
     :param list params: Parameters to add to template if any
     :param troposphere.Tags xtags: List of Tags to add to the resources.
     """
-    if not params or not xtags:
-        if not keyisset("x-tags", settings.compose_content):
-            xtags = default_tags()
-            params = None
-        else:
-            tags = settings.compose_content["x-tags"]
-            params = generate_tags_parameters(tags)
-            xtags = define_extended_tags(tags)
-            xtags += default_tags()
-
-    resources = root_template.resources if root_template else []
-    for resource_name in resources:
-        resource = resources[resource_name]
-        apply_tags_to_resources(settings, resource, params, xtags)
+    visitor = StacksTreeVisitor()
+    add_tags_hooks(visitor, settings, params, xtags)
+    visitor.visit_template(root_template)
@@ -0,0 +1,324 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Offline validation of the CloudFormation templates rendered by compose-x.
+
+Checks the template structure and limits, that Ref, Fn::GetAtt, Fn::FindInMap, Fn::Sub, conditions and DependsOn
+point to existing targets, and for nested stacks, that the parameters given by the parent stack match the parameters
+of the nested stack template and that the Outputs used via Fn::GetAtt exist.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from troposphere import Template
+
+import re
+
+from ecs_composex.exceptions import TemplateValidationError
+
+REMOTE_VALIDATION = "remote"
+LOCAL_VALIDATION = "local"
+NO_VALIDATION = "none"
+VALIDATION_MODES = [REMOTE_VALIDATION, LOCAL_VALIDATION, NO_VALIDATION]
+
+TEMPLATE_SECTIONS = [
+    "AWSTemplateFormatVersion",
+    "Description",
+    "Metadata",
+    "Parameters",
+    "Rules",
+    "Mappings",
+    "Conditions",
+    "Transform",
+    "Resources",
+    "Outputs",
+]
+TEMPLATE_LIMITS = {
+    "Parameters": 200,
+    "Resources": 500,
+    "Outputs": 200,
+    "Mappings": 200,
+}
+TEMPLATE_URL_MAX_SIZE = 1024 * 1024
+PSEUDO_PARAMETERS = [
+    "AWS::AccountId",
+    "AWS::NotificationARNs",
+    "AWS::NoValue",
+    "AWS::Partition",
+    "AWS::Region",
+    "AWS::StackId",
+    "AWS::StackName",
+    "AWS::URLSuffix",
+]
+NESTED_STACK_TYPE = "AWS::CloudFormation::Stack"
+LOGICAL_ID_RE = re.compile(r"^[a-zA-Z\d]{1,255}$")
+PARAMETER_TYPE_RE = re.compile(
+    r"^(String|Number|List<Number>|CommaDelimitedList"
+    r"|AWS::[a-zA-Z\d:]+|List<AWS::[a-zA-Z\d:]+>"
+    r"|AWS::SSM::Parameter::Value<[\S]+>)$"
+)
+SUB_VARIABLE_RE = re.compile(r"\${(?!!)([^}]+)}")
+
+
+def get_nested_stack_interface(template: Template) -> dict:
+    """
+    Returns the parameters (and whether they are required) and the outputs of a nested stack template
+
+    :param troposphere.Template template:
+    :return: {"Parameters": {name: required}, "Outputs": [names]}
+    :rtype: dict
+    """
+    return {
+        "Parameters": {
+            name: "Default" not in parameter.properties
+            for name, parameter in template.parameters.items()
+        },
+        "Outputs": list(template.outputs.keys()),
+    }
+
+
+class TemplateValidator:
+    """
+    Validates a CloudFormation template dict, as rendered from troposphere.Template.to_dict()
+
+    :ivar str name: Name of the template, used in the errors reported
+    :ivar dict template: The template content
+    :ivar dict nested_stacks: The interface of the nested stacks defined in the template, by logical ID
+    :ivar list[str] errors: The errors found
+    """
+
+    def __init__(self, name: str, template: dict, nested_stacks: dict = None):
+        self.name = name
+        self.template = template
+        self.nested_stacks = nested_stacks if nested_stacks else {}
+        self.errors: list[str] = []
+        self.parameters = template.get("Parameters", {})
+        self.resources = template.get("Resources", {})
+        self.mappings = template.get("Mappings", {})
+        self.conditions = template.get("Conditions", {})
+
+    def validate(self) -> list[str]:
+        self.validate_structure()
+        self.validate_parameters()
+        for condition_name, condition in self.conditions.items():
+            self.validate_intrinsics(
+                condition, f"Conditions.{condition_name}", in_conditions=True
+            )
+        for resource_name, resource in self.resources.items():
+            self.validate_resource(resource_name, resource)
+        for output_name, output in self.template.get("Outputs", {}).items():
+            if "Value" not in output:
+                self.errors.append(f"Outputs.{output_name} - Value is required")
+            self.validate_condition_name(
+                output.get("Condition"), f"Outputs.{output_name}"
+            )
+            self.validate_intrinsics(output, f"Outputs.{output_name}")
+        return self.errors
+
+    def validate_structure(self) -> None:
+        for section in self.template.keys():
+            if section not in TEMPLATE_SECTIONS:
+                self.errors.append(f"Invalid template section {section}")
+        if not self.resources:
+            self.errors.append("Template must define at least one resource")
+        for section, limit in TEMPLATE_LIMITS.items():
+            count = len(self.template.get(section, {}))
+            if count > limit:
+                self.errors.append(
+                    f"{section} - {count} defined, exceeds the limit of {limit}"
+                )
+        for section in ["Parameters", "Mappings", "Conditions", "Resources", "Outputs"]:
+            for logical_id in self.template.get(section, {}).keys():
+                if not LOGICAL_ID_RE.match(logical_id):
+                    self.errors.append(
+                        f"{section}.{logical_id} - Logical ID must be alphanumeric"
+                    )
+
+    def validate_parameters(self) -> None:
+        for parameter_name, parameter in self.parameters.items():
+            parameter_type = parameter.get("Type")
+            if not parameter_type:
+                self.errors.append(f"Parameters.{parameter_name} - Type is required")
+            elif not PARAMETER_TYPE_RE.match(parameter_type):
+                self.errors.append(
+                    f"Parameters.{parameter_name} - Invalid type {parameter_type}"
+                )
+            if "AllowedValues" in parameter and "Default" in parameter:
+                allowed = [str(_value) for _value in parameter["AllowedValues"]]
+                if str(parameter["Default"]) not in allowed:
+                    self.errors.append(
+                        f"Parameters.{parameter_name} - Default {parameter['Default']}"
+                        f" is not in AllowedValues {allowed}"
+                    )
+
+    def validate_resource(self, resource_name: str, resource: dict) -> None:
+        path = f"Resources.{resource_name}"
+        if not isinstance(resource, dict) or "Type" not in resource:
+            self.errors.append(f"{path} - Type is required")
+            return
+        self.validate_condition_name(resource.get("Condition"), path)
+        depends_on = resource.get("DependsOn", [])
+        for dependency in [depends_on] if isinstance(depends_on, str) else depends_on:
+            if dependency not in self.resources:
+                self.errors.append(
+                    f"{path} - DependsOn {dependency} is not a resource of the template"
+                )
+        self.validate_intrinsics(resource, path)
+        if (
+            resource["Type"] == NESTED_STACK_TYPE
+            and resource_name in self.nested_stacks
+        ):
+            self.validate_nested_stack_parameters(
+                resource_name, resource.get("Properties", {}).get("Parameters", {})
+            )
+
+    def validate_nested_stack_parameters(
+        self, stack_name: str, parameters: dict
+    ) -> None:
+        """
+        Checks that the parameters given to the nested stack are defined in its template, and that all its
+        required parameters are set.
+        """
+        stack_parameters = self.nested_stacks[stack_name]["Parameters"]
+        for parameter_name in parameters.keys():
+            if parameter_name not in stack_parameters:
+                self.errors.append(
+                    f"Resources.{stack_name} - Parameter {parameter_name}"
+                    " is not defined in the nested stack template"
+                )
+        for parameter_name, required in stack_parameters.items():
+            if required and parameter_name not in parameters:
+                self.errors.append(
+                    f"Resources.{stack_name} - Parameter {parameter_name}"
+                    " has no default value and is not set"
+                )
+
+    def validate_condition_name(self, condition_name, path: str) -> None:
+        if condition_name is None:
+            return
+        if not isinstance(condition_name, str):
+            self.errors.append(f"{path} - Condition must be a string")
+        elif condition_name not in self.conditions:
+            self.errors.append(f"{path} - Condition {condition_name} is not defined")
+
+    def validate_ref(self, target, path: str, in_conditions: bool = False) -> None:
+        if not isinstance(target, str) or target in PSEUDO_PARAMETERS:
+            return
+        if target in self.parameters:
+            return
+        if target in self.resources and not in_conditions:
+            return
+        self.errors.append(f"{path} - Ref to undefined {target}")
+
+    def validate_getatt(self, value, path: str) -> None:
+        if isinstance(value, str):
+            value = value.split(".", 1)
+        if not isinstance(value, list) or len(value) != 2:
+            self.errors.append(f"{path} - Invalid Fn::GetAtt {value}")
+            return
+        resource_name, attribute = value
+        if resource_name not in self.resources:
+            self.errors.append(
+                f"{path} - Fn::GetAtt to undefined resource {resource_name}"
+            )
+            return
+        if (
+            resource_name in self.nested_stacks
+            and isinstance(attribute, str)
+            and attribute.startswith("Outputs.")
+        ):
+            output_name = attribute.split(".", 1)[-1]
+            if output_name not in self.nested_stacks[resource_name]["Outputs"]:
+                self.errors.append(
+                    f"{path} - Output {output_name} is not defined in nested stack {resource_name}"
+                )
+
+    def validate_find_in_map(self, value, path: str) -> None:
+        if not isinstance(value, list) or len(value) != 3:
+            self.errors.append(f"{path} - Invalid Fn::FindInMap {value}")
+            return
+        map_name, top_key, second_key = value
+        if not isinstance(map_name, str):
+            return
+        if map_name not in self.mappings:
+            self.errors.append(
+                f"{path} - Fn::FindInMap to undefined mapping {map_name}"
+            )
+            return
+        if not isinstance(top_key, str):
+            return
+        if top_key not in self.mappings[map_name]:
+            self.errors.append(
+                f"{path} - Fn::FindInMap key {top_key} not in mapping {map_name}"
+            )
+            return
+        if (
+            isinstance(second_key, str)
+            and second_key not in self.mappings[map_name][top_key]
+        ):
+            self.errors.append(
+                f"{path} - Fn::FindInMap key {second_key} not in {map_name}.{top_key}"
+            )
+
+    def validate_sub(self, value, path: str) -> None:
+        variables = {}
+        if isinstance(value, list) and len(value) == 2:
+            value, variables = value
+        if not isinstance(value, str):
+            return
+        for variable in SUB_VARIABLE_RE.findall(value):
+            if variable in variables or variable in PSEUDO_PARAMETERS:
+                continue
+            if "." in variable:
+                self.validate_getatt(variable, path)
+            else:
+                self.validate_ref(variable, path)
+
+    def validate_intrinsics(self, value, path: str, in_conditions: bool = False):
+        """
+        Recursively goes over the value to validate the intrinsic functions targets
+        """
+        if isinstance(value, list):
+            for item in value:
+                self.validate_intrinsics(item, path, in_conditions)
+            return
+        if not isinstance(value, dict):
+            return
+        if len(value) == 1:
+            function, args = list(value.items())[0]
+            if function == "Ref":
+                return self.validate_ref(args, path, in_conditions)
+            elif function == "Fn::GetAtt":
+                return self.validate_getatt(args, path)
+            elif function == "Fn::FindInMap":
+                self.validate_find_in_map(args, path)
+            elif function == "Fn::Sub":
+                self.validate_sub(args, path)
+            elif function == "Fn::If" and isinstance(args, list) and args:
+                self.validate_condition_name(args[0], path)
+            elif function == "Condition" and in_conditions:
+                return self.validate_condition_name(args, path)
+        for key, item in value.items():
+            self.validate_intrinsics(item, path, in_conditions)
+
+
+def validate_template_locally(
+    name: str, template: dict, nested_stacks: dict = None
+) -> None:
+    """
+    Validates the template without calling the CloudFormation API
+
+    :param str name: name of the template
+    :param dict template: the template content
+    :param dict nested_stacks: interface of the nested stacks, see get_nested_stack_interface
+    :raises TemplateValidationError: if any error is found
+    """
+    errors = TemplateValidator(name, template, nested_stacks).validate()
+    if errors:
+        raise TemplateValidationError(
+            f"{name} - Template validation failed with {len(errors)} error(s)", errors
+        )
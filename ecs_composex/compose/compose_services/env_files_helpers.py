@@ -1,7 +1,8 @@
 #  SPDX-License-Identifier: MPL-2.0
 #  Copyright 2020-2022 John Mille <john@compose-x.io>
 
-from os import path
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 from troposphere import AWS_PARTITION, Sub
 from troposphere.ecs import EnvironmentFile
@@ -9,9 +10,12 @@ from troposphere.iam import PolicyType
 
 import ecs_composex.common.troposphere_tools
 from ecs_composex.common import FILE_PREFIX
-from ecs_composex.common.files import upload_file
+from ecs_composex.common.files import get_file_digest, upload_file_from_path
 from ecs_composex.common.logging import LOG
 
+ENV_FILES_PREFIX = f"{FILE_PREFIX}/env_files"
+ENV_FILES_WORKERS = 10
+
 # TODO: refactor policy by having a x-s3 Bucket object deal with permissions
 
 
@@ -45,6 +49,118 @@ def add_envfiles_bucket_iam_access(env_files, family, settings):
         )
 
 
+class EnvFilesUploader:
+    """
+    Uploads the services env files to S3, named after their SHA-256 digest, so that files with the same name but a
+    different content do not override each other, and the same content is uploaded only once.
+
+    :ivar dict digests: the files digest, by file path
+    :ivar set uploaded: the bucket and key of the files uploaded
+    """
+
+    def __init__(self):
+        self.digests: dict = {}
+        self.uploaded: set = set()
+        self._lock = Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.digests.clear()
+            self.uploaded.clear()
+
+    def file_digest(self, file_path: str) -> str:
+        with self._lock:
+            if file_path in self.digests:
+                return self.digests[file_path]
+        digest = get_file_digest(file_path)
+        with self._lock:
+            self.digests[file_path] = digest
+        return digest
+
+    @staticmethod
+    def object_key(digest: str) -> str:
+        return f"{ENV_FILES_PREFIX}/{digest}.env"
+
+    def upload_file(self, settings, file_path: str, digest: str) -> str:
+        """
+        Uploads the file, if not already uploaded
+
+        :return: the S3 key of the file
+        :rtype: str
+        """
+        key = self.object_key(digest)
+        with self._lock:
+            if (settings.bucket_name, key) in self.uploaded:
+                return key
+        try:
+            upload_file_from_path(
+                file_path=file_path,
+                bucket_name=settings.bucket_name,
+                mime="text/plain",
+                prefix=ENV_FILES_PREFIX,
+                file_name=f"{digest}.env",
+                settings=settings,
+                content_addressed=False,
+                digest=digest,
+            )
+        except Exception:
+            LOG.error(f"Failed to upload env file {file_path}")
+            raise
+        LOG.info(f"env_files - Successfully uploaded {file_path} to S3")
+        with self._lock:
+            self.uploaded.add((settings.bucket_name, key))
+        return key
+
+    def upload(self, settings, file_path: str) -> str:
+        """
+        :return: the S3 key of the file, uploading it if not already uploaded
+        :rtype: str
+        """
+        return self.upload_file(settings, file_path, self.file_digest(file_path))
+
+    def upload_all(self, settings, file_paths: list) -> None:
+        """
+        Uploads the files concurrently, once per content.
+        """
+        unique_files: dict = {}
+        for file_path in file_paths:
+            unique_files.setdefault(self.file_digest(file_path), file_path)
+        if not unique_files:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(ENV_FILES_WORKERS, len(unique_files)),
+            thread_name_prefix="env-files",
+        ) as executor:
+            futures = [
+                executor.submit(self.upload_file, settings, file_path, digest)
+                for digest, file_path in unique_files.items()
+            ]
+        for future in futures:
+            future.result()
+
+
+ENV_FILES_UPLOADER = EnvFilesUploader()
+
+
+def upload_families_env_files(settings) -> None:
+    """
+    Uploads the env files of all the services of all the families at once, before the families are processed.
+
+    :param ecs_composex.common.settings.ComposeXSettings settings:
+    """
+    if settings.no_upload or settings.for_cfn_macro:
+        return
+    ENV_FILES_UPLOADER.upload_all(
+        settings,
+        [
+            env_file
+            for family in settings.families.values()
+            for service in family.services
+            for env_file in service.env_files
+        ],
+    )
+
+
 def upload_services_env_files(family, settings) -> None:
     """
     Method to go over each service and if settings are to upload files to S3, will create objects and update the
@@ -64,26 +180,9 @@ def upload_services_env_files(family, settings) -> None:
     for service in family.services:
         env_files = []
         for env_file in service.env_files:
-            with open(env_file) as file_fd:
-                file_body = file_fd.read()
-            object_name = path.basename(env_file)
-            try:
-                upload_file(
-                    body=file_body,
-                    bucket_name=settings.bucket_name,
-                    mime="text/plain",
-                    prefix=f"{FILE_PREFIX}/env_files",
-                    file_name=object_name,
-                    settings=settings,
-                )
-                LOG.info(
-                    f"{family.name}.env_files - Successfully uploaded {env_file} to S3"
-                )
-            except Exception:
-                LOG.error(f"Failed to upload env file {object_name}")
-                raise
+            object_key = ENV_FILES_UPLOADER.upload(settings, env_file)
             file_path = Sub(
-                f"arn:${{{AWS_PARTITION}}}:s3:::{settings.bucket_name}/{FILE_PREFIX}/env_files/{object_name}"
+                f"arn:${{{AWS_PARTITION}}}:s3:::{settings.bucket_name}/{object_key}"
             )
             env_files.append(EnvironmentFile(Type="s3", Value=file_path))
         if not hasattr(service.container_definition, "EnvironmentFiles"):
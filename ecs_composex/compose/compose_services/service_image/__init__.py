@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import copy
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Union
 
 from boto3.session import Session
@@ -23,17 +24,19 @@ from compose_x_common.aws.ecr import PRIVATE_ECR_URI_RE, PUBLIC_ECR_URI_RE
 from compose_x_common.compose_x_common import keyisset
 from troposphere import Ref
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.logging import LOG
 
 from .ecr_helpers import define_service_image, interpolate_ecr_uri_tag_with_digest
+from .image_digests import DIGESTS_WORKERS, IMAGES_DIGESTS
 
 
 def get_image_from_ssm_parameter(
     ssm_parameter: Parameter, session: Session = None
 ) -> Union[str, None]:
     session = get_session(session)
-    client = session.client("ssm")
+    client = get_cached_client(session, "ssm")
     try:
         return client.get_parameter(Name=ssm_parameter.Default)["Parameter"]["Value"]
     except (client.exceptions.InvalidKeyId, client.exceptions.ParameterNotFound):
@@ -172,22 +175,22 @@ class ServiceImage:
         ]
         try:
             original_image = self.image
-            dkr_client = docker.APIClient()
-            image_details = dkr_client.inspect_distribution(self.image)
-            if not keyisset("Descriptor", image_details):
-                raise KeyError(f"No information retrieved for {self.image}")
+            details = IMAGES_DIGESTS.get_descriptor(self.image)
         except (docker.errors.APIError, docker.errors.DockerException) as error:
             LOG.error(f"Failed to retrieve the image digest for {self.image}: {error}")
-            image_details = {}
-        except (FileNotFoundError, urllib3.exceptions, requests.exceptions) as error:
-            LOG.error("Failed to connect to any docker engine: {error}")
-            image_details = {}
-        if not image_details:
+            details = {}
+        except (
+            FileNotFoundError,
+            urllib3.exceptions.HTTPError,
+            requests.exceptions.RequestException,
+        ) as error:
+            LOG.error(f"Failed to connect to any docker engine: {error}")
+            details = {}
+        if not details:
             LOG.warn(
                 f"services.{self.service.name}: Failed to interpolate Docker image tag with digest"
             )
             return
-        details = image_details["Descriptor"]
         if (
             keyisset("mediaType", details)
             and details["mediaType"] not in valid_media_types
@@ -223,3 +226,27 @@ class ServiceImage:
             LOG.warning(
                 "No digest found. This might be due to Registry API prior to V2"
             )
+
+
+def interpolate_services_images_digests(
+    services: list[ComposeService], settings: ComposeXSettings
+) -> None:
+    """
+    Resolves the images digests of the services concurrently. The services using the same image share the same
+    lookup.
+
+    :param list[ComposeService] services:
+    :param ComposeXSettings settings:
+    """
+    if not services:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(DIGESTS_WORKERS, len(services)),
+        thread_name_prefix="image-digest",
+    ) as executor:
+        futures = [
+            executor.submit(service.image.interpolate_image_digest, settings)
+            for service in services
+        ]
+    for future in futures:
+        future.result()
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
 
@@ -24,6 +26,7 @@ from ecs_composex.compose.compose_services.service_image.ecr_helpers import (
 
 try:
     from ecs_composex.compose.compose_services.service_image.ecr_scans_eval import (
+        SCAN_WAIT_TIMEOUT,
         scan_service_image,
     )
 
@@ -32,13 +35,27 @@ except ImportError as error:
     SCANS_POSSIBLE = False
     warnings.warn(str(error))
 
+ECR_SCANS_WORKERS = 10
+
+
+def evaluate_service_image(
+    service, settings: ComposeXSettings, deadline: float
+) -> tuple[bool, list[str], list[str]]:
+    """
+    Identifies the service image in ECR and evaluates its scan report
+    """
+    service_image = define_service_image(service, settings)
+    return scan_service_image(service, settings, service_image, deadline)
+
 
 def evaluate_ecr_configs(settings: ComposeXSettings) -> int:
     """
     Function to go over each service of each family in its final state and evaluate the ECR Image validity.
+    The images are evaluated concurrently, all waiting for their scan report until the same deadline.
     """
     if not SCANS_POSSIBLE:
         return 0
+    services: list = []
     for family in settings.families.values():
         for service in family.services:
             x_ecr_config = set_else_none("x-ecr", service.definition)
@@ -50,29 +67,40 @@ def evaluate_ecr_configs(settings: ComposeXSettings) -> int:
                     )
                 )
                 continue
-            service_image = define_service_image(service, settings)
-            scan_pass, findings, failed_findings = scan_service_image(
-                service, settings, service_image
+            services.append((family, service))
+    if not services:
+        return 0
+    deadline = monotonic() + SCAN_WAIT_TIMEOUT
+    with ThreadPoolExecutor(
+        max_workers=min(ECR_SCANS_WORKERS, len(services)),
+        thread_name_prefix="ecr-scan",
+    ) as executor:
+        futures = [
+            executor.submit(evaluate_service_image, service, settings, deadline)
+            for _, service in services
+        ]
+    result = 0
+    for (family, service), future in zip(services, futures):
+        scan_pass, findings, failed_findings = future.result()
+        LOG.debug("%s %s %s", scan_pass, findings, failed_findings)
+        if scan_pass and not findings:
+            LOG.info(
+                f"{family.name}.{service.name} - ECR Scan Pass (No vulnerabilities found)"
             )
-            LOG.debug("%s %s %s", scan_pass, findings, failed_findings)
-            if scan_pass and not findings:
-                LOG.info(
-                    f"{family.name}.{service.name} - ECR Scan Pass (No vulnerabilities found)"
+            continue
+        if findings:
+            LOG.warn(
+                "{}.{} - ECR Scan Findings(LEVEL:findings/threshold): {}".format(
+                    family.name, service.name, "|".join(findings)
                 )
-                return 0
-            if findings:
-                LOG.warn(
-                    "{}.{} - ECR Scan Findings(LEVEL:findings/threshold): {}".format(
-                        family.name, service.name, "|".join(findings)
+            )
+            if failed_findings:
+                LOG.error(
+                    "{}.{} - Findings above thresholds: {}".format(
+                        family.name, service.name, "|".join(failed_findings)
                     )
                 )
-                if failed_findings:
-                    LOG.error(
-                        "{}.{} - Findings above thresholds: {}".format(
-                            family.name, service.name, "|".join(failed_findings)
-                        )
-                    )
-            if not scan_pass and not settings.ignore_ecr_findings:
-                LOG.error(f"{family.name}.{service.name} - vulnerabilities found")
-                return 1
-    return 0
+        if not scan_pass and not settings.ignore_ecr_findings:
+            LOG.error(f"{family.name}.{service.name} - vulnerabilities found")
+            result = 1
+    return result
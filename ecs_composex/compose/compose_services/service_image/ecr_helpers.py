@@ -3,11 +3,11 @@
 
 import re
 
-from boto3.session import Session
-from compose_x_common.aws.ecr.images import list_all_images
 from compose_x_common.compose_x_common import keyisset, set_else_none
 
 from ecs_composex.common.aws import get_cross_role_session
+from ecs_composex.common.aws_cache import get_account_id, get_cached_client
+from ecs_composex.common.aws_sessions import SESSIONS_BROKER
 from ecs_composex.common.logging import LOG
 
 ECR_URI_RE = re.compile(
@@ -18,7 +18,8 @@ ECR_URI_RE = re.compile(
 
 def define_ecr_session(account_id, repo_name, region, settings, role_arn=None):
     """
-    Function to determine the boto3 session to use for subsequent API calls to ECR
+    Function to determine the boto3 session to use for subsequent API calls to ECR.
+    Sessions are shared for the execution, by role ARN and region.
     :param account_id:
     :param repo_name:
     :param region:
@@ -26,8 +27,7 @@ def define_ecr_session(account_id, repo_name, region, settings, role_arn=None):
     :param str role_arn:
     :return:
     """
-    ecr_session = Session(region_name=region)
-    current_account_id = settings.session.client("sts").get_caller_identity()["Account"]
+    current_account_id = get_account_id(settings.session)
     if account_id != current_account_id and role_arn is None:
         raise KeyError(
             f"The account for repository {repo_name} detected from image URI is in account "
@@ -40,37 +40,39 @@ def define_ecr_session(account_id, repo_name, region, settings, role_arn=None):
             region_name=region,
             session_name="ecr-scan@compose-x",
         )
+    else:
+        ecr_session = SESSIONS_BROKER.regional_session(settings.session, region)
     return ecr_session
 
 
 def identify_service_image(service, repo_name, image_sha, image_tag, session):
     """
     Function to identify the image in repository that matches the one defined in service
-    for a private ECR Based image.
+    for a private ECR Based image. Describes only that image, by digest or tag.
 
     :param str repo_name:
     :param str image_sha:
     :param str image_tag:
     :param boto3.session.Session session:
-    :return: The image definition
+    :return: The image ID, with imageDigest and imageTag if the image is defined by tag
     :rtype: dict
     """
-    repo_images = list_all_images(repo_name=repo_name, ecr_session=session)
-    for image in repo_images:
-        if (
-            image_sha
-            and keyisset("imageDigest", image)
-            and image["imageDigest"] == image_sha
-        ) or (
-            image_tag and keyisset("imageTag", image) and image["imageTag"] == image_tag
-        ):
-            return image
-    else:
-        raise LookupError(
-            "Unable to find image",
-            service.image.image_uri,
-            "Deployment would result in failure.",
-        )
+    image_id = {"imageDigest": image_sha} if image_sha else {"imageTag": image_tag}
+    client = get_cached_client(session, "ecr")
+    try:
+        images_r = client.describe_images(repositoryName=repo_name, imageIds=[image_id])
+    except client.exceptions.ImageNotFoundException:
+        images_r = {}
+    for image in set_else_none("imageDetails", images_r, alt_value=[]):
+        if keyisset("imageDigest", image):
+            if image_sha:
+                return {"imageDigest": image["imageDigest"]}
+            return {"imageDigest": image["imageDigest"], "imageTag": image_tag}
+    raise LookupError(
+        "Unable to find image",
+        service.image.image_uri,
+        "Deployment would result in failure.",
+    )
 
 
 def interpolate_ecr_uri_tag_with_digest(image_url, image_digest):
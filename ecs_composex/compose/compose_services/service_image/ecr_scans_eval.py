@@ -4,7 +4,8 @@
 from __future__ import annotations
 
 import re
-from time import sleep
+from random import uniform
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
@@ -21,6 +22,7 @@ except ImportError:
     raise ImportError(
         "Run pip install ecs-composex[ecrscan] to enable this functionality."
     )
+from ecs_composex.common.aws_cache import get_client
 from ecs_composex.common.logging import LOG
 
 from .ecr_helpers import define_ecr_session
@@ -30,6 +32,10 @@ ECR_URI_RE = re.compile(
     r"(?P<repo_name>[a-zA-Z0-9-_./]+)(?P<tag>(?:\@sha[\d]+:[a-z-Z0-9]+$)|(?::[\S]+$))"
 )
 
+SCAN_POLL_INITIAL_DELAY = 2
+SCAN_POLL_MAX_DELAY = 30
+SCAN_WAIT_TIMEOUT = 900
+
 
 def initial_scan_retrieval(
     registry, repository_name, image, service_image, trigger_scan, ecr_session=None
@@ -48,7 +54,7 @@ def initial_scan_retrieval(
     """
     if ecr_session is None:
         ecr_session = Session()
-    client = ecr_session.client("ecr")
+    client = get_client(ecr_session, "ecr")
     try:
         image_scan_r = client.describe_image_scan_findings(
             registryId=registry, repositoryName=repository_name, imageId=image
@@ -72,6 +78,28 @@ def initial_scan_retrieval(
             return None
 
 
+def poll_delays(
+    deadline: float,
+    initial_delay: float = SCAN_POLL_INITIAL_DELAY,
+    max_delay: float = SCAN_POLL_MAX_DELAY,
+):
+    """
+    Generates the delays to wait for between two polls, growing exponentially with jitter, until the deadline.
+
+    :param float deadline: monotonic time after which to stop polling
+    :param float initial_delay:
+    :param float max_delay:
+    """
+    attempt = 0
+    while True:
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return
+        delay = min(max_delay, initial_delay * (2**attempt))
+        yield min(remaining, delay / 2 + uniform(0, delay / 2))
+        attempt += 1
+
+
 def scan_poll_and_wait(
     registry,
     repository_name,
@@ -80,30 +108,40 @@ def scan_poll_and_wait(
     ecr_session=None,
     scan_frequency: str = None,
     scan_on_push: bool = False,
+    deadline: float = None,
 ):
-    """Function to pull the scans results until no longer in progress"""
-    client = ecr_session.client("ecr")
-    while True:
+    """
+    Function to pull the scans results until no longer in progress, with exponential backoff.
+    Gives up and returns None once the deadline is passed.
+    """
+    if deadline is None:
+        deadline = monotonic() + SCAN_WAIT_TIMEOUT
+    client = get_client(ecr_session, "ecr")
+    for delay in poll_delays(deadline):
         try:
             image_scan_r = client.describe_image_scan_findings(
                 registryId=registry,
                 repositoryName=repository_name,
                 imageId=image,
             )
-            if image_scan_r["imageScanStatus"]["status"] in ["IN_PROGRESS", "PENDING"]:
-                LOG.info(
-                    f"{image_url.image_uri} - Scan in progress - waiting 10 seconds"
-                )
-                sleep(10)
-            else:
+            if image_scan_r["imageScanStatus"]["status"] not in [
+                "IN_PROGRESS",
+                "PENDING",
+            ]:
                 return image_scan_r
+            LOG.info(
+                f"{image_url.image_uri} - Scan in progress - waiting {delay:.1f} seconds"
+            )
         except client.exceptions.ScanNotFoundException:
             if scan_frequency and scan_frequency == "CONTINUOUS_SCAN" and scan_on_push:
                 LOG.info(f"{image_url.image_uri} - Pending enhanced scan")
-                sleep(10)
         except client.exceptions.LimitExceededException:
-            LOG.warn(f"{image_url} - Exceeding API Calls quota. Waiting 10 seconds")
-            sleep(10)
+            LOG.warn(
+                f"{image_url} - Exceeding API Calls quota. Waiting {delay:.1f} seconds"
+            )
+        sleep(delay)
+    LOG.error(f"{image_url.image_uri} - Timed out waiting for the scan report")
+    return None
 
 
 def wait_for_scan_report(
@@ -113,6 +151,7 @@ def wait_for_scan_report(
     image_url: ServiceImage,
     trigger_scan=False,
     ecr_session=None,
+    deadline: float = None,
 ) -> dict[str, Union[dict, str]]:
     """
     Function to wait for the scan report to go from In Progress to else
@@ -123,6 +162,7 @@ def wait_for_scan_report(
     :param str image_url::
     :param bool trigger_scan:
     :param boto3.session.Session ecr_session:
+    :param float deadline: monotonic time after which to stop waiting for the scan report
     :return:
     """
     if not ecr_session:
@@ -131,8 +171,8 @@ def wait_for_scan_report(
     scan_frequency = None
     scan_on_push = False
     try:
-        scanning_config = ecr_session.client(
-            "ecr"
+        scanning_config = get_client(
+            ecr_session, "ecr"
         ).batch_get_repository_scanning_configuration(
             repositoryNames=[repository_name]
         )[
@@ -173,6 +213,7 @@ def wait_for_scan_report(
             ecr_session,
             scan_frequency,
             scan_on_push,
+            deadline,
         )
 
     if image_scan_r is None:
@@ -272,7 +313,7 @@ def validate_the_image_input(the_image):
 
 
 def scan_service_image(
-    service, settings, the_image: dict = None
+    service, settings, the_image: dict = None, deadline: float = None
 ) -> tuple[bool, list[str], list[str]]:
     """
     Function to review the service definition and evaluate scan if properties defined
@@ -280,6 +321,7 @@ def scan_service_image(
     :param ecs_composex.common.compose_services.ComposeService service:
     :param ecs_composex.common.settings.ComposeXSettings settings: The settings for the execution
     :param the_image: The image to use for scanning references.
+    :param float deadline: monotonic time after which to stop waiting for the scan report
     """
     region = None
     if validate_input(service):
@@ -311,6 +353,7 @@ def scan_service_image(
         image=the_image,
         image_url=service.image,
         ecr_session=session,
+        deadline=deadline,
     )
     return define_result(
         service.image, security_findings, thresholds, vulnerability_config
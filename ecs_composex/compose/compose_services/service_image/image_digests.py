@@ -0,0 +1,98 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Execution scoped resolver of the images digests from their registry, via the docker engine.
+
+All the services, and the managed sidecars, share the same docker client, and each image is inspected only once:
+concurrent lookups of the same image wait for the first one to complete. When the lookup cache is enabled, the
+registry descriptors are also stored on disk, with a short TTL, as images tags move.
+"""
+
+from __future__ import annotations
+
+from threading import Lock, RLock
+
+import docker
+from compose_x_common.compose_x_common import keyisset
+
+from ecs_composex.common.aws_cache import AWS_CACHE
+from ecs_composex.common.logging import LOG
+
+DOCKER_CACHE_ACCOUNT = "docker"
+INSPECT_DISTRIBUTION_OPERATION = "docker.inspect_distribution"
+DIGESTS_WORKERS = 10
+
+
+class ImageDigestResolver:
+    """
+    Inspects the images distribution with a shared docker client, once per image.
+
+    :ivar dict descriptors: the registry descriptors, by image
+    """
+
+    def __init__(self):
+        self.descriptors: dict = {}
+        self._client = None
+        self._images_locks: dict = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.descriptors.clear()
+            self._images_locks.clear()
+            self._client = None
+
+    @property
+    def client(self) -> docker.APIClient:
+        with self._lock:
+            if self._client is None:
+                self._client = docker.APIClient()
+            return self._client
+
+    def image_lock(self, image: str) -> Lock:
+        with self._lock:
+            if image not in self._images_locks:
+                self._images_locks[image] = Lock()
+            return self._images_locks[image]
+
+    def get_descriptor(self, image: str) -> dict:
+        """
+        Returns the registry descriptor of the image, with its mediaType and digest.
+
+        :param str image:
+        :rtype: dict
+        :raises: KeyError if the registry returned no descriptor
+        """
+        with self.image_lock(image):
+            if image in self.descriptors:
+                return self.descriptors[image]
+            persistent = AWS_CACHE.persistent
+            descriptor = (
+                persistent.get(
+                    DOCKER_CACHE_ACCOUNT, None, INSPECT_DISTRIBUTION_OPERATION, image
+                )
+                if persistent
+                else None
+            )
+            if descriptor is not None:
+                LOG.debug(f"{image} - Using lookup cache descriptor")
+            else:
+                image_details = self.client.inspect_distribution(image)
+                if not keyisset("Descriptor", image_details):
+                    raise KeyError(f"No information retrieved for {image}")
+                descriptor = image_details["Descriptor"]
+                if persistent:
+                    persistent.put(
+                        DOCKER_CACHE_ACCOUNT,
+                        None,
+                        INSPECT_DISTRIBUTION_OPERATION,
+                        image,
+                        descriptor,
+                    )
+            with self._lock:
+                self.descriptors[image] = descriptor
+            return descriptor
+
+
+IMAGES_DIGESTS = ImageDigestResolver()
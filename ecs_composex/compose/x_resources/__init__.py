@@ -15,17 +15,14 @@ if TYPE_CHECKING:
 import json
 import re
 from copy import deepcopy
-from os import path
 
 import jsonschema
-from compose_x_common.aws import get_account_id
 from compose_x_common.compose_x_common import (
     attributes_to_mapping,
     keyisset,
     keypresent,
     set_else_none,
 )
-from importlib_resources import files as pkg_files
 from troposphere import AWSObject, Export, FindInMap, GetAtt, Join, Output, Ref, Sub
 from troposphere.ecs import Environment
 
@@ -34,10 +31,12 @@ from ecs_composex.common.aws import (
     define_lookup_role_from_info,
     find_aws_resource_arn_from_tags_api,
 )
+from ecs_composex.common.aws_cache import get_account_id, get_cached_client
 from ecs_composex.common.cfn_conditions import define_stack_name
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.ecs_composex import CFN_EXPORT_DELIMITER as DELIM
 from ecs_composex.common.ecs_composex import TAGS_SEPARATOR, X_KEY
+from ecs_composex.common.json_schemas import SCHEMAS_VALIDATORS
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.troposphere_tools import (
     add_parameters,
@@ -113,6 +112,8 @@ class XResource:
         self.stack = None
         self.ref_parameter = None
         self.lookup_properties = {}
+        self.lookup_resolved = False
+        self.lookup_error = None
         self.mappings = {}
         self.default_tags = {
             f"compose-x{TAGS_SEPARATOR}module": self.module.mod_key,
@@ -171,25 +172,23 @@ class XResource:
         """
 
     def validate_schema(
-        self, name, definition, module_name, module_schema: str = None
+        self, name, definition, module_name, module_schema: dict = None
     ) -> None:
         """
-        JSON Validation of the resources module validation
+        JSON Validation of the resources module validation. Skipped if the module already validated the definition.
         """
         if not self.module.json_schema and not module_schema:
             return
-        resolver_source = pkg_files("ecs_composex").joinpath("specs/compose-spec.json")
-        LOG.debug(f"Validating against input schema {resolver_source}")
-        resolver = jsonschema.RefResolver(
-            base_uri=f"file://{path.abspath(path.dirname(resolver_source))}/",
-            referrer=self.module.json_schema,
-        )
+        if (
+            not module_schema
+            and self.module.validated_definitions.get(name) is definition
+        ):
+            return
         try:
-            jsonschema.validate(
-                definition,
-                module_schema if module_schema else self.module.json_schema,
-                resolver=resolver,
-            )
+            if module_schema:
+                SCHEMAS_VALIDATORS.new_validator(module_schema).validate(definition)
+            else:
+                SCHEMAS_VALIDATORS.validate(self.module.json_schema_path, definition)
         except jsonschema.exceptions.ValidationError:
             LOG.error(f"{module_name}.{name} - Definition is not conform to schema.")
             raise
@@ -201,7 +200,7 @@ class XResource:
         Method to map the resource properties to the CCAPI description
         :return:
         """
-        client = self.lookup_session.client("cloudcontrol")
+        client = get_cached_client(self.lookup_session, "cloudcontrol")
         try:
             props_r = client.get_resource(
                 TypeName=resource_type, Identifier=resource_id, **kwargs
@@ -224,6 +223,29 @@ class XResource:
             return conform_mapping
         return properties
 
+    @property
+    def lookup_arguments(self) -> Union[dict, None]:
+        """
+        Arguments to lookup_resource to identify the resource defined with Lookup.
+        None if the resource cannot be looked up via lookup_resource.
+        """
+        return None
+
+    def resolve_lookup(self) -> None:
+        """
+        Looks up the resource with lookup_resource once for the execution. The lookup results are stored on the
+        resource, so when the lookups phase already resolved it, the stacks construction re-uses them, or raises the
+        error the lookup failed with.
+        """
+        if not self.lookup_resolved:
+            try:
+                self.lookup_resource(**self.lookup_arguments)
+            except Exception as error:
+                self.lookup_error = error
+            self.lookup_resolved = True
+        if self.lookup_error:
+            raise self.lookup_error
+
     def init_outputs(self):
         """
         Placeholder method
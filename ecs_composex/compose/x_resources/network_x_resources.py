@@ -102,6 +102,7 @@ class NetworkXResource(ServicesXResource):
                     "- Launch Type not supported (EXTERNAL)"
                 )
                 self.families_scaling.remove(target)
+        self.index_families_targets()
         self.remove_services_after_family_cleanups()
 
     def set_override_subnets(self) -> None:
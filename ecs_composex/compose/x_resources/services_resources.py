@@ -36,12 +36,45 @@ class ServicesXResource(XResource):
         self.services = []
         self.families_targets: list = []
         self.families_scaling = []
+        self._targets_families_names: set = set()
+        self._scaling_families_names: set = set()
         self.arn_parameter = None
         super().__init__(name, definition, module, settings)
         self.services = set_else_none("Services", definition, alt_value={})
         self.set_services_targets(settings)
         self.set_services_scaling(settings)
 
+    def add_family_target(self, target: tuple) -> None:
+        """
+        Adds the target to families_targets, and indexes its family name for is_family_target
+        """
+        self.families_targets.append(target)
+        self._targets_families_names.add(target[0].name)
+
+    def add_family_scaling_target(self, target: tuple) -> None:
+        """
+        Adds the target to families_scaling, and indexes its family name for is_family_scaling_target
+        """
+        self.families_scaling.append(target)
+        self._scaling_families_names.add(target[0].name)
+
+    def index_families_targets(self) -> None:
+        """
+        Re-indexes the families names of the targets, once targets have been removed
+        """
+        self._targets_families_names = {
+            target[0].name for target in self.families_targets
+        }
+        self._scaling_families_names = {
+            target[0].name for target in self.families_scaling
+        }
+
+    def is_family_target(self, family_name: str) -> bool:
+        return family_name in self._targets_families_names
+
+    def is_family_scaling_target(self, family_name: str) -> bool:
+        return family_name in self._scaling_families_names
+
     def debug_families_targets(self):
         """
         Method to troubleshoot family and service mapping
@@ -80,13 +113,11 @@ class ServicesXResource(XResource):
         """
         name_key = get_setting_key("name", service_def)
         access_key = get_setting_key("access", service_def)
-        the_service = [s for s in settings.services if s.name == service_def[name_key]][
-            0
-        ]
+        the_service = settings.resources_registry.get_service(service_def[name_key])
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_targets]:
-                self.families_targets.append(
+            if not self.is_family_target(family_name):
+                self.add_family_target(
                     (
                         settings.families[family_name],
                         False,
@@ -108,10 +139,10 @@ class ServicesXResource(XResource):
             name_key = get_setting_key("name", service)
             access_key = get_setting_key("access", service)
             service_name = service[name_key]
-            if service_name in settings.families and service_name not in [
-                f[0].name for f in self.families_targets
-            ]:
-                self.families_targets.append(
+            if service_name in settings.families and not self.is_family_target(
+                service_name
+            ):
+                self.add_family_target(
                     (
                         settings.families[service_name],
                         True,
@@ -120,13 +151,13 @@ class ServicesXResource(XResource):
                         service,
                     )
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_targets
-            ]:
+            elif service_name in settings.families and self.is_family_target(
+                service_name
+            ):
                 LOG.debug(
                     f"{self.module.res_key}.{self.name} - Family {service_name} has already been added. Skipping"
                 )
-            elif service_name in [s.name for s in settings.services]:
+            elif service_name in settings.resources_registry.services:
                 self.handle_families_targets_expansion_list(
                     service_name, service, settings
                 )
@@ -138,19 +169,16 @@ class ServicesXResource(XResource):
         Method to list all families and services that are targets of the resource.
         Allows to implement family and service level association to resource
         """
-        for svc in settings.services:
-            if svc.name == service_name:
-                the_service = svc
-                break
-        else:
+        the_service = settings.resources_registry.get_service(service_name)
+        if the_service is None:
             raise KeyError(
                 f"Service {service_name} not found in ",
                 [_svc.name for _svc in settings.services],
             )
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_targets]:
-                self.families_targets.append(
+            if not self.is_family_target(family_name):
+                self.add_family_target(
                     (
                         settings.families[family_name],
                         False,
@@ -169,15 +197,13 @@ class ServicesXResource(XResource):
         Deals with services set as a dict
         """
         for service_name, service_def in self.services.items():
-            if service_name in settings.family_names and service_name not in [
-                tgt[0].name for tgt in self.families_targets
-            ]:
-                for family in settings.families.values():
-                    if family.name == service_name:
-                        break
-                else:
-                    raise ValueError("Failed to map service_name to families")
-                self.families_targets.append(
+            family = settings.resources_registry.get_family(service_name)
+            if (
+                family
+                and family.name == service_name
+                and not self.is_family_target(service_name)
+            ):
+                self.add_family_target(
                     (
                         family,
                         True,
@@ -186,13 +212,13 @@ class ServicesXResource(XResource):
                         service_def,
                     )
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_targets
-            ]:
+            elif service_name in settings.families and self.is_family_target(
+                service_name
+            ):
                 LOG.debug(
                     f"{self.module.res_key}.{self.name} - Family {service_name} has already been added. Skipping"
                 )
-            elif service_name in settings.service_names:
+            elif service_name in settings.resources_registry.services:
                 self.handle_families_targets_expansion_dict(
                     service_name, service_def, settings
                 )
@@ -232,11 +258,11 @@ class ServicesXResource(XResource):
         """
         name_key = get_setting_key("name", service)
         scaling_key = get_setting_key("scaling", service)
-        the_service = [s for s in settings.services if s.name == service[name_key]][0]
+        the_service = settings.resources_registry.get_service(service[name_key])
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_scaling]:
-                self.families_scaling.append(
+            if not self.is_family_scaling_target(family_name):
+                self.add_family_scaling_target(
                     (settings.families[family_name], service[scaling_key])
                 )
 
@@ -258,19 +284,19 @@ class ServicesXResource(XResource):
                 )
                 continue
             service_name = service[name_key]
-            if service_name in settings.families and service_name not in [
-                f[0].name for f in self.families_scaling
-            ]:
-                self.families_scaling.append(
+            if service_name in settings.families and not self.is_family_scaling_target(
+                service_name
+            ):
+                self.add_family_scaling_target(
                     (settings.families[service_name], service[scaling_key])
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_scaling
-            ]:
+            elif service_name in settings.families and self.is_family_scaling_target(
+                service_name
+            ):
                 LOG.debug(
                     f"{self.module.res_key}.{self.name} - Family {service_name} has already been added. Skipping"
                 )
-            elif service_name in [s.name for s in settings.services]:
+            elif service_name in settings.resources_registry.services:
                 self.handle_family_scaling_expansion(service, settings)
 
     def handle_families_scaling_expansion_dict(self, service_name, service, settings):
@@ -282,11 +308,11 @@ class ServicesXResource(XResource):
         :param dict service: Service definition in compose file
         :param ecs_composex.common.settings.ComposeXSettings settings: Execution settings
         """
-        the_service = [s for s in settings.services if s.name == service_name][0]
+        the_service = settings.resources_registry.get_service(service_name)
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_scaling]:
-                self.families_scaling.append(
+            if not self.is_family_scaling_target(family_name):
+                self.add_family_scaling_target(
                     (
                         settings.families[family_name],
                         service["Scaling"],
@@ -305,22 +331,22 @@ class ServicesXResource(XResource):
                     f"{self.module.res_key}.{self.name} - No Scaling set for {service_name}"
                 )
                 continue
-            if service_name in settings.families and service_name not in [
-                f[0].name for f in self.families_scaling
-            ]:
-                self.families_scaling.append(
+            if service_name in settings.families and not self.is_family_scaling_target(
+                service_name
+            ):
+                self.add_family_scaling_target(
                     (
                         settings.families[service_name],
                         service_def["Scaling"],
                     )
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_scaling
-            ]:
+            elif service_name in settings.families and self.is_family_scaling_target(
+                service_name
+            ):
                 LOG.debug(
                     f"{self.module.res_key}.{self.name} - Family {service_name} has already been added. Skipping"
                 )
-            elif service_name in [s.name for s in settings.services]:
+            elif service_name in settings.resources_registry.services:
                 self.handle_families_scaling_expansion_dict(
                     service_name, service_def, settings
                 )
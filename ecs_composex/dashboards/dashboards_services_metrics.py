@@ -154,3 +154,262 @@ class ServiceEcsWidget:
                 },
             },
         ]
+
+
+BACKLOG_METRICS = {
+    "x-sqs": (
+        "AWS/SQS",
+        "QueueName",
+        [
+            ("ApproximateNumberOfMessagesVisible", "Maximum", "left"),
+            ("NumberOfMessagesDeleted", "Sum", "left"),
+            ("ApproximateAgeOfOldestMessage", "Maximum", "right"),
+        ],
+    ),
+    "x-kinesis": (
+        "AWS/Kinesis",
+        "StreamName",
+        [
+            ("WriteProvisionedThroughputExceeded", "Sum", "left"),
+            ("ReadProvisionedThroughputExceeded", "Sum", "left"),
+            ("GetRecords.IteratorAgeMilliseconds", "Maximum", "right"),
+        ],
+    ),
+}
+
+
+def set_widgets_layout(
+    widgets: list, y_index: int, columns: int = 3, height: int = 6
+) -> int:
+    """
+    Lays the widgets out in rows of ``columns`` widgets, from y_index
+
+    :param list[dict] widgets:
+    :param int y_index:
+    :param int columns:
+    :param int height:
+    :return: the height of the rows
+    :rtype: int
+    """
+    width = 24 // columns
+    for count, widget in enumerate(widgets):
+        widget.update(
+            {
+                "height": height,
+                "width": width,
+                "y": y_index + (count // columns) * height,
+                "x": (count % columns) * width,
+            }
+        )
+    return -(-len(widgets) // columns) * height
+
+
+def metric_widget(title: str, metrics: list, **properties) -> dict:
+    return {
+        "type": "metric",
+        "properties": dict(
+            {
+                "title": title,
+                "view": "timeSeries",
+                "stacked": False,
+                "metrics": metrics,
+                "region": f"${{{AWS_REGION}}}",
+                "period": 60,
+            },
+            **properties,
+        ),
+    }
+
+
+class FamilyPerformanceWidgets:
+    """
+    Class to manage the performance widgets of an ECS Service: latency, errors and requests of its target groups,
+    tasks scaling and saturation, and backlog of the queues and streams it is linked to.
+    """
+
+    def __init__(
+        self,
+        service_name,
+        service_param,
+        cluster_param,
+        target_groups: list = None,
+        backlogs: list = None,
+        y_index=0,
+    ):
+        """
+
+        :param str service_name:
+        :param troposhere.AWSHelperFn service_param:
+        :param troposhere.AWSHelperFn cluster_param:
+        :param list[tuple] target_groups: the target groups name, full name and LB full name parameters, and LB type
+        :param list[tuple] backlogs: the resources name, module res_key and name parameter
+        """
+        service_dimensions = [
+            "ServiceName",
+            f"${{{service_param.title}}}",
+            "ClusterName",
+            f"${{{cluster_param.title}}}",
+        ]
+        widgets = [
+            metric_widget(
+                "Tasks scaling",
+                [
+                    [
+                        "ECS/ContainerInsights",
+                        "DesiredTaskCount",
+                        *service_dimensions,
+                        {"stat": "Maximum"},
+                    ],
+                    [".", "RunningTaskCount", ".", ".", ".", ".", {"stat": "Maximum"}],
+                    [".", "PendingTaskCount", ".", ".", ".", ".", {"stat": "Maximum"}],
+                ],
+            ),
+            metric_widget(
+                "Saturation",
+                [
+                    [
+                        "AWS/ECS",
+                        "CPUUtilization",
+                        *service_dimensions,
+                        {"stat": "Maximum"},
+                    ],
+                    [".", "MemoryUtilization", ".", ".", ".", ".", {"stat": "Maximum"}],
+                ],
+                yAxis={"left": {"min": 0, "max": 100}},
+            ),
+        ]
+        for target_group in target_groups if target_groups else []:
+            widgets += self.target_group_widgets(*target_group)
+        for backlog in backlogs if backlogs else []:
+            widgets.append(self.backlog_widget(*backlog))
+        heading = {
+            "height": 1,
+            "width": 24,
+            "y": y_index,
+            "x": 0,
+            "type": "text",
+            "properties": {"markdown": f"## Service {service_name} performance\n"},
+        }
+        self.height = 1 + set_widgets_layout(widgets, y_index + 1)
+        self.widgets = [heading] + widgets
+
+    @staticmethod
+    def target_group_widgets(name, tgt_param, lb_param, lb_type) -> list:
+        """
+        Latency percentiles, requests and 5XX rate for ALB target groups. Flows and resets for NLB target groups.
+        """
+        dimensions = [
+            "TargetGroup",
+            f"${{{tgt_param.title}}}",
+            "LoadBalancer",
+            f"${{{lb_param.title}}}",
+        ]
+        if lb_type == "network":
+            return [
+                metric_widget(
+                    f"{name} - Flows",
+                    [
+                        [
+                            "AWS/NetworkELB",
+                            "NewFlowCount",
+                            *dimensions,
+                            {"stat": "Sum"},
+                        ],
+                        [
+                            ".",
+                            "ActiveFlowCount",
+                            ".",
+                            ".",
+                            ".",
+                            ".",
+                            {"stat": "Average"},
+                        ],
+                    ],
+                ),
+                metric_widget(
+                    f"{name} - Resets and health",
+                    [
+                        [
+                            "AWS/NetworkELB",
+                            "TCP_Target_Reset_Count",
+                            *dimensions,
+                            {"stat": "Sum"},
+                        ],
+                        [
+                            ".",
+                            "UnHealthyHostCount",
+                            ".",
+                            ".",
+                            ".",
+                            ".",
+                            {"stat": "Maximum"},
+                        ],
+                    ],
+                ),
+            ]
+        return [
+            metric_widget(
+                f"{name} - Latency",
+                [
+                    [
+                        "AWS/ApplicationELB",
+                        "TargetResponseTime",
+                        *dimensions,
+                        {"stat": "p50", "label": "p50"},
+                    ],
+                    ["...", {"stat": "p90", "label": "p90"}],
+                    ["...", {"stat": "p99", "label": "p99"}],
+                ],
+            ),
+            metric_widget(
+                f"{name} - Requests and errors",
+                [
+                    [
+                        "AWS/ApplicationELB",
+                        "RequestCountPerTarget",
+                        *dimensions,
+                        {"stat": "Sum"},
+                    ],
+                    [
+                        {
+                            "expression": "100 * errors / requests",
+                            "label": "5XX %",
+                            "id": "rate5xx",
+                            "yAxis": "right",
+                        }
+                    ],
+                    [
+                        "AWS/ApplicationELB",
+                        "RequestCount",
+                        *dimensions,
+                        {"stat": "Sum", "id": "requests", "visible": False},
+                    ],
+                    [
+                        ".",
+                        "HTTPCode_Target_5XX_Count",
+                        ".",
+                        ".",
+                        ".",
+                        ".",
+                        {"stat": "Sum", "id": "errors", "visible": False},
+                    ],
+                ],
+            ),
+        ]
+
+    @staticmethod
+    def backlog_widget(name, res_key, name_param) -> dict:
+        namespace, dimension, metrics = BACKLOG_METRICS[res_key]
+        return metric_widget(
+            f"{name} - Backlog",
+            [
+                [
+                    namespace if not count else ".",
+                    metric,
+                    dimension if not count else ".",
+                    f"${{{name_param.title}}}" if not count else ".",
+                    {"stat": stat, "yAxis": axis},
+                ]
+                for count, (metric, stat, axis) in enumerate(metrics)
+            ],
+        )
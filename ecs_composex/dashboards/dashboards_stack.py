@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 
 import json
 
-from compose_x_common.compose_x_common import keyisset
+from compose_x_common.compose_x_common import keyisset, keypresent
 from troposphere import GetAtt, Output, Parameter, Sub
 from troposphere.cloudwatch import Dashboard as CWDashboard
 
@@ -30,8 +30,20 @@ from ecs_composex.common.troposphere_tools import (
     add_parameters,
     build_template,
 )
-from ecs_composex.dashboards.dashboards_services_metrics import ServiceEcsWidget
+from ecs_composex.dashboards.dashboards_services_metrics import (
+    FamilyPerformanceWidgets,
+    ServiceEcsWidget,
+)
 from ecs_composex.ecs.ecs_params import CLUSTER_NAME, SERVICE_T
+from ecs_composex.elbv2.elbv2_params import LB_FULL_NAME, TGT_FULL_NAME
+from ecs_composex.kinesis.kinesis_params import STREAM_ID
+from ecs_composex.resource_settings import get_parameter_settings
+from ecs_composex.sqs.sqs_params import SQS_NAME
+
+BACKLOG_NAME_PARAMETERS = {
+    "x-sqs": SQS_NAME,
+    "x-kinesis": STREAM_ID,
+}
 
 
 def get_family_from_name(settings: ComposeXSettings, name: str) -> ComposeFamily | None:
@@ -78,11 +90,88 @@ def retrieve_services(
         x_stack.Parameters.update(
             {s_param.title: GetAtt(family.stack.title, f"Outputs.{s_param.title}")}
         )
-        services_params.append((family.stack.title, s_param))
+        services_params.append((family.stack.title, s_param, family))
     add_parameters(x_stack.stack_template, [value[1] for value in services_params])
     return services_params
 
 
+def import_resource_parameter(resource, parameter, x_stack: ComposeXStack):
+    """
+    Adds the parameter for the resource attribute to the dashboards stack, and sets its value from the resource stack
+
+    :param resource: the resource to import the attribute value of
+    :param ecs_composex.common.cfn_params.Parameter parameter:
+    :param ecs_composex.common.stacks.ComposeXStack x_stack:
+    :return: the dashboards stack parameter
+    """
+    _, import_parameter, import_value, _ = get_parameter_settings(resource, parameter)
+    add_parameters(x_stack.stack_template, [import_parameter])
+    x_stack.Parameters.update({import_parameter.title: import_value})
+    return import_parameter
+
+
+def retrieve_family_target_groups(
+    family: ComposeFamily, x_stack: ComposeXStack
+) -> list[tuple]:
+    """
+    Imports the full names of the target groups of the family, and of their load balancer, into the dashboards stack
+
+    :param ecs_composex.ecs.ecs_family.ComposeFamily family:
+    :param ecs_composex.common.stacks.ComposeXStack x_stack:
+    :return: the target groups name, full name and LB full name parameters, and LB type
+    """
+    target_groups = []
+    for target_group in family.target_groups:
+        if (
+            TGT_FULL_NAME not in target_group.attributes_outputs
+            or LB_FULL_NAME not in target_group.elbv2.attributes_outputs
+        ):
+            continue
+        target_groups.append(
+            (
+                target_group.title,
+                import_resource_parameter(target_group, TGT_FULL_NAME, x_stack),
+                import_resource_parameter(target_group.elbv2, LB_FULL_NAME, x_stack),
+                target_group.elbv2.lb_type,
+            )
+        )
+    return target_groups
+
+
+def retrieve_family_backlogs(
+    settings: ComposeXSettings, family: ComposeFamily, x_stack: ComposeXStack
+) -> list[tuple]:
+    """
+    Imports the names of the queues and streams the family is linked to, for access or scaling, into the dashboards
+    stack
+
+    :param ecs_composex.common.settings.ComposeXSettings settings:
+    :param ecs_composex.ecs.ecs_family.ComposeFamily family:
+    :param ecs_composex.common.stacks.ComposeXStack x_stack:
+    :return: the resources name, module res_key and name parameter
+    """
+    backlogs = []
+    for resource in settings.x_resources:
+        name_parameter = BACKLOG_NAME_PARAMETERS.get(resource.module.res_key)
+        if (
+            not name_parameter
+            or name_parameter not in resource.attributes_outputs
+            or not (
+                resource.is_family_target(family.name)
+                or resource.is_family_scaling_target(family.name)
+            )
+        ):
+            continue
+        backlogs.append(
+            (
+                f"{resource.module.res_key}.{resource.name}",
+                resource.module.res_key,
+                import_resource_parameter(resource, name_parameter, x_stack),
+            )
+        )
+    return backlogs
+
+
 def create_dashboards(
     settings: ComposeXSettings, x_stack: ComposeXStack, module: XResourceModule
 ) -> None:
@@ -107,6 +196,22 @@ def create_dashboards(
                 )
                 widgets += service_ecs_widgets.widgets
                 y_index += service_ecs_widgets.height + 1
+                service_def = dashboard["Services"][param[2].name]
+                if (
+                    keypresent("PerformanceWidgets", service_def)
+                    and not service_def["PerformanceWidgets"]
+                ):
+                    continue
+                performance_widgets = FamilyPerformanceWidgets(
+                    param[0],
+                    param[1],
+                    CLUSTER_NAME,
+                    target_groups=retrieve_family_target_groups(param[2], x_stack),
+                    backlogs=retrieve_family_backlogs(settings, param[2], x_stack),
+                    y_index=y_index,
+                )
+                widgets += performance_widgets.widgets
+                y_index += performance_widgets.height + 1
         dashboard_body_header = {"start": "-PT12H", "widgets": widgets}
         dashboard_body = Sub(json.dumps(dashboard_body_header))
         cfn_dashboard = CWDashboard(
@@ -132,5 +237,14 @@ class XStack(ComposeXStack):
             CLUSTER_NAME.title: settings.ecs_cluster,
         }
         stack_template = build_template("Root template for Dashboards", [CLUSTER_NAME])
+        self.module = module
         super().__init__(title, stack_template, stack_parameters=params, **kwargs)
-        create_dashboards(settings, self, module)
+
+    def post_processing(self, settings: ComposeXSettings) -> None:
+        """
+        Creates the dashboards once the services have been linked to the load balancers, queues and streams,
+        for the performance widgets.
+
+        :param ecs_composex.common.settings.ComposeXSettings settings:
+        """
+        create_dashboards(settings, self, self.module)
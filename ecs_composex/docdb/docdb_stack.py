@@ -17,6 +17,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import AWS_ACCOUNT_ID, AWS_PARTITION, AWS_REGION, GetAtt, Ref, Sub
 from troposphere.docdb import DBCluster as CfnDBCluster
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.compose.x_resources.helpers import (
     set_lookup_resources,
@@ -48,7 +49,7 @@ def get_db_cluster_config(db, account_id, resource_id):
     :param resource_id:
     :return:
     """
-    client = db.lookup_session.client("docdb")
+    client = get_cached_client(db.lookup_session, "docdb")
     try:
         db_config_r = client.describe_db_clusters(
             DBClusterIdentifier=db.arn,
@@ -116,6 +117,16 @@ class DocDb(DatabaseXResource):
         self.db_cluster_endpoint_param = DOCDBC_ENDPOINT
         self.db_cluster_ro_endpoint_param = DOCDBC_READ_ENDPOINT
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": RDS_DB_CLUSTER_ARN_RE,
+            "native_lookup_function": get_db_cluster_config,
+            "cfn_resource_type": CfnDBCluster.resource_type,
+            "tagging_api_id": "rds:cluster",
+            "subattribute_key": "cluster",
+        }
+
     def init_outputs(self):
         """
         Method to init the DocDB output attributes
@@ -203,13 +214,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            RDS_DB_CLUSTER_ARN_RE,
-            get_db_cluster_config,
-            CfnDBCluster.resource_type,
-            "rds:cluster",
-            "cluster",
-        )
+        resource.resolve_lookup()
         if keyisset("secret", resource.lookup):
             lookup_rds_secret(resource, resource.lookup["secret"])
         resource.generate_cfn_mappings_from_lookup_properties()
@@ -18,6 +18,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import GetAtt, Ref
 from troposphere.dynamodb import Table as CfnTable
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -39,7 +40,7 @@ def get_dynamodb_table_config(table, account_id, resource_id):
         TABLE_NAME: "TableName",
         TABLE_ARN: "TableArn",
     }
-    client = table.lookup_session.client("dynamodb")
+    client = get_cached_client(table.lookup_session, "dynamodb")
     try:
         table_r = client.describe_table(TableName=resource_id)["Table"]
         table_config = attributes_to_mapping(table_r, table_attributes_mapping)
@@ -73,6 +74,15 @@ class Table(ApiXResource):
             }
         }
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": TABLE_ARN_RE,
+            "native_lookup_function": get_dynamodb_table_config,
+            "cfn_resource_type": CfnTable.resource_type,
+            "tagging_api_id": "dynamodb:table",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             TABLE_NAME: (self.logical_name, self.cfn_resource, Ref, None),
@@ -98,12 +108,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            TABLE_ARN_RE,
-            get_dynamodb_table_config,
-            CfnTable.resource_type,
-            "dynamodb:table",
-        )
+        resource.resolve_lookup()
         LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
@@ -17,7 +17,6 @@ import copy
 from os import environ, path
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
-from jinja2 import Environment, FileSystemLoader
 from troposphere import Ref, Region
 
 from ecs_composex.common.logging import LOG
@@ -28,6 +27,11 @@ from .advanced_firehose import FireLensFirehoseManagedDestination
 from .advanced_kinesis import FireLensKinesisManagedDestination
 from .config_parameter import add_managed_ssm_parameter
 from .firelens_config_sidecar import FluentBitConfig, render_config_sidecar_config
+from .jinja_templates import (
+    FAMILY_CONFIG_TEMPLATE,
+    FIRELENS_TEMPLATES,
+    SERVICE_CONFIG_TEMPLATE,
+)
 
 
 class FireLensFamilyManagedConfiguration:
@@ -140,12 +144,8 @@ class FireLensFamilyManagedConfiguration:
 
     @property
     def rendered_content(self):
-        here = path.abspath(path.dirname(__file__))
-        jinja_env = Environment(
-            loader=FileSystemLoader(here),
-        )
-        template = jinja_env.get_template("family_fluentbit_managed_config.j2")
-        content = template.render(
+        content = FIRELENS_TEMPLATES.render(
+            FAMILY_CONFIG_TEMPLATE,
             env=environ,
             enable_health_check=self.family.logging.api_health_enabled,
             grace_period=self.family.logging.grace_period,
@@ -246,12 +246,8 @@ class FireLensServiceManagedConfiguration:
             return content
 
     def render_jinja_config_file(self):
-        here = path.abspath(path.dirname(__file__))
-        jinja_env = Environment(
-            loader=FileSystemLoader(here),
-        )
-        template = jinja_env.get_template("service_fluentbit_managed_config.j2")
-        content = template.render(
+        content = FIRELENS_TEMPLATES.render(
+            SERVICE_CONFIG_TEMPLATE,
             env=environ,
             firelens_firehose_destinations=self.managed_firehose_destinations,
             firelens_data_streams_destinations=self.managed_data_streams_destinations,
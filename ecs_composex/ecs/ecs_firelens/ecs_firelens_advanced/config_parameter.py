@@ -76,6 +76,6 @@ def add_managed_ssm_parameter(
         add_outputs(ssm_parameter.stack.stack_template, ssm_parameter.outputs)
         ssm_parameter.to_ecs(settings, settings.mod_manager)
         settings.compose_content[ssm_module.res_key][ssm_parameter.name] = ssm_parameter
-        ssm_module.resources[ssm_parameter_title] = ssm_parameter
+        ssm_module.add_resource(ssm_parameter_title, ssm_parameter)
 
     return ssm_parameter
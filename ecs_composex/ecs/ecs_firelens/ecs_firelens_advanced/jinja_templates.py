@@ -0,0 +1,64 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Shared Jinja2 environment for the FireLens managed configuration templates.
+
+The templates ship with the package and do not change during the execution: each is loaded and compiled once,
+and all the families and services Fluent Bit configurations are rendered from the compiled templates.
+"""
+
+from __future__ import annotations
+
+from os import path
+from threading import RLock
+
+from jinja2 import Environment, FileSystemLoader, Template
+
+FAMILY_CONFIG_TEMPLATE = "family_fluentbit_managed_config.j2"
+SERVICE_CONFIG_TEMPLATE = "service_fluentbit_managed_config.j2"
+
+
+class FireLensTemplates:
+    """
+    Registry of the compiled FireLens configuration templates.
+
+    :ivar dict templates: the compiled templates, by file name
+    """
+
+    def __init__(self, templates_dir: str = None):
+        self.templates_dir = (
+            templates_dir if templates_dir else path.abspath(path.dirname(__file__))
+        )
+        self.templates: dict = {}
+        self._environment = None
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.templates.clear()
+            self._environment = None
+
+    @property
+    def environment(self) -> Environment:
+        with self._lock:
+            if self._environment is None:
+                self._environment = Environment(
+                    loader=FileSystemLoader(self.templates_dir),
+                    auto_reload=False,
+                )
+            return self._environment
+
+    def get_template(self, template_name: str) -> Template:
+        with self._lock:
+            if template_name not in self.templates:
+                self.templates[template_name] = self.environment.get_template(
+                    template_name
+                )
+            return self.templates[template_name]
+
+    def render(self, template_name: str, **kwargs) -> str:
+        return self.get_template(template_name).render(**kwargs)
+
+
+FIRELENS_TEMPLATES = FireLensTemplates()
@@ -40,7 +40,7 @@ def set_add_family_to_kinesis(
             resource.init_outputs()
             resource.generate_outputs()
         family_target = (family, True, family.services, "Producer")
-        resource.families_targets.append(family_target)
+        resource.add_family_target(family_target)
         resource.to_ecs(
             settings,
             settings.mod_manager,
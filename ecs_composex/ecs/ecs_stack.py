@@ -22,6 +22,7 @@ from ecs_composex.compose.compose_secrets.ecs_family_helpers import (
     set_repository_credentials,
 )
 from ecs_composex.compose.compose_services.env_files_helpers import (
+    upload_families_env_files,
     upload_services_env_files,
 )
 from ecs_composex.compose.compose_volumes.ecs_family_helpers import set_volumes
@@ -95,6 +96,7 @@ def add_compose_families(settings: ComposeXSettings) -> None:
 
     :param ecs_composex.common.settings.ComposeXSettings settings:
     """
+    upload_families_env_files(settings)
     for family_name, family in settings.families.items():
         family.init_family()
         initialize_family_services(settings, family)
@@ -77,12 +77,22 @@ def set_ecs_cluster_identifier(root_stack, settings) -> None:
     :param ecs_composex.common.settings.ComposeXSettings settings:
     """
     for name, resource in root_stack.stack_template.resources.items():
-        if issubclass(type(resource), ComposeXStack) and CLUSTER_NAME.title in [
-            param.title for param in resource.stack_template.parameters.values()
-        ]:
-            resource.Parameters.update(
-                {CLUSTER_NAME.title: settings.ecs_cluster.cluster_identifier}
-            )
+        set_stack_ecs_cluster_identifier(resource, settings)
+
+
+def set_stack_ecs_cluster_identifier(stack, settings) -> None:
+    """
+    Sets the ECS cluster parameter of the stack, if its template has the parameter.
+
+    :param ecs_composex.common.stacks.ComposeXStack stack:
+    :param ecs_composex.common.settings.ComposeXSettings settings:
+    """
+    if issubclass(type(stack), ComposeXStack) and CLUSTER_NAME.title in [
+        param.title for param in stack.stack_template.parameters.values()
+    ]:
+        stack.Parameters.update(
+            {CLUSTER_NAME.title: settings.ecs_cluster.cluster_identifier}
+        )
 
 
 def import_from_x_aws_cluster(compose_content):
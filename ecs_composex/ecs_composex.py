@@ -19,11 +19,17 @@ from troposphere import AWS_STACK_NAME, Ref
 
 from ecs_composex.cloudmap.cloudmap_helpers import x_cloud_lookup_and_new_vpc
 from ecs_composex.common import NONALPHANUM
+from ecs_composex.common.aws_cache import AWS_CACHE
 from ecs_composex.common.cfn_params import ROOT_STACK_NAME
 from ecs_composex.common.ecs_composex import X_KEY
 from ecs_composex.common.logging import LOG
-from ecs_composex.common.stacks import ComposeXStack
-from ecs_composex.common.tagging import add_all_tags
+from ecs_composex.common.profiling import FAMILIES, MODULES, PROFILER
+from ecs_composex.common.stacks import (
+    ComposeXStack,
+    StacksTreeVisitor,
+    set_parent_stack,
+)
+from ecs_composex.common.tagging import add_tags_hooks
 from ecs_composex.common.troposphere_tools import (
     add_resource,
     add_update_mapping,
@@ -40,7 +46,7 @@ from ecs_composex.ecs.helpers import (
     set_families_ecs_service,
 )
 from ecs_composex.ecs_cluster import add_ecs_cluster
-from ecs_composex.ecs_cluster.helpers import set_ecs_cluster_identifier
+from ecs_composex.ecs_cluster.helpers import set_stack_ecs_cluster_identifier
 from ecs_composex.iam.iam_stack import XStack as IamStack
 from ecs_composex.mods_manager import ModManager
 from ecs_composex.resource_settings import map_resource_return_value_to_services_command
@@ -171,18 +177,35 @@ def apply_x_resource_to_x(
         vpc_stack.vpc_resource.handle_x_dependencies(settings, root_stack)
 
 
+def post_process_x_stacks(settings: ComposeXSettings) -> None:
+    """
+    Invokes the post_processing of the x-resources stacks which define one, once the services and the x-resources
+    have all been linked together.
+
+    :param ecs_composex.common.settings.ComposeXSettings settings: The settings for the execution
+    """
+    for resource_stack in settings.root_stack.stack_template.resources.values():
+        if (
+            issubclass(type(resource_stack), ComposeXStack)
+            and not resource_stack.is_void
+            and hasattr(resource_stack, "post_processing")
+        ):
+            resource_stack.post_processing(settings)
+
+
 def add_x_resources(settings: ComposeXSettings) -> None:
     """
     Processes the modules / resources that are defining the environment settings
     """
     for name, module in settings.mod_manager.modules.items():
         LOG.info(f"Processing {name}")
-        x_stack = module.stack_class(
-            module.mapping_key,
-            settings=settings,
-            module=module,
-            Parameters={ROOT_STACK_NAME.title: Ref(AWS_STACK_NAME)},
-        )
+        with PROFILER.phase(name, MODULES):
+            x_stack = module.stack_class(
+                module.mapping_key,
+                settings=settings,
+                module=module,
+                Parameters={ROOT_STACK_NAME.title: Ref(AWS_STACK_NAME)},
+            )
         if x_stack and x_stack.is_void:
             settings.x_resources_void.append({module.mod_key: x_stack})
         elif (
@@ -224,6 +247,33 @@ def set_all_mappings_to_root_stack(
         add_update_mapping(root_stack.stack_template, mapping_key, mapping)
 
 
+def finalize_stacks_tree(settings: ComposeXSettings) -> None:
+    """
+    Final passes over the stacks tree, all done in a single walk of it:
+
+    * Sets the nested stacks parent stack
+    * Sets the ECS cluster parameter of the root stack nested stacks
+    * Adds the tags to all the nested stacks resources
+    * Adds all the mappings to the root stack
+
+    :param ecs_composex.common.settings.ComposeXSettings settings: The settings for the execution
+    """
+    visitor = StacksTreeVisitor()
+    visitor.add_stack_hook(set_parent_stack)
+
+    def set_cluster_and_mappings(
+        stack: ComposeXStack, parent_stack: ComposeXStack, depth: int
+    ) -> None:
+        if depth == 0:
+            set_all_mappings_to_root_stack(stack, settings)
+        elif depth == 1:
+            set_stack_ecs_cluster_identifier(stack, settings)
+
+    visitor.add_stack_hook(set_cluster_and_mappings)
+    add_tags_hooks(visitor, settings)
+    visitor.visit(settings.root_stack)
+
+
 def generate_full_template(settings: ComposeXSettings):
     """
     Function to generate the root template and associate services, x-resources to each other.
@@ -246,74 +296,100 @@ def generate_full_template(settings: ComposeXSettings):
     settings.root_stack = create_root_stack(settings)
     for family in settings.families.values():
         family.stack.parent_stack = settings.root_stack
-    add_ecs_cluster(settings)
-    settings.mod_manager = ModManager(settings)
-    settings.mod_manager.modules_repr()
-    settings.mod_manager.init_mods_resources(settings)
-    iam_stack = add_resource(
-        settings.root_stack.stack_template, IamStack("iam", settings)
-    )
-    add_x_resources(settings)
-    add_compose_families(settings)
-    if "x-vpc" not in settings.mod_manager.modules:
-        vpc_module = settings.mod_manager.load_module("x-vpc", {})
-    else:
-        vpc_module = settings.mod_manager.modules["x-vpc"]
-    vpc_stack = VpcStack("vpc", settings, vpc_module)
-    define_vpc_settings(settings, vpc_module, vpc_stack)
-    if vpc_stack.vpc_resource and (
-        vpc_stack.vpc_resource.cfn_resource or vpc_stack.vpc_resource.mappings
-    ):
-        settings.set_networks(vpc_stack)
-    vpc_module.resources.update({"x-vpc": vpc_stack.vpc_resource})
-    x_cloud_lookup_and_new_vpc(settings, vpc_stack)
-
-    for family in settings.families.values():
-        family.init_network_settings(settings, vpc_stack)
-
-    handle_families_cross_dependencies(settings, settings.root_stack)
-    update_network_resources_vpc_config(settings, vpc_stack)
-    set_families_ecs_service(settings)
-
-    apply_x_resource_to_x(
-        settings, settings.root_stack, vpc_stack, env_resources_only=True
-    )
-    for family in settings.families.values():
-        add_iam_dependency(iam_stack, family)
-        family.set_enable_execute_command()
-        if family.enable_execute_command:
-            family.apply_ecs_execute_command_permissions(settings)
-        family.import_all_sidecars()
-        family.handle_logging(settings)
-
-    apply_x_configs_to_ecs(settings, settings.root_stack, modules=settings.mod_manager)
-    apply_x_resource_to_x(settings, settings.root_stack, vpc_stack)
+    with PROFILER.phase("ecs_cluster"):
+        add_ecs_cluster(settings)
+    with PROFILER.phase("modules_init"):
+        settings.mod_manager = ModManager(settings)
+        settings.mod_manager.modules_repr()
+        settings.mod_manager.init_mods_resources(settings)
+    with PROFILER.phase("lookups"):
+        settings.mod_manager.resolve_lookups(settings)
+    with PROFILER.phase("iam"):
+        iam_stack = add_resource(
+            settings.root_stack.stack_template, IamStack("iam", settings)
+        )
+    with PROFILER.phase("x_resources"):
+        add_x_resources(settings)
+    with PROFILER.phase("families"):
+        add_compose_families(settings)
+    with PROFILER.phase("vpc"):
+        if "x-vpc" not in settings.mod_manager.modules:
+            vpc_module = settings.mod_manager.load_module("x-vpc", {})
+        else:
+            vpc_module = settings.mod_manager.modules["x-vpc"]
+        vpc_stack = VpcStack("vpc", settings, vpc_module)
+        define_vpc_settings(settings, vpc_module, vpc_stack)
+        if vpc_stack.vpc_resource and (
+            vpc_stack.vpc_resource.cfn_resource or vpc_stack.vpc_resource.mappings
+        ):
+            settings.set_networks(vpc_stack)
+        vpc_module.add_resource("x-vpc", vpc_stack.vpc_resource)
+    with PROFILER.phase("cloudmap"):
+        x_cloud_lookup_and_new_vpc(settings, vpc_stack)
+
+    with PROFILER.phase("network_settings"):
+        for family in settings.families.values():
+            with PROFILER.phase(family.name, FAMILIES):
+                family.init_network_settings(settings, vpc_stack)
+
+        handle_families_cross_dependencies(settings, settings.root_stack)
+        update_network_resources_vpc_config(settings, vpc_stack)
+    with PROFILER.phase("ecs_services"):
+        set_families_ecs_service(settings)
+
+    with PROFILER.phase("x_environment_resources"):
+        apply_x_resource_to_x(
+            settings, settings.root_stack, vpc_stack, env_resources_only=True
+        )
+    with PROFILER.phase("families_settings"):
+        for family in settings.families.values():
+            with PROFILER.phase(family.name, FAMILIES):
+                add_iam_dependency(iam_stack, family)
+                family.set_enable_execute_command()
+                if family.enable_execute_command:
+                    family.apply_ecs_execute_command_permissions(settings)
+                family.import_all_sidecars()
+                family.handle_logging(settings)
+
+    with PROFILER.phase("x_to_ecs"):
+        apply_x_configs_to_ecs(
+            settings, settings.root_stack, modules=settings.mod_manager
+        )
+    with PROFILER.phase("x_to_x"):
+        apply_x_resource_to_x(settings, settings.root_stack, vpc_stack)
 
     if settings.use_appmesh:
         from ecs_composex.appmesh.appmesh_mesh import Mesh
 
-        mesh = Mesh(
-            settings.compose_content["x-appmesh"],
-            settings.root_stack,
-            settings,
-        )
-        mesh.render_mesh_template(mesh.stack, settings)
-
-    for family in settings.families.values():
-        family.finalize_family_settings()
-        map_resource_return_value_to_services_command(family, settings)
-        family.state_facts()
-        family.x_environment_processing()
-
-    set_ecs_cluster_identifier(settings.root_stack, settings)
-    add_all_tags(settings.root_stack.stack_template, settings)
-    set_all_mappings_to_root_stack(settings.root_stack, settings)
-
-    for resource in settings.x_resources:
-        if hasattr(resource, "post_processing") and hasattr(
-            resource, "post_processing_properties"
-        ):
-            resource.post_processing(settings)
-
-    settings.mod_manager.modules.clear()
+        with PROFILER.phase("appmesh"):
+            mesh = Mesh(
+                settings.compose_content["x-appmesh"],
+                settings.root_stack,
+                settings,
+            )
+            mesh.render_mesh_template(mesh.stack, settings)
+
+    with PROFILER.phase("families_finalize"):
+        for family in settings.families.values():
+            with PROFILER.phase(family.name, FAMILIES):
+                family.finalize_family_settings()
+                map_resource_return_value_to_services_command(family, settings)
+                family.state_facts()
+                family.x_environment_processing()
+
+    with PROFILER.phase("x_stacks_post_processing"):
+        post_process_x_stacks(settings)
+
+    with PROFILER.phase("tags_and_mappings"):
+        finalize_stacks_tree(settings)
+
+    with PROFILER.phase("post_processing"):
+        for resource in settings.x_resources:
+            if hasattr(resource, "post_processing") and hasattr(
+                resource, "post_processing_properties"
+            ):
+                resource.post_processing(settings)
+
+    settings.mod_manager.clear()
+    AWS_CACHE.log_stats()
     return settings.root_stack
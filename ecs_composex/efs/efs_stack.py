@@ -21,6 +21,7 @@ from troposphere import GetAtt, Ref, Select, Sub
 from troposphere.ec2 import SecurityGroup
 from troposphere.efs import FileSystem, MountTarget
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.cfn_params import STACK_ID_SHORT
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -87,6 +88,15 @@ class Efs(NetworkXResource):
         self.port_param = FS_PORT
         # self.cloud_control_attributes_mapping = CONTROL_CLOUD_ATTR_MAPPING
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": EFS_ARN_RE,
+            "native_lookup_function": get_efs_details,
+            "cfn_resource_type": FileSystem.resource_type,
+            "tagging_api_id": "elasticfilesystem",
+        }
+
     def init_outputs(self):
         """
         Method to init the DocDB output attributes
@@ -145,7 +155,7 @@ class Efs(NetworkXResource):
 
 
 def get_efs_details(efs: Efs, account_id, resource_id: str) -> dict:
-    client = efs.lookup_session.client("efs")
+    client = get_cached_client(efs.lookup_session, "efs")
     props: dict = {}
     efs_r = client.describe_file_systems(FileSystemId=efs.arn)["FileSystems"][0]
     props[FS_ARN] = efs_r["FileSystemArn"]
@@ -174,12 +184,7 @@ def get_efs_details(efs: Efs, account_id, resource_id: str) -> dict:
 
 
 def lookup_resource(module, resource: Efs, settings: ComposeXSettings):
-    resource.lookup_resource(
-        EFS_ARN_RE,
-        get_efs_details,
-        FileSystem.resource_type,
-        "elasticfilesystem",
-    )
+    resource.resolve_lookup()
     resource.generate_cfn_mappings_from_lookup_properties()
     resource.generate_outputs()
     settings.mappings[module.mapping_key].update(
@@ -13,12 +13,13 @@ from ecs_composex.common.aws import (
     define_lookup_role_from_info,
     find_aws_resource_arn_from_tags_api,
 )
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.elasticache import elasticache_params
 
 
 def get_cluster_config(resource, cluster_name, session):
-    client = session.client("elasticache")
+    client = get_cached_client(session, "elasticache")
     try:
         cluster_r = client.describe_cache_clusters(
             CacheClusterId=cluster_name,
@@ -61,7 +62,7 @@ def get_cluster_config(resource, cluster_name, session):
 
 
 def get_replica_group_config(resource, cluster_name, session):
-    client = session.client("elasticache")
+    client = get_cached_client(session, "elasticache")
     try:
         cluster_r = client.describe_replication_groups(ReplicationGroupId=cluster_name)
         cluster = cluster_r["ReplicationGroups"][0]
@@ -184,7 +184,7 @@ class Elbv2(NetworkXResource):
                         and f_service in settings.services
                         and f_service not in self.families_targets
                     ):
-                        self.families_targets.append(
+                        self.add_family_target(
                             (
                                 f_service.family,
                                 f_service,
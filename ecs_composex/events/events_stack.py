@@ -36,11 +36,11 @@ class Rule(ServicesXResource):
         Method to list all families and services that are targets of the resource.
         Allows to implement family and service level association to resource
         """
-        the_service = [s for s in settings.services if s.name == service_def["name"]][0]
+        the_service = settings.resources_registry.get_service(service_def["name"])
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_targets]:
-                self.families_targets.append(
+            if not self.is_family_target(family_name):
+                self.add_family_target(
                     (
                         settings.families[family_name],
                         False,
@@ -67,10 +67,10 @@ class Rule(ServicesXResource):
             return
         for service in self.services:
             service_name = service["name"]
-            if service_name in settings.families and service_name not in [
-                f[0].name for f in self.families_targets
-            ]:
-                self.families_targets.append(
+            if service_name in settings.families and not self.is_family_target(
+                service_name
+            ):
+                self.add_family_target(
                     (
                         settings.families[service_name],
                         True,
@@ -79,13 +79,13 @@ class Rule(ServicesXResource):
                         service,
                     )
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_targets
-            ]:
+            elif service_name in settings.families and self.is_family_target(
+                service_name
+            ):
                 LOG.warning(
                     f"The family {service_name} has already been added. Skipping"
                 )
-            elif service_name in [s.name for s in settings.services]:
+            elif service_name in settings.resources_registry.services:
                 self.handle_families_targets_expansion_list(
                     service_name, service, settings
                 )
@@ -97,11 +97,11 @@ class Rule(ServicesXResource):
         Method to list all families and services that are targets of the resource.
         Allows to implement family and service level association to resource
         """
-        the_service = [s for s in settings.services if s.name == service_name][0]
+        the_service = settings.resources_registry.get_service(service_name)
         for family_name in the_service.families:
             family_name = NONALPHANUM.sub("", family_name)
-            if family_name not in [f[0].name for f in self.families_targets]:
-                self.families_targets.append(
+            if not self.is_family_target(family_name):
+                self.add_family_target(
                     (
                         settings.families[family_name],
                         False,
@@ -118,10 +118,10 @@ class Rule(ServicesXResource):
     def set_services_targets_from_dict(self, settings: ComposeXSettings) -> None:
         """Deals with services set as a dict"""
         for service_name, service_def in self.services.items():
-            if service_name in settings.families and service_name not in [
-                f[0].name for f in self.families_targets
-            ]:
-                self.families_targets.append(
+            if service_name in settings.families and not self.is_family_target(
+                service_name
+            ):
+                self.add_family_target(
                     (
                         settings.families[service_name],
                         True,
@@ -130,13 +130,13 @@ class Rule(ServicesXResource):
                         service_def,
                     )
                 )
-            elif service_name in settings.families and service_name in [
-                f[0].name for f in self.families_targets
-            ]:
+            elif service_name in settings.families and self.is_family_target(
+                service_name
+            ):
                 LOG.debug(
                     f"{self.module.res_key}.{self.name} - Family {service_name} has already been added. Skipping"
                 )
-            elif service_name in [s.name for s in settings.services]:
+            elif service_name in settings.resources_registry.services:
                 self.handle_families_targets_expansion_dict(
                     service_name, service_def, settings
                 )
@@ -19,3 +19,9 @@ class IncompatibleOptions(ComposeBaseException):
     """
     Exception when two x-resources conflict, i.e. when you try to use Lookup on x-cloudmap and create a new VPC
     """
+
+
+class TemplateValidationError(ComposeBaseException):
+    """
+    Exception when a rendered CloudFormation template is found invalid by the local validation
+    """
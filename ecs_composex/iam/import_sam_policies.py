@@ -3,23 +3,27 @@
 
 """
 Module to import Policies templates from AWS SAM policies templates.
+
+The SAM policies templates and the modules ``<module>_perms.json`` files are parsed once per process and kept in
+:data:`POLICIES_CATALOG`, shared by all the modules and resources of the execution.
 """
 
+from __future__ import annotations
+
 import json
+from threading import RLock
 
 from importlib_resources import files as pkg_files
 
 
-def import_and_cleanse_sam_policies():
+def cleanse_sam_policies(policies_orig: dict) -> dict:
     """
     Function to go over each policy defined in AWS SAM policies and align it to ECS ComposeX expected format.
 
+    :param dict policies_orig: The SAM policies templates
     :return: The policies
     :rtype: dict
     """
-    template_path = str(pkg_files("ecs_composex").joinpath("iam/sam_policies.json"))
-    with open(template_path) as policies_fd:
-        policies_orig = json.loads(policies_fd.read())["Templates"]
     import_policies = {}
 
     for name, value in policies_orig.items():
@@ -31,6 +35,93 @@ def import_and_cleanse_sam_policies():
     return import_policies
 
 
+class PoliciesCatalog:
+    """
+    Catalog of the IAM policies scaffolds, parsed once from the SAM policies templates and the modules permissions
+    files. The catalog stores the parsed definitions and hands out a new mapping on each call (copy-on-write):
+    callers can add or replace policies in what they are given without altering the catalog, and must copy a
+    policy model before changing it, as ``map_service_perms_to_resource`` does.
+
+    :ivar dict perms: the permissions definitions, by permissions file path. Empty if the file does not exist.
+    """
+
+    def __init__(self):
+        self.perms: dict = {}
+        self._sam_policies: dict | None = None
+        self._merged: dict = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sam_policies = None
+            self.perms.clear()
+            self._merged.clear()
+
+    def _get_sam_policies(self) -> dict:
+        with self._lock:
+            if self._sam_policies is None:
+                template_path = str(
+                    pkg_files("ecs_composex").joinpath("iam/sam_policies.json")
+                )
+                with open(template_path) as policies_fd:
+                    self._sam_policies = cleanse_sam_policies(
+                        json.loads(policies_fd.read())["Templates"]
+                    )
+            return self._sam_policies
+
+    def _get_perms(self, perms_path: str) -> dict:
+        with self._lock:
+            if perms_path not in self.perms:
+                try:
+                    with open(perms_path, encoding="utf-8-sig") as perms_fd:
+                        self.perms[perms_path] = json.loads(perms_fd.read())
+                except OSError:
+                    self.perms[perms_path] = {}
+            return self.perms[perms_path]
+
+    def sam_policies(self) -> dict:
+        """
+        :return: The SAM policies, in ECS ComposeX format
+        :rtype: dict
+        """
+        return dict(self._get_sam_policies())
+
+    def module_perms(self, perms_path: str) -> dict:
+        """
+        :param str perms_path: path to the module permissions file
+        :return: the module permissions definitions. Empty if the file does not exist.
+        :rtype: dict
+        """
+        return dict(self._get_perms(str(perms_path)))
+
+    def policies(self, perms_path: str) -> dict:
+        """
+        :param str perms_path: path to the module permissions file
+        :return: The SAM policies, updated with the module permissions definitions
+        :rtype: dict
+        """
+        perms_path = str(perms_path)
+        with self._lock:
+            if perms_path not in self._merged:
+                merged = dict(self._get_sam_policies())
+                merged.update(self._get_perms(perms_path))
+                self._merged[perms_path] = merged
+            return dict(self._merged[perms_path])
+
+
+POLICIES_CATALOG = PoliciesCatalog()
+
+
+def import_and_cleanse_sam_policies() -> dict:
+    """
+    Function to get the AWS SAM policies aligned to ECS ComposeX expected format.
+
+    :return: The policies
+    :rtype: dict
+    """
+    return POLICIES_CATALOG.sam_policies()
+
+
 def get_access_types(module_name: str, perms_path: str = None) -> dict:
     """
     Retrieves the Permissions definitions for a given module
@@ -40,22 +131,10 @@ def get_access_types(module_name: str, perms_path: str = None) -> dict:
     :return: the policies
     :rtype: dict
     """
-    sam_policies = import_and_cleanse_sam_policies()
     if not perms_path:
-        source = str(
+        perms_path = str(
             pkg_files("ecs_composex").joinpath(
                 f"{module_name}/{module_name}_perms.json"
             )
         )
-    else:
-        source = perms_path
-    try:
-        with open(
-            source,
-            encoding="utf-8-sig",
-        ) as perms_fd:
-            dyn_policies = json.loads(perms_fd.read())
-        sam_policies.update(dyn_policies)
-        return sam_policies
-    except OSError:
-        return sam_policies
+    return POLICIES_CATALOG.policies(perms_path)
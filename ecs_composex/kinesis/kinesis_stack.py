@@ -18,6 +18,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import GetAtt, Ref
 from troposphere.kinesis import Stream as CfnStream
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.compose.x_resources.api_x_resources import ApiXResource
@@ -39,7 +40,7 @@ def get_stream_config(stream, account_id, resource_id):
     :param str resource_id:
     :return:
     """
-    client = stream.lookup_session.client("kinesis")
+    client = get_cached_client(stream.lookup_session, "kinesis")
     stream_mapping = {
         STREAM_ARN: "StreamDescription::StreamARN",
         STREAM_ID: "StreamDescription::StreamName",
@@ -78,6 +79,15 @@ class Stream(ApiXResource):
         }
         self.support_defaults = True
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": KINESIS_STREAM_ARN_RE,
+            "native_lookup_function": get_stream_config,
+            "cfn_resource_type": CfnStream.resource_type,
+            "tagging_api_id": "kinesis:stream",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             STREAM_ID: (self.logical_name, self.cfn_resource, Ref, None),
@@ -179,12 +189,7 @@ def resolve_lookup(
         LOG.info(
             f"{resource.module.res_key}.{resource.logical_name} - Looking up AWS Resource"
         )
-        resource.lookup_resource(
-            KINESIS_STREAM_ARN_RE,
-            get_stream_config,
-            CfnStream.resource_type,
-            "kinesis:stream",
-        )
+        resource.resolve_lookup()
         LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
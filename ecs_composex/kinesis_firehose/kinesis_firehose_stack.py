@@ -19,6 +19,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import GetAtt, NoValue, Ref
 from troposphere.firehose import DeliveryStream as CfnDeliveryStream
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.compose.x_resources.api_x_resources import ApiXResource
@@ -47,7 +48,7 @@ def get_delivery_stream_config(stream, account_id, resource_id):
     :param str resource_id:
     :return:
     """
-    client = stream.lookup_session.client("firehose")
+    client = get_cached_client(stream.lookup_session, "firehose")
     stream_mapping = {
         FIREHOSE_ARN: "DeliveryStreamARN",
         FIREHOSE_ID: "DeliveryStreamName",
@@ -93,6 +94,15 @@ class DeliveryStream(AwsEnvironmentResource, ApiXResource):
             FIREHOSE_CMK_MANAGER: "DeliveryStreamEncryptionConfigurationInput::KeyType",
         }
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": KINESIS_FIREHOSE_ARN_RE,
+            "native_lookup_function": get_delivery_stream_config,
+            "cfn_resource_type": CfnDeliveryStream.resource_type,
+            "tagging_api_id": "firehose:deliverystream",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             FIREHOSE_ID: (self.logical_name, self.cfn_resource, Ref, None),
@@ -157,12 +167,7 @@ def resolve_lookup(
         LOG.info(
             f"{resource.module.res_key}.{resource.logical_name} - Looking up AWS Resource"
         )
-        resource.lookup_resource(
-            KINESIS_FIREHOSE_ARN_RE,
-            get_delivery_stream_config,
-            CfnDeliveryStream.resource_type,
-            "firehose:deliverystream",
-        )
+        resource.resolve_lookup()
         LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
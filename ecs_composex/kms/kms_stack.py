@@ -19,6 +19,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import AWS_ACCOUNT_ID, AWS_PARTITION, GetAtt, Ref, Sub
 from troposphere.kms import Alias, Key
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.cfn_conditions import define_stack_name
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
@@ -52,7 +53,7 @@ def get_key_config(key, account_id: str, resource_id: str) -> dict | None:
         KMS_KEY_ARN: "KeyMetadata::Arn",
         KMS_KEY_ID: "KeyMetadata::KeyId",
     }
-    client = key.lookup_session.client("kms")
+    client = get_cached_client(key.lookup_session, "kms")
     try:
         key_desc = client.describe_key(KeyId=key.arn)
         key_attributes = attributes_to_mapping(key_desc, key_attributes_mappings)
@@ -126,6 +127,15 @@ class KmsKey(AwsEnvironmentResource, ApiXResource):
             return True
         return False
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": KMS_KEY_ARN_RE,
+            "native_lookup_function": get_key_config,
+            "cfn_resource_type": Key.resource_type,
+            "tagging_api_id": "kms:key",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             KMS_KEY_ID: (
@@ -242,9 +252,7 @@ class XStack(ComposeXStack):
             if not keyisset(module.mapping_key, settings.mappings):
                 settings.mappings[module.mapping_key] = {}
             for resource in module.lookup_resources:
-                resource.lookup_resource(
-                    KMS_KEY_ARN_RE, get_key_config, Key.resource_type, "kms:key"
-                )
+                resource.resolve_lookup()
                 settings.mappings[module.mapping_key].update(
                     {resource.logical_name: resource.mappings}
                 )
@@ -35,16 +35,20 @@ if TYPE_CHECKING:
 
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from importlib import import_module
-from json import loads
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
 
 from ecs_composex.common import NONALPHANUM
+from ecs_composex.common.aws import TAGS_INDEX
 from ecs_composex.common.ecs_composex import X_KEY
+from ecs_composex.common.json_schemas import SCHEMAS_VALIDATORS
 from ecs_composex.common.logging import LOG
-from ecs_composex.iam.import_sam_policies import import_and_cleanse_sam_policies
+from ecs_composex.common.profiling import MODULES, PROFILER
+from ecs_composex.common.resources_registry import ResourcesRegistry
+from ecs_composex.iam.import_sam_policies import POLICIES_CATALOG
 
 
 class XResourceModule:
@@ -72,12 +76,14 @@ class XResourceModule:
         self._path = posix_path
         self._mod_policies = {}
         self._json_schema = {}
+        self.validated_definitions: dict = {}
         self.import_perms_definition()
         self.import_json_schema()
         self._resources: dict = {}
         self._definition: dict = {}
         self._original_definition: dict = {}
         self._mappings: dict = {}
+        self.registry: ResourcesRegistry | None = None
         if definition:
             self.definition = definition
             self._original_definition = deepcopy(definition)
@@ -209,11 +215,7 @@ class XResourceModule:
 
     @property
     def iam_policies(self) -> dict:
-        if not self._mod_policies:
-            self.import_perms_definition()
-        sam_policies = import_and_cleanse_sam_policies()
-        sam_policies.update(self._mod_policies)
-        return sam_policies
+        return POLICIES_CATALOG.policies(self.perms_file_path)
 
     @property
     def json_schema(self):
@@ -222,24 +224,53 @@ class XResourceModule:
     def __repr__(self):
         return self.res_key
 
+    @property
+    def perms_file_path(self) -> str:
+        return str(self._path.joinpath(f"{self.mod_key}_perms.json"))
+
     def import_perms_definition(self):
-        perms_file_path = self._path.joinpath(f"{self.mod_key}_perms.json")
-        try:
-            with open(perms_file_path, encoding="utf-8-sig") as perms_fd:
-                self._mod_policies = loads(perms_fd.read())
-        except OSError:
-            pass
+        self._mod_policies = POLICIES_CATALOG.module_perms(self.perms_file_path)
+
+    @property
+    def json_schema_path(self) -> str:
+        return str(self._path.joinpath(f"{self.res_key}.spec.json"))
 
     def import_json_schema(self):
-        json_schema_file_path = self._path.joinpath(f"{self.res_key}.spec.json")
-        try:
-            with open(json_schema_file_path, encoding="utf-8-sig") as json_schema_fd:
-                self._json_schema = loads(json_schema_fd.read())
-        except OSError:
+        json_schema = SCHEMAS_VALIDATORS.get_schema(self.json_schema_path)
+        if json_schema is None:
             LOG.warning(
                 f"{self.res_key} - JSON Schema not found for validation. Render may contain errors."
             )
-            pass
+        else:
+            self._json_schema = json_schema
+
+    def validate_definitions(self, definitions: dict) -> None:
+        """
+        Validates all the resources definitions at once against the module JSON schema, compiled once per process.
+
+        :param dict definitions: the resources definitions, by name
+        :raises: jsonschema.exceptions.ValidationError
+        """
+        self.validated_definitions = {}
+        if not self.json_schema:
+            return
+        errors = SCHEMAS_VALIDATORS.validate_many(self.json_schema_path, definitions)
+        for name in errors:
+            LOG.error(f"{self.mod_key}.{name} - Definition is not conform to schema.")
+        if errors:
+            raise next(iter(errors.values()))
+        self.validated_definitions = dict(definitions)
+
+    def add_resource(self, resource_name: str, resource: XResource) -> None:
+        """
+        Adds the resource to the module, and to the execution resources registry.
+
+        :param str resource_name:
+        :param XResource resource:
+        """
+        self._resources[resource_name] = resource
+        if self.registry:
+            self.registry.add_x_resource(resource, resource_name)
 
     def set_resources(self, settings: ComposeXSettings):
         """
@@ -251,6 +282,8 @@ class XResourceModule:
         if self._resources:
             warnings.warn("BEFORE SETTINGS RESOURCES, SOME WERE ALREADY FOUND")
             self._resources: dict = {}
+            if self.registry:
+                self.registry.remove_module_resources(self.res_key)
         _resources = OrderedDict(
             sorted(
                 settings.compose_content[self.res_key].items(),
@@ -262,6 +295,7 @@ class XResourceModule:
             del _resources["DeletionPolicy"]
         if not self._original_definition:
             self._original_definition = {self.res_key: dict(_resources)}
+        self.validate_definitions(_resources)
         for resource_name, resource_definition in _resources.items():
             new_definition = self.resource_class(
                 name=resource_name,
@@ -271,7 +305,37 @@ class XResourceModule:
             )
             LOG.debug(type(new_definition))
             LOG.debug(new_definition.__dict__)
-            self.resources[resource_name] = new_definition
+            self.add_resource(resource_name, new_definition)
+
+
+def prime_tags_index(lookup_resources: list) -> None:
+    """
+    Lists at once, per session, all the resources of the types looked up via Tags, so that the lookups are resolved
+    from the tags index.
+
+    :param list[XResource] lookup_resources:
+    """
+    sessions_types: dict = {}
+    for resource in lookup_resources:
+        lookup_arguments = resource.lookup_arguments
+        lookup_attributes = resource.lookup
+        if keyisset("subattribute_key", lookup_arguments):
+            lookup_attributes = lookup_attributes.get(
+                lookup_arguments["subattribute_key"]
+            )
+        if (
+            not isinstance(lookup_attributes, dict)
+            or keyisset("Arn", lookup_attributes)
+            or not keyisset("Tags", lookup_attributes)
+            or not keyisset("tagging_api_id", lookup_arguments)
+        ):
+            continue
+        session_id = id(resource.lookup_session)
+        if session_id not in sessions_types:
+            sessions_types[session_id] = (resource.lookup_session, set())
+        sessions_types[session_id][1].add(lookup_arguments["tagging_api_id"])
+    for session, resource_types in sessions_types.values():
+        TAGS_INDEX.prime(session, list(resource_types))
 
 
 class ModManager:
@@ -282,6 +346,9 @@ class ModManager:
     def __init__(self, settings: ComposeXSettings):
         self.modules = {}
         self.loaded_modules: list = []
+        self.registry: ResourcesRegistry = (
+            getattr(settings, "resources_registry", None) or ResourcesRegistry()
+        )
 
         for res_key, res_def in settings.compose_content.items():
             if not res_def:
@@ -297,17 +364,59 @@ class ModManager:
                 del sys.modules[module]
             del module
 
+    def clear(self) -> None:
+        """
+        Removes the modules, and their resources from the registry.
+        """
+        self.modules.clear()
+        self.registry.clear_modules()
+
     def init_mods_resources(self, settings: ComposeXSettings):
-        for module in self.modules.values():
+        for name, module in self.modules.items():
             if not module.resource_class or not isinstance(
                 settings.compose_content[module.res_key], dict
             ):
                 continue
-            if module.definition:
-                module.set_resources(settings)
-            elif keyisset(module.res_key, settings.compose_content):
-                module.definition = settings.compose_content[module.res_key]
-                module.set_resources(settings)
+            with PROFILER.phase(name, MODULES):
+                if module.definition:
+                    module.set_resources(settings)
+                elif keyisset(module.res_key, settings.compose_content):
+                    module.definition = settings.compose_content[module.res_key]
+                    module.set_resources(settings)
+
+    def resolve_lookups(self, settings: ComposeXSettings) -> None:
+        """
+        Looks up all the x-resources concurrently, ahead of the stacks construction. The lookups results are stored
+        on the resources, so the modules re-use them when processing their lookup resources, which is CPU bound only.
+        Lookup failures are not raised here, but when the modules process the resources, as they did before.
+
+        :param ecs_composex.common.settings.ComposeXSettings settings:
+        """
+        workers = getattr(settings, "lookup_workers", 1)
+        lookup_resources = [
+            resource
+            for module in self.modules.values()
+            if module.resource_class
+            for resource in module.resources_list
+            if resource.lookup and resource.lookup_arguments
+        ]
+        prime_tags_index(lookup_resources)
+        if workers <= 1 or not lookup_resources:
+            return
+        LOG.info(f"Looking up {len(lookup_resources)} resources with {workers} workers")
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lookup"
+        ) as executor:
+            futures = {
+                executor.submit(resource.resolve_lookup): resource
+                for resource in lookup_resources
+            }
+            for future in as_completed(futures):
+                resource = futures[future]
+                if future.exception():
+                    LOG.debug(
+                        f"{resource.module.res_key}.{resource.name} - Lookup failed: {future.exception()}"
+                    )
 
     def modules_repr(self):
         for key, module in self.modules.items():
@@ -324,6 +433,7 @@ class ModManager:
         if mod_x_stack_modules:
             for module_res_key, module_def in mod_x_stack_modules.items():
                 self.modules[module_res_key] = module_def["Module"]
+                self.registry.register_module(module_def["Module"])
             for module_name, module in self.modules.items():
                 if module_name == res_key:
                     self.loaded_modules.append(py_module)
@@ -355,6 +465,7 @@ class ModManager:
         if res_def and isinstance(res_def, dict):
             module.definition = res_def
         self.modules[res_key] = module
+        self.registry.register_module(module)
         return module
 
 
@@ -17,6 +17,7 @@ from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import AWS_ACCOUNT_ID, AWS_PARTITION, AWS_REGION, GetAtt, Ref, Sub
 from troposphere.neptune import DBCluster as CfnDBCluster
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -41,7 +42,7 @@ from .neptune_template import create_neptune_template
 
 
 def get_db_cluster_config(db, account_id, resource_id):
-    client = db.lookup_session.client("neptune")
+    client = get_cached_client(db.lookup_session, "neptune")
     try:
         db_config_r = client.describe_db_clusters(
             DBClusterIdentifier=db.arn,
@@ -109,6 +110,15 @@ class NeptuneDBCluster(DatabaseXResource):
         self.db_cluster_endpoint_param = DB_ENDPOINT
         self.ref_parameter = DB_CLUSTER_NAME
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": NEPTUNE_DB_CLUSTER_ARN_RE,
+            "native_lookup_function": get_db_cluster_config,
+            "cfn_resource_type": CfnDBCluster.resource_type,
+            "tagging_api_id": "rds:cluster",
+        }
+
     def init_outputs(self):
         """
         Method to init the DocDB output attributes
@@ -235,12 +245,7 @@ class XStack(ComposeXStack):
             if not keyisset(module.mapping_key, settings.mappings):
                 settings.mappings[module.mapping_key] = {}
             for resource in module.lookup_resources:
-                resource.lookup_resource(
-                    NEPTUNE_DB_CLUSTER_ARN_RE,
-                    get_db_cluster_config,
-                    CfnDBCluster.resource_type,
-                    "rds:cluster",
-                )
+                resource.resolve_lookup()
                 resource.generate_cfn_mappings_from_lookup_properties()
                 resource.generate_outputs()
                 settings.mappings[module.mapping_key].update(
@@ -10,6 +10,7 @@ from ecs_composex.common.aws import (
     define_lookup_role_from_info,
     find_aws_resource_arn_from_tags_api,
 )
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.opensearch.opensearch_params import (
     OS_DOMAIN_ARN,
     OS_DOMAIN_ARN_RE,
@@ -28,7 +29,7 @@ def get_domain_config(arn, session):
     :param session:
     :return:
     """
-    client = session.client("cloudcontrol")
+    client = get_cached_client(session, "cloudcontrol")
     identifier = OS_DOMAIN_ARN_RE.match(arn).group("domain")
     resource = client.get_resource(TypeName=Domain.resource_type, Identifier=identifier)
     if keyisset("ResourceDescription", resource) and keyisset(
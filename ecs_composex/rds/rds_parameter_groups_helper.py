@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError
 from compose_x_common.aws import get_session
 from compose_x_common.compose_x_common import keyisset
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 
 
@@ -34,7 +35,7 @@ def get_db_cluster_engine_parameter_group_defaults(
     """
 
     session = get_session(session)
-    client = session.client("rds")
+    client = get_cached_client(session, "rds")
     try:
         if for_aurora_cluster:
             req = client.describe_engine_default_cluster_parameters(
@@ -70,7 +71,7 @@ def get_family_from_engine_version(
     Get the engine family from engine name and version
     """
     session = get_session(session)
-    client = session.client("rds")
+    client = get_cached_client(session, "rds")
     try:
         req = client.describe_db_engine_versions(
             Engine=engine_name, EngineVersion=engine_version
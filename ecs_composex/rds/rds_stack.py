@@ -7,7 +7,7 @@ Module to handle AWS RDS CFN Templates creation
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
@@ -20,6 +20,7 @@ from troposphere import AWS_ACCOUNT_ID, AWS_PARTITION, AWS_REGION, GetAtt, Ref,
 from troposphere.rds import DBCluster as CfnDBCluster
 from troposphere.rds import DBInstance as CfnDBInstance
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -54,7 +55,7 @@ def get_db_instance_config(db, account_id, resource_id):
     :param resource_id:
     :return:
     """
-    client = db.lookup_session.client("rds")
+    client = get_cached_client(db.lookup_session, "rds")
     try:
         db_config_r = client.describe_db_instances(DBInstanceIdentifier=db.arn)[
             "DBInstances"
@@ -90,7 +91,7 @@ def get_db_cluster_config(db, account_id, resource_id):
     :return: The config
     :rtype: dict
     """
-    client = db.lookup_session.client("rds")
+    client = get_cached_client(db.lookup_session, "rds")
     try:
         db_config_r = client.describe_db_clusters(DBClusterIdentifier=db.arn)[
             "DBClusters"
@@ -156,6 +157,26 @@ class Rds(DatabaseXResource):
             pass
         self.db_cluster_arn_parameter = value
 
+    @property
+    def lookup_arguments(self) -> Union[dict, None]:
+        if keyisset("cluster", self.lookup):
+            return {
+                "arn_re": RDS_DB_CLUSTER_ARN_RE,
+                "native_lookup_function": get_db_cluster_config,
+                "cfn_resource_type": CfnDBCluster.resource_type,
+                "tagging_api_id": "rds:cluster",
+                "subattribute_key": "cluster",
+            }
+        elif keyisset("db", self.lookup):
+            return {
+                "arn_re": RDS_DB_INSTANCE_ARN_RE,
+                "native_lookup_function": get_db_instance_config,
+                "cfn_resource_type": CfnDBInstance.resource_type,
+                "tagging_api_id": "rds:db",
+                "subattribute_key": "db",
+            }
+        return None
+
     def init_outputs(self):
         """
         Method to init the RDS Output attributes
@@ -273,22 +294,8 @@ class XStack(ComposeXStack):
             settings.mappings[module.mapping_key] = {}
         for resource in module.lookup_resources:
             resource.stack = self
-            if keyisset("cluster", resource.lookup):
-                resource.lookup_resource(
-                    RDS_DB_CLUSTER_ARN_RE,
-                    get_db_cluster_config,
-                    CfnDBCluster.resource_type,
-                    "rds:cluster",
-                    "cluster",
-                )
-            elif keyisset("db", resource.lookup):
-                resource.lookup_resource(
-                    RDS_DB_INSTANCE_ARN_RE,
-                    get_db_instance_config,
-                    CfnDBInstance.resource_type,
-                    "rds:db",
-                    "db",
-                )
+            if resource.lookup_arguments:
+                resource.resolve_lookup()
             else:
                 raise KeyError(
                     f"{resource.module.res_key}.{resource.name} - "
@@ -19,7 +19,6 @@ if TYPE_CHECKING:
     from ecs_composex.common.stacks import ComposeXStack
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws import get_account_id
 from compose_x_common.aws.rds import RDS_DB_ID_CLUSTER_ARN_RE
 from compose_x_common.compose_x_common import keyisset, keypresent, set_else_none
 from troposphere import FindInMap, GetAtt, Ref, Sub
@@ -29,6 +28,7 @@ from troposphere.ecs import Secret as EcsSecret
 from troposphere.iam import PolicyType
 
 from ecs_composex.common.aws import find_aws_resource_arn_from_tags_api
+from ecs_composex.common.aws_cache import get_account_id, get_cached_client
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.troposphere_tools import (
@@ -83,7 +83,7 @@ def lookup_rds_secret(rds_resource, secret_lookup):
     :return:
     """
     if keyisset("Arn", secret_lookup):
-        client = rds_resource.lookup_session.client("secretsmanager")
+        client = get_cached_client(rds_resource.lookup_session, "secretsmanager")
         try:
             secret_arn = client.describe_secret(SecretId=secret_lookup["Arn"])["ARN"]
 
@@ -11,8 +11,8 @@ if TYPE_CHECKING:
     from ecs_composex.route53.route53_stack import HostedZone
 
 from compose_x_common.compose_x_common import keyisset
-from troposphere.route53 import HostedZone as CfnHostedZone
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.route53.route53_params import (
     LAST_DOT_RE,
@@ -32,7 +32,7 @@ def lookup_hosted_zone(zone, session, private, zone_id=None) -> dict:
     :param str zone_id: The Zone ID
     :return:
     """
-    client = session.client("route53")
+    client = get_cached_client(session, "route53")
     try:
         if zone_id:
             if not ZONES_PATTERN.match(zone_id):
@@ -103,9 +103,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            ZONES_PATTERN, lookup_hosted_zone, CfnHostedZone.resource_type, ""
-        )
+        resource.resolve_lookup()
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
         )
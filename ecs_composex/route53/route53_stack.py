@@ -24,6 +24,7 @@ if TYPE_CHECKING:
 
 from compose_x_common.compose_x_common import keyisset, set_else_none
 from troposphere import Ref
+from troposphere.route53 import HostedZone as CfnHostedZone
 
 from ecs_composex.acm.acm_stack import Certificate
 from ecs_composex.common.logging import LOG
@@ -39,7 +40,11 @@ from ecs_composex.elbv2.elbv2_stack import Elbv2
 from ecs_composex.route53.route53_acm import handle_acm_records
 from ecs_composex.route53.route53_elbv2 import handle_elbv2_records
 from ecs_composex.route53.route53_helpers import lookup_hosted_zone
-from ecs_composex.route53.route53_params import PUBLIC_DNS_ZONE_ID, PUBLIC_DNS_ZONE_NAME
+from ecs_composex.route53.route53_params import (
+    PUBLIC_DNS_ZONE_ID,
+    PUBLIC_DNS_ZONE_NAME,
+    ZONES_PATTERN,
+)
 
 
 class HostedZone(AwsEnvironmentResource):
@@ -68,6 +73,15 @@ class HostedZone(AwsEnvironmentResource):
                 f"{self.module.res_key}.{self.name} - Could not define the Zone Name"
             )
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": ZONES_PATTERN,
+            "native_lookup_function": lookup_hosted_zone,
+            "cfn_resource_type": CfnHostedZone.resource_type,
+            "tagging_api_id": "",
+        }
+
     def init_outputs(self):
         """
         Returns the properties for the Route53 zone
@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
-from compose_x_common.aws import get_account_id
+from botocore.exceptions import ClientError
+from compose_x_common.aws.s3 import S3_BUCKET_ARN_RE
 from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
 from troposphere import GetAtt, Ref
+from troposphere.s3 import Bucket as CfnBucket
 
 from ecs_composex.common.aws import find_aws_resource_arn_from_tags_api
+from ecs_composex.common.aws_cache import get_account_id, get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.settings import ComposeXSettings
 from ecs_composex.common.stacks import ComposeXStack
@@ -53,6 +56,17 @@ class Bucket(ApiXResource):
         self.cloudmap_dns_supported = False
         self.support_defaults = True
 
+    @property
+    def lookup_arguments(self) -> dict:
+        from ecs_composex.s3.s3_stack import get_bucket_config
+
+        return {
+            "arn_re": S3_BUCKET_ARN_RE,
+            "native_lookup_function": get_bucket_config,
+            "cfn_resource_type": CfnBucket.resource_type,
+            "tagging_api_id": "s3",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             S3_BUCKET_NAME: (self.logical_name, self.cfn_resource, Ref, None),
@@ -132,13 +146,15 @@ class Bucket(ApiXResource):
             )
         props = {}
         if self.cloud_control_attributes_mapping:
-            _s3 = self.lookup_session.resource("s3")
             try:
-                if _s3.Bucket(resource_id) in _s3.buckets.all():
+                owned_buckets = get_cached_client(
+                    self.lookup_session, "s3"
+                ).list_buckets()["Buckets"]
+                if resource_id in [_bucket["Name"] for _bucket in owned_buckets]:
                     props = self.cloud_control_attributes_mapping_lookup(
                         cfn_resource_type, resource_id
                     )
-            except _s3.meta.client.exceptions:
+            except ClientError:
                 LOG.warning(
                     f"{self.module.res_key}.{self.name} - Failed to evaluate bucket ownership. Cannot use Control API"
                 )
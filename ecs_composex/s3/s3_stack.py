@@ -13,10 +13,9 @@ if TYPE_CHECKING:
     from ecs_composex.mods_manager import XResourceModule
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws.s3 import S3_BUCKET_ARN_RE
 from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
-from troposphere.s3 import Bucket as CfnBucket
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
@@ -41,7 +40,7 @@ def get_bucket_config(bucket: Bucket, resource_id: str) -> dict:
         S3_BUCKET_NAME: resource_id,
         S3_BUCKET_ARN: bucket.arn,
     }
-    client = bucket.lookup_session.client("s3")
+    client = get_cached_client(bucket.lookup_session, "s3")
 
     try:
         encryption_r = client.get_bucket_encryption(Bucket=resource_id)
@@ -76,9 +75,7 @@ def define_bucket_mappings(
     """
     for bucket in lookup_buckets:
         bucket.init_outputs()
-        bucket.lookup_resource(
-            S3_BUCKET_ARN_RE, get_bucket_config, CfnBucket.resource_type, "s3"
-        )
+        bucket.resolve_lookup()
         settings.mappings[module.mapping_key].update(
             {bucket.logical_name: bucket.mappings}
         )
@@ -91,7 +88,7 @@ def define_bucket_mappings(
                 f"{module.res_key}.{bucket.name} - "
                 f"CMK identified {bucket.lookup_properties[S3_BUCKET_KMS_KEY]}."
             )
-            key_arn_r = bucket.lookup_session.client("kms").describe_key(
+            key_arn_r = get_cached_client(bucket.lookup_session, "kms").describe_key(
                 KeyId=bucket.lookup_properties[S3_BUCKET_KMS_KEY]
             )["KeyMetadata"]["Arn"]
             bucket.lookup_properties.update({S3_BUCKET_KMS_KEY_ARN: key_arn_r})
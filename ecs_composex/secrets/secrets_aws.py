@@ -12,6 +12,7 @@ from ecs_composex.common.aws import (
     define_lookup_role_from_info,
     find_aws_resource_arn_from_tags_api,
 )
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 
 
@@ -26,7 +27,7 @@ def get_secret_config(logical_name, secret_arn, session):
     """
 
     secret_config = {}
-    client = session.client("secretsmanager")
+    client = get_cached_client(session, "secretsmanager")
     try:
         secret_r = client.describe_secret(SecretId=secret_arn)
         secret_config.update({logical_name: secret_r["ARN"], "Name": secret_r["Name"]})
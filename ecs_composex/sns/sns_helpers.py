@@ -11,10 +11,9 @@ if TYPE_CHECKING:
     from ecs_composex.sns.sns_stack import Topic
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws.sns import SNS_TOPIC_ARN_RE
 from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
-from troposphere.sns import Topic as CfnTopic
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.sns.sns_params import TOPIC_ARN, TOPIC_KMS_KEY, TOPIC_NAME
 
@@ -28,9 +27,7 @@ def create_sns_mappings(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in resources:
-        resource.lookup_resource(
-            SNS_TOPIC_ARN_RE, get_topic_config, CfnTopic.resource_type, "sns"
-        )
+        resource.resolve_lookup()
         resource.generate_cfn_mappings_from_lookup_properties()
         resource.generate_outputs()
         settings.mappings[module.mapping_key].update(
@@ -44,7 +41,7 @@ def get_topic_config(topic: Topic, account_id: str, resource_id: str) -> dict |
     """
 
     topic_config = {TOPIC_NAME: resource_id}
-    client = topic.lookup_session.client("sns")
+    client = get_cached_client(topic.lookup_session, "sns")
     attributes_mapping = {
         TOPIC_ARN: "Attributes::TopicArn",
         TOPIC_KMS_KEY: "Attributes::KmsMasterKeyId",
@@ -9,12 +9,14 @@ if TYPE_CHECKING:
     from ecs_composex.mods_manager import XResourceModule
     from ecs_composex.common.settings import ComposeXSettings
 
+from compose_x_common.aws.sns import SNS_TOPIC_ARN_RE
 from troposphere import GetAtt, Ref
+from troposphere.sns import Topic as CfnTopic
 
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import build_template
 from ecs_composex.compose.x_resources.api_x_resources import ApiXResource
-from ecs_composex.sns.sns_helpers import create_sns_mappings
+from ecs_composex.sns.sns_helpers import create_sns_mappings, get_topic_config
 from ecs_composex.sns.sns_params import TOPIC_ARN, TOPIC_NAME
 from ecs_composex.sns.sns_templates import import_sns_topics_to_template
 
@@ -37,6 +39,15 @@ class Topic(ApiXResource):
         self.support_defaults = True
         self.post_processing_properties = ["Subscription.Endpoint"]
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": SNS_TOPIC_ARN_RE,
+            "native_lookup_function": get_topic_config,
+            "cfn_resource_type": CfnTopic.resource_type,
+            "tagging_api_id": "sns",
+        }
+
     def init_outputs(self):
         self.output_properties = {
             TOPIC_ARN: (self.logical_name, self.cfn_resource, Ref, None),
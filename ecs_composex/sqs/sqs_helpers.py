@@ -11,18 +11,11 @@ if TYPE_CHECKING:
     from .sqs_stack import Queue
 
 from botocore.exceptions import ClientError
-from compose_x_common.aws.sqs import SQS_QUEUE_ARN_RE
 from compose_x_common.compose_x_common import keyisset
-from troposphere.sqs import Queue as CfnQueue
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
-from ecs_composex.sqs.sqs_params import (
-    SQS_ARN,
-    SQS_KMS_KEY,
-    SQS_NAME,
-    SQS_URL,
-    TAGGING_API_ID,
-)
+from ecs_composex.sqs.sqs_params import SQS_ARN, SQS_KMS_KEY, SQS_NAME, SQS_URL
 
 
 def get_queue_config(queue: Queue, account_id: str, resource_id: str) -> dict | None:
@@ -33,7 +26,7 @@ def get_queue_config(queue: Queue, account_id: str, resource_id: str) -> dict |
     :param str resource_id:
     """
     queue_config = {SQS_NAME: resource_id}
-    client = queue.lookup_session.client("sqs")
+    client = get_cached_client(queue.lookup_session, "sqs")
     try:
         queue_config[SQS_URL] = client.get_queue_url(
             QueueName=resource_id, QueueOwnerAWSAccountId=account_id
@@ -83,12 +76,7 @@ def resolve_lookup(
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            SQS_QUEUE_ARN_RE,
-            get_queue_config,
-            CfnQueue.resource_type,
-            TAGGING_API_ID,
-        )
+        resource.resolve_lookup()
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
         )
@@ -12,15 +12,23 @@ if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
     from ecs_composex.mods_manager import XResourceModule
 
+from compose_x_common.aws.sqs import SQS_QUEUE_ARN_RE
 from troposphere import GetAtt, Ref
+from troposphere.sqs import Queue as CfnQueue
 
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
 from ecs_composex.common.troposphere_tools import add_update_mapping, build_template
 from ecs_composex.compose.x_resources.api_x_resources import ApiXResource
 from ecs_composex.sqs.sqs_ecs_scaling import handle_service_scaling
-from ecs_composex.sqs.sqs_helpers import resolve_lookup
-from ecs_composex.sqs.sqs_params import SQS_ARN, SQS_KMS_KEY, SQS_NAME, SQS_URL
+from ecs_composex.sqs.sqs_helpers import get_queue_config, resolve_lookup
+from ecs_composex.sqs.sqs_params import (
+    SQS_ARN,
+    SQS_KMS_KEY,
+    SQS_NAME,
+    SQS_URL,
+    TAGGING_API_ID,
+)
 from ecs_composex.sqs.sqs_template import render_new_queues
 
 
@@ -44,6 +52,15 @@ class Queue(ApiXResource):
         self.predefined_resource_service_scaling_function = handle_service_scaling
         self.support_defaults = True
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": SQS_QUEUE_ARN_RE,
+            "native_lookup_function": get_queue_config,
+            "cfn_resource_type": CfnQueue.resource_type,
+            "tagging_api_id": TAGGING_API_ID,
+        }
+
     def init_outputs(self):
         """
         Init output properties for a new resource
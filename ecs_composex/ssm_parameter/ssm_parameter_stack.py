@@ -53,6 +53,15 @@ class SsmParameter(ApiXResource):
         self.ref_parameter = SSM_PARAM_NAME
         self.arn_parameter = SSM_PARAM_ARN
 
+    @property
+    def lookup_arguments(self) -> dict:
+        return {
+            "arn_re": SSM_PARAMETER_ARN_RE,
+            "native_lookup_function": get_parameter_config,
+            "cfn_resource_type": CfnSsmParameter.resource_type,
+            "tagging_api_id": "ssm:parameter",
+        }
+
     def init_outputs(self):
         spacer = ""
         if (
@@ -83,12 +92,7 @@ def resolve_lookup(lookup_resources, settings, module: XResourceModule):
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            SSM_PARAMETER_ARN_RE,
-            get_parameter_config,
-            CfnSsmParameter.resource_type,
-            "ssm:parameter",
-        )
+        resource.resolve_lookup()
         LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
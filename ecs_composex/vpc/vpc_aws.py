@@ -6,6 +6,7 @@ from compose_x_common.aws.arns import ARNS_PER_TAGGINGAPI_TYPE
 from compose_x_common.compose_x_common import keyisset
 
 from ecs_composex.common.aws import find_aws_resource_arn_from_tags_api
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.logging import LOG
 from ecs_composex.vpc.vpc_params import (
     APP_SUBNETS,
@@ -51,7 +52,7 @@ def validate_subnets_belong_with_vpc(
     """
     if session is None:
         session = Session()
-    client = session.client("ec2")
+    client = get_cached_client(session, "ec2")
     filters = [
         {
             "Name": "vpc-id",
@@ -23,6 +23,7 @@ from compose_x_common.compose_x_common import keyisset, set_else_none
 from troposphere import FindInMap, GetAtt, Join, Ref
 from troposphere.servicediscovery import PrivateDnsNamespace
 
+from ecs_composex.common.aws_cache import get_cached_client
 from ecs_composex.common.cfn_params import Parameter
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
@@ -113,8 +114,8 @@ class Vpc(AwsEnvironmentResource):
             VPC_CIDR.title, self.properties, self.default_ipv4_cidr
         )
         self.dhcp_options = set_else_none("DHCPOptions", self.properties, {})
-        region_account_zones = settings.session.client(
-            "ec2"
+        region_account_zones = get_cached_client(
+            settings.session, "ec2"
         ).describe_availability_zones()
         curated_azs = []
         current_region_azs = [
@@ -225,9 +226,9 @@ class Vpc(AwsEnvironmentResource):
     def set_azs_from_vpc_import(self, subnets: dict, session: Session = None) -> None:
         """Function to get the list of AZs for a given set of subnets"""
         if session is None:
-            client = self.lookup_session.client("ec2")
+            client = get_cached_client(self.lookup_session, "ec2")
         else:
-            client = session.client("ec2")
+            client = get_cached_client(session, "ec2")
         for subnet_name, subnet_definition in subnets.items():
             if not isinstance(subnet_definition, list):
                 continue
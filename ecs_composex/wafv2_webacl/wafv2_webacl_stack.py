@@ -56,6 +56,16 @@ class WebACL(AwsEnvironmentResource):
         self.arn_parameter = WEB_ACL_ARN
         self.cloud_control_attributes_mapping = CONTROL_CLOUD_ATTR_MAPPING
 
+    @property
+    def lookup_arguments(self) -> dict:
+        from troposphere.wafv2 import WebACL as CfnWebACL
+
+        return {
+            "arn_re": WAF_V2_WEB_ACL_ARN_RE,
+            "native_lookup_function": None,
+            "cfn_resource_type": CfnWebACL.resource_type,
+        }
+
     def init_outputs(self):
         self.output_properties = {
             WEB_ACL_REF: (self.logical_name, self.cfn_resource, Ref, None),
@@ -221,16 +231,10 @@ def resolve_lookup(lookup_resources, settings, module: XResourceModule):
     """
     Lookup of the AWS resources and setting the mappings for the resource type
     """
-    from troposphere.wafv2 import WebACL as CfnWebACL
-
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
     for resource in lookup_resources:
-        resource.lookup_resource(
-            WAF_V2_WEB_ACL_ARN_RE,
-            None,
-            CfnWebACL.resource_type,
-        )
+        resource.resolve_lookup()
         LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
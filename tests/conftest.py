@@ -0,0 +1,147 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+"""
+Stubs shared by the tests, standing in for the execution settings, the boto3 sessions and the x-resources modules,
+and the settings to render compose files offline.
+"""
+
+from os import path
+
+import boto3
+import placebo
+import yaml
+from pytest import fixture
+
+from ecs_composex.common import NONALPHANUM
+from ecs_composex.common.settings import ComposeXSettings
+from ecs_composex.common.templates_validation import LOCAL_VALIDATION
+
+PLACEBOS_DIR = path.join(path.abspath(path.dirname(__file__)), "pytests", "placebos")
+
+
+class StubSettings:
+    """
+    Stands in for ComposeXSettings, with only the attributes the tested code reads.
+    """
+
+    def __init__(self, **attributes):
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+
+class StubSession:
+    """
+    Stands in for a boto3 session, returning the same client, i.e. a client with a botocore Stubber, for every service.
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def client(self, service_name, **kwargs):
+        return self._client
+
+
+class StubModule:
+    """
+    Stands in for XResourceModule, holding the given resources.
+    """
+
+    resource_class = object
+
+    def __init__(self, res_key: str = "x-stub", resources: list = None):
+        self.res_key = res_key
+        self.resources_list = resources if resources is not None else []
+        self.resources = {}
+        self.registry = None
+
+    def add_resource(self, resource_name: str, resource) -> None:
+        self.resources[resource_name] = resource
+        if self.registry:
+            self.registry.add_x_resource(resource, resource_name)
+
+
+class StubResource:
+    """
+    Stands in for XResource, with its names and module.
+    """
+
+    def __init__(self, name: str, module: StubModule):
+        self.name = name
+        self.logical_name = NONALPHANUM.sub("", name)
+        self.module = module
+
+
+@fixture
+def stub_settings():
+    """
+    :return: factory of settings with the given attributes, i.e. stub_settings(render_workers=4)
+    """
+    return StubSettings
+
+
+@fixture
+def stub_session():
+    """
+    :return: factory of sessions returning the given client, i.e. stub_session(s3_client)
+    """
+    return StubSession
+
+
+@fixture
+def stub_module():
+    """
+    :return: factory of modules, i.e. stub_module("x-sqs", [queue])
+    """
+    return StubModule
+
+
+@fixture
+def stub_resource():
+    """
+    :return: factory of x-resources, i.e. stub_resource("queue-a", sqs_module)
+    """
+    return StubResource
+
+
+@fixture
+def render_session():
+    """
+    :return: boto3 session replaying the STS and EC2 responses needed to render compose files offline
+    """
+    session = boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    pill = placebo.attach(session, data_path=path.join(PLACEBOS_DIR, "render"))
+    pill.playback()
+    return session
+
+
+@fixture
+def render_settings(render_session, tmp_path):
+    """
+    :return: factory of the settings to render the given compose content offline, into tmp_path/outputs
+    """
+
+    def get_render_settings(
+        compose_content: dict, name: str = "render"
+    ) -> ComposeXSettings:
+        compose_file = tmp_path / "docker-compose.yml"
+        compose_file.write_text(yaml.dump(compose_content))
+        settings = ComposeXSettings(
+            session=render_session,
+            **{
+                ComposeXSettings.name_arg: name,
+                ComposeXSettings.command_arg: ComposeXSettings.render_arg,
+                ComposeXSettings.input_file_arg: [str(compose_file)],
+                ComposeXSettings.format_arg: "yaml",
+                ComposeXSettings.output_dir_arg: str(tmp_path / "outputs"),
+                ComposeXSettings.validation_arg: LOCAL_VALIDATION,
+            },
+        )
+        settings.set_bucket_name_from_account_id()
+        return settings
+
+    return get_render_settings
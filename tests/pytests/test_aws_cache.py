@@ -0,0 +1,111 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from botocore.stub import Stubber
+from pytest import fixture, raises
+
+from ecs_composex.common.aws_cache import (
+    AWS_CACHE,
+    get_account_id,
+    get_cached_client,
+    get_client,
+)
+
+
+@fixture
+def session():
+    AWS_CACHE.clear()
+    yield boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    AWS_CACHE.clear()
+
+
+def test_clients_pool(session):
+    assert get_client(session, "sts") is get_client(session, "sts")
+    assert get_client(session, "sts") is not get_client(
+        session, "sts", region_name="eu-west-2"
+    )
+
+
+def test_account_id_is_memoized(session):
+    with Stubber(get_client(session, "sts")) as stubber:
+        stubber.add_response(
+            "get_caller_identity",
+            {"Account": "012345678912", "Arn": "arn:aws:iam::012345678912:root"},
+        )
+        assert get_account_id(session) == "012345678912"
+        assert get_account_id(session) == "012345678912"
+        stubber.assert_no_pending_responses()
+    assert AWS_CACHE.stats["sts.get_caller_identity"] == {"hits": 1, "misses": 1}
+
+
+def test_cached_client_arguments(session):
+    client = get_cached_client(session, "sqs")
+    with Stubber(get_client(session, "sqs")) as stubber:
+        stubber.add_response("get_queue_url", {"QueueUrl": "https://queue-a"})
+        stubber.add_response("get_queue_url", {"QueueUrl": "https://queue-b"})
+        assert client.get_queue_url(QueueName="a")["QueueUrl"] == "https://queue-a"
+        assert client.get_queue_url(QueueName="b")["QueueUrl"] == "https://queue-b"
+        assert client.get_queue_url(QueueName="a")["QueueUrl"] == "https://queue-a"
+        stubber.assert_no_pending_responses()
+    with raises(ValueError):
+        AWS_CACHE.call(get_client(session, "sqs"), "delete_queue", QueueUrl="a")
+
+
+def test_persistent_cache(session, tmp_path):
+    identity = {"Account": "012345678912", "Arn": "arn:aws:iam::012345678912:root"}
+    versions = {"DBEngineVersions": [{"DBParameterGroupFamily": "aurora-mysql5.7"}]}
+    AWS_CACHE.set_persistent_cache(str(tmp_path))
+    with Stubber(get_client(session, "sts")) as sts_stub, Stubber(
+        get_client(session, "rds")
+    ) as rds_stub:
+        sts_stub.add_response("get_caller_identity", identity)
+        rds_stub.add_response("describe_db_engine_versions", versions)
+        response = get_cached_client(session, "rds").describe_db_engine_versions(
+            Engine="aurora-mysql"
+        )
+        assert response == versions
+    assert len(list(tmp_path.glob("012345678912/eu-west-1/rds.*/*.json"))) == 1
+
+    AWS_CACHE.clear()
+    AWS_CACHE.set_persistent_cache(str(tmp_path))
+    with Stubber(get_client(session, "sts")) as sts_stub, Stubber(
+        get_client(session, "rds")
+    ) as rds_stub:
+        sts_stub.add_response("get_caller_identity", identity)
+        response = get_cached_client(session, "rds").describe_db_engine_versions(
+            Engine="aurora-mysql"
+        )
+        assert response == versions
+        rds_stub.assert_no_pending_responses()
+
+    AWS_CACHE.clear()
+    AWS_CACHE.set_persistent_cache(str(tmp_path), refresh=True)
+    with Stubber(get_client(session, "sts")) as sts_stub, Stubber(
+        get_client(session, "rds")
+    ) as rds_stub:
+        sts_stub.add_response("get_caller_identity", identity)
+        rds_stub.add_response("describe_db_engine_versions", versions)
+        get_cached_client(session, "rds").describe_db_engine_versions(
+            Engine="aurora-mysql"
+        )
+        rds_stub.assert_no_pending_responses()
+
+
+def test_concurrent_calls_are_deduplicated(session):
+    with Stubber(get_client(session, "sts")) as stubber:
+        stubber.add_response(
+            "get_caller_identity",
+            {"Account": "012345678912", "Arn": "arn:aws:iam::012345678912:root"},
+        )
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            accounts = list(executor.map(lambda _: get_account_id(session), range(8)))
+        stubber.assert_no_pending_responses()
+    assert set(accounts) == {"012345678912"}
+    assert AWS_CACHE.stats["sts.get_caller_identity"] == {"hits": 7, "misses": 1}
@@ -0,0 +1,49 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import subprocess
+import sys
+
+TEMPLATES_GENERATION_MODULES = [
+    "docker",
+    "ecs_composex.compose",
+    "ecs_composex.ecs",
+    "ecs_composex.ecs_cluster",
+    "ecs_composex.ecs_composex",
+    "ecs_composex.mods_manager",
+    "ecs_composex.vpc",
+    "troposphere.ec2",
+    "troposphere.ecs",
+]
+
+
+def get_imported_modules(statement: str) -> dict:
+    """
+    :return: the cumulative import time, in microseconds, by module imported by the statement
+    :rtype: dict
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_cli_import_is_lazy():
+    modules = get_imported_modules("import ecs_composex.cli")
+    assert "ecs_composex.cli" in modules
+    assert not [
+        name
+        for name in modules
+        for lazy_module in TEMPLATES_GENERATION_MODULES
+        if name == lazy_module or name.startswith(f"{lazy_module}.")
+    ]
@@ -2,13 +2,23 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright 2020-2021 John Mille<john@compose-x.io>
 
+from threading import Event, Thread
+
+import boto3
+from botocore.stub import Stubber
 from pytest import fixture, raises
 
+from ecs_composex.common import aws
 from ecs_composex.common.aws import (
+    TAGS_INDEX,
+    define_tagsgroups_filter_tags,
+    find_aws_resource_arn_from_tags_api,
     handle_multi_results,
     handle_search_results,
+    resource_type_matches,
     validate_search_input,
 )
+from ecs_composex.common.aws_cache import AWS_CACHE, get_client
 
 
 @fixture()
@@ -61,3 +71,122 @@ def test_validate_search_input_exceptions(res_types):
         validate_search_input(res_types, "abcd")
     with raises(KeyError):
         validate_search_input(res_types, 1)
+
+
+def tag_mapping(arn: str, **tags) -> dict:
+    return {
+        "ResourceARN": arn,
+        "Tags": [{"Key": key, "Value": value} for key, value in tags.items()],
+    }
+
+
+def test_resource_type_matches():
+    assert resource_type_matches(
+        "arn:aws:rds:eu-west-1:000000000000:cluster:database-1", "rds:cluster"
+    )
+    assert not resource_type_matches(
+        "arn:aws:rds:eu-west-1:000000000000:db:database-1", "rds:cluster"
+    )
+    assert resource_type_matches("arn:aws:sqs:eu-west-1:000000000000:queue", "sqs")
+    assert resource_type_matches(
+        "arn:aws:es:eu-west-1:000000000000:domain/domain-01", "es:domain"
+    )
+
+
+def test_tags_index_batched_lookups():
+    AWS_CACHE.clear()
+    TAGS_INDEX.clear()
+    session = boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with Stubber(get_client(session, "resourcegroupstaggingapi")) as stubber:
+        stubber.add_response(
+            "get_resources",
+            {
+                "PaginationToken": "page2",
+                "ResourceTagMappingList": [
+                    tag_mapping(
+                        "arn:aws:rds:eu-west-1:000000000000:cluster:db-01", name="db"
+                    ),
+                    tag_mapping("arn:aws:sqs:eu-west-1:000000000000:q-01", name="q1"),
+                ],
+            },
+            {"ResourceTypeFilters": ["rds:cluster", "sqs"]},
+        )
+        stubber.add_response(
+            "get_resources",
+            {
+                "PaginationToken": "",
+                "ResourceTagMappingList": [
+                    tag_mapping(
+                        "arn:aws:sqs:eu-west-1:000000000000:q-02", name="q2", env="dev"
+                    ),
+                ],
+            },
+            {"ResourceTypeFilters": ["rds:cluster", "sqs"], "PaginationToken": "page2"},
+        )
+        TAGS_INDEX.prime(session, ["sqs", "rds:cluster", "sqs"])
+        assert (
+            find_aws_resource_arn_from_tags_api(
+                {"Tags": [{"name": "q2"}, {"env": "dev"}]}, session, "sqs"
+            )
+            == "arn:aws:sqs:eu-west-1:000000000000:q-02"
+        )
+        assert (
+            find_aws_resource_arn_from_tags_api(
+                {"Tags": {"name": ["db"]}}, session, "rds:cluster"
+            )
+            == "arn:aws:rds:eu-west-1:000000000000:cluster:db-01"
+        )
+        assert (
+            len(TAGS_INDEX.find(session, "sqs", define_tagsgroups_filter_tags([]))) == 2
+        )
+        with raises(LookupError):
+            find_aws_resource_arn_from_tags_api(
+                {"Tags": [{"name": "q2"}, {"env": "prod"}]}, session, "sqs"
+            )
+        stubber.assert_no_pending_responses()
+    AWS_CACHE.clear()
+    TAGS_INDEX.clear()
+
+
+def test_tags_index_lists_types_concurrently(monkeypatch):
+    """
+    Listing a resource type does not hold up the lookups of the other types, and each type is listed once
+    """
+    TAGS_INDEX.clear()
+    session = boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    sqs_listing = Event()
+    sqs_listed = Event()
+    calls = []
+
+    def get_all_resources_tag_mappings(_session, ResourceTypeFilters):
+        calls.append(ResourceTypeFilters)
+        if ResourceTypeFilters == ["sqs"]:
+            sqs_listing.set()
+            assert sqs_listed.wait(timeout=5)
+            return [tag_mapping("arn:aws:sqs:eu-west-1:000000000000:q-01", name="q1")]
+        return [tag_mapping("arn:aws:sns:eu-west-1:000000000000:t-01", name="t1")]
+
+    monkeypatch.setattr(
+        aws, "get_all_resources_tag_mappings", get_all_resources_tag_mappings
+    )
+    primes = [
+        Thread(target=TAGS_INDEX.prime, args=(session, ["sqs"])) for _ in range(2)
+    ]
+    for prime in primes:
+        prime.start()
+    assert sqs_listing.wait(timeout=5)
+    assert TAGS_INDEX.find(session, "sns", define_tagsgroups_filter_tags([]))
+    sqs_listed.set()
+    for prime in primes:
+        prime.join(timeout=5)
+    assert calls.count(["sqs"]) == 1
+    assert TAGS_INDEX.find(session, "sqs", define_tagsgroups_filter_tags([]))
+    TAGS_INDEX.clear()
@@ -0,0 +1,70 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import json
+
+from troposphere import Parameter
+
+from ecs_composex.dashboards.dashboards_services_metrics import (
+    FamilyPerformanceWidgets,
+    set_widgets_layout,
+)
+from ecs_composex.ecs.ecs_params import CLUSTER_NAME
+
+
+def test_widgets_layout():
+    widgets = [{} for _ in range(4)]
+    assert set_widgets_layout(widgets, 10) == 12
+    assert [(widget["x"], widget["y"]) for widget in widgets] == [
+        (0, 10),
+        (8, 10),
+        (16, 10),
+        (0, 16),
+    ]
+
+
+def test_family_performance_widgets():
+    widgets = FamilyPerformanceWidgets(
+        "app",
+        Parameter("appServiceName", Type="String"),
+        CLUSTER_NAME,
+        target_groups=[
+            (
+                "apptgt",
+                Parameter("apptgtTargetGroupFullName", Type="String"),
+                Parameter("albLoadBalancerFullName", Type="String"),
+                "application",
+            ),
+            (
+                "apptcp",
+                Parameter("apptcpTargetGroupFullName", Type="String"),
+                Parameter("nlbLoadBalancerFullName", Type="String"),
+                "network",
+            ),
+        ],
+        backlogs=[
+            ("x-sqs.jobs", "x-sqs", Parameter("jobsQueueName", Type="String")),
+        ],
+        y_index=14,
+    )
+    assert len(widgets.widgets) == 1 + 2 + 2 + 2 + 1
+    assert widgets.height == 1 + 6 * 3
+    assert all(widget["y"] >= 14 for widget in widgets.widgets)
+    titles = [
+        widget["properties"]["title"]
+        for widget in widgets.widgets
+        if widget["type"] == "metric"
+    ]
+    assert "apptgt - Latency" in titles
+    assert "apptcp - Flows" in titles
+    assert "x-sqs.jobs - Backlog" in titles
+    body = json.dumps(widgets.widgets)
+    for stat in ["p50", "p90", "p99"]:
+        assert f'"stat": "{stat}"' in body
+    for parameter in [
+        "appServiceName",
+        "apptgtTargetGroupFullName",
+        "albLoadBalancerFullName",
+        "jobsQueueName",
+    ]:
+        assert f"${{{parameter}}}" in body
@@ -0,0 +1,56 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from types import SimpleNamespace
+
+import boto3
+from botocore.stub import Stubber
+from pytest import fixture, raises
+
+from ecs_composex.common.aws_cache import AWS_CACHE, get_client
+from ecs_composex.compose.compose_services.service_image.ecr_helpers import (
+    identify_service_image,
+)
+
+DIGEST = "sha256:" + "a" * 64
+SERVICE = SimpleNamespace(
+    image=SimpleNamespace(
+        image_uri="012345678912.dkr.ecr.eu-west-1.amazonaws.com/app:v1"
+    )
+)
+
+
+@fixture
+def ecr_stub():
+    AWS_CACHE.clear()
+    session = boto3.session.Session(
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with Stubber(get_client(session, "ecr")) as stubber:
+        yield session, stubber
+    AWS_CACHE.clear()
+
+
+def test_identify_image_from_tag(ecr_stub):
+    session, stubber = ecr_stub
+    stubber.add_response(
+        "describe_images",
+        {"imageDetails": [{"imageDigest": DIGEST, "imageTags": ["v1", "latest"]}]},
+        {"repositoryName": "app", "imageIds": [{"imageTag": "v1"}]},
+    )
+    assert identify_service_image(SERVICE, "app", None, "v1", session) == {
+        "imageDigest": DIGEST,
+        "imageTag": "v1",
+    }
+    stubber.assert_no_pending_responses()
+
+
+def test_identify_missing_image(ecr_stub):
+    session, stubber = ecr_stub
+    stubber.add_client_error(
+        "describe_images", service_error_code="ImageNotFoundException"
+    )
+    with raises(LookupError):
+        identify_service_image(SERVICE, "app", DIGEST, None, session)
@@ -0,0 +1,65 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from threading import Lock
+
+from pytest import fixture
+
+from ecs_composex.common.files import get_file_digest
+from ecs_composex.compose.compose_services import env_files_helpers
+from ecs_composex.compose.compose_services.env_files_helpers import (
+    ENV_FILES_PREFIX,
+    ENV_FILES_UPLOADER,
+)
+
+
+@fixture
+def uploads(monkeypatch):
+    ENV_FILES_UPLOADER.clear()
+    calls = []
+    lock = Lock()
+
+    def upload_file_from_path(**kwargs):
+        with lock:
+            calls.append(kwargs)
+
+    monkeypatch.setattr(
+        env_files_helpers, "upload_file_from_path", upload_file_from_path
+    )
+    yield calls
+    ENV_FILES_UPLOADER.clear()
+
+
+def test_env_files_uploaded_once_per_content(tmp_path, uploads, stub_settings):
+    settings = stub_settings(bucket_name="bucket")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    app_env = tmp_path / "a" / "app.env"
+    app_env.write_text("LOG_LEVEL=info\n")
+    other_app_env = tmp_path / "b" / "app.env"
+    other_app_env.write_text("LOG_LEVEL=debug\n")
+    shared_env = tmp_path / "b" / "shared.env"
+    shared_env.write_text("LOG_LEVEL=info\n")
+    files = [str(app_env), str(other_app_env), str(shared_env), str(app_env)]
+
+    ENV_FILES_UPLOADER.upload_all(settings, files)
+    assert len(uploads) == 2
+
+    app_key = ENV_FILES_UPLOADER.upload(settings, str(app_env))
+    assert app_key == f"{ENV_FILES_PREFIX}/{get_file_digest(str(app_env))}.env"
+    assert ENV_FILES_UPLOADER.upload(settings, str(shared_env)) == app_key
+    assert ENV_FILES_UPLOADER.upload(settings, str(other_app_env)) != app_key
+    assert len(uploads) == 2
+
+
+def test_env_files_uploader_cleared_per_execution(
+    tmp_path, uploads, stub_settings, render_settings
+):
+    app_env = tmp_path / "app.env"
+    app_env.write_text("LOG_LEVEL=info\n")
+    ENV_FILES_UPLOADER.upload(stub_settings(bucket_name="bucket"), str(app_env))
+    assert ENV_FILES_UPLOADER.uploaded
+
+    render_settings({"version": "3.8", "services": {}})
+    assert not ENV_FILES_UPLOADER.uploaded
+    assert not ENV_FILES_UPLOADER.digests
@@ -0,0 +1,227 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import json
+
+import boto3
+import yaml
+from botocore.stub import ANY, Stubber
+from pytest import fixture
+from troposphere import Sub, Template
+from troposphere.sqs import Queue
+
+from ecs_composex.common.files import (
+    CONTENT_ADDRESSED_PREFIX,
+    JSON_MIME,
+    S3_URL_PREFIX,
+    UPLOADED_FILES,
+    YAML_MIME,
+    FileArtifact,
+    get_body_digest,
+    get_file_digest,
+    upload_file,
+    upload_file_from_path,
+    write_template,
+)
+from ecs_composex.common.incremental import (
+    RenderState,
+    get_content_digest,
+    get_file_content_digest,
+)
+from ecs_composex.common.serializers import FAST_SERIALIZER
+
+BODY = '{"Resources": {}}'
+LONG_QUEUE_NAME = (
+    "${AWS::StackName}-queue-with-a-name-long-enough-to-be-wrapped-if-dumped-with-"
+    "the-default-yaml-width"
+)
+
+
+@fixture
+def s3_stub():
+    UPLOADED_FILES.clear()
+    client = boto3.client(
+        "s3",
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with Stubber(client) as stubber:
+        yield client, stubber
+    UPLOADED_FILES.clear()
+
+
+def test_content_addressed_upload_skips_unchanged(s3_stub, stub_settings, stub_session):
+    client, stubber = s3_stub
+    digest = get_body_digest(BODY)
+    key = f"{CONTENT_ADDRESSED_PREFIX}/{digest}/root.json"
+    stubber.add_client_error(
+        "head_object", service_error_code="404", http_status_code=404
+    )
+    stubber.add_response(
+        "put_object",
+        {},
+        {
+            "Body": BODY,
+            "Key": key,
+            "Bucket": "bucket",
+            "ContentEncoding": "utf-8",
+            "ContentType": ANY,
+            "ServerSideEncryption": "AES256",
+            "Metadata": {"sha256": digest},
+        },
+    )
+    settings = stub_settings(
+        session=stub_session(client), content_addressed_uploads=True
+    )
+    url = upload_file(BODY, "bucket", "root.json", settings)
+    assert url == f"https://s3.amazonaws.com/bucket/{key}"
+    assert upload_file(BODY, "bucket", "root.json", settings) == url
+    stubber.assert_no_pending_responses()
+
+
+def test_upload_skips_object_with_same_digest_metadata(
+    s3_stub, stub_settings, stub_session
+):
+    client, stubber = s3_stub
+    stubber.add_response("head_object", {"Metadata": {"sha256": get_body_digest(BODY)}})
+    settings = stub_settings(
+        session=stub_session(client), content_addressed_uploads=True
+    )
+    upload_file(BODY, "bucket", "root.json", settings)
+    stubber.assert_no_pending_responses()
+
+
+def test_upload_does_not_check_execution_prefixed_object(
+    s3_stub, stub_settings, stub_session
+):
+    """
+    Without content addressed keys, the key is prefixed with the execution date, so the object cannot exist already
+    """
+    client, stubber = s3_stub
+    stubber.add_response("put_object", {})
+    settings = stub_settings(
+        session=stub_session(client), content_addressed_uploads=False
+    )
+    upload_file(BODY, "bucket", "root.json", settings)
+    stubber.assert_no_pending_responses()
+
+
+@fixture
+def previous_upload(s3_stub, stub_settings, stub_session, tmp_path):
+    """
+    A file uploaded by the previous execution, with its state recorded
+    """
+    client, stubber = s3_stub
+    render_state = RenderState(str(tmp_path / "state.json"), "fingerprint")
+    settings = stub_settings(
+        session=stub_session(client),
+        content_addressed_uploads=True,
+        format="json",
+        allowed_formats=["json", "yaml"],
+        output_dir=str(tmp_path),
+        no_upload=False,
+        bucket_name="bucket",
+        render_state=render_state,
+    )
+    artifact = FileArtifact("config", settings, content={"Key": "value"})
+    artifact.define_body()
+    digest = get_body_digest(artifact.body)
+    key = f"{CONTENT_ADDRESSED_PREFIX}/{digest}/config.json"
+    render_state.previous[artifact.file_name] = {
+        "Digest": get_content_digest(artifact.body),
+        "Url": f"{S3_URL_PREFIX}bucket/{key}",
+        "ObjectDigest": digest,
+    }
+    return artifact, settings, stubber, key, digest
+
+
+def test_upload_reuses_previous_object(previous_upload):
+    artifact, settings, stubber, key, digest = previous_upload
+    stubber.add_response(
+        "head_object",
+        {"Metadata": {"sha256": digest}},
+        {"Bucket": "bucket", "Key": key},
+    )
+    artifact.upload(settings)
+    stubber.assert_no_pending_responses()
+    assert artifact.url == f"{S3_URL_PREFIX}bucket/{key}"
+    assert settings.render_state.files[artifact.file_name]["ObjectDigest"] == digest
+
+
+def test_upload_replaces_deleted_previous_object(previous_upload):
+    artifact, settings, stubber, key, digest = previous_upload
+    for _ in range(2):
+        stubber.add_client_error(
+            "head_object", service_error_code="404", http_status_code=404
+        )
+    stubber.add_response(
+        "put_object",
+        {},
+        {
+            "Body": artifact.body,
+            "Bucket": "bucket",
+            "Key": key,
+            "ContentEncoding": "utf-8",
+            "ContentType": JSON_MIME,
+            "ServerSideEncryption": "AES256",
+            "Metadata": {"sha256": digest},
+        },
+    )
+    artifact.upload(settings)
+    stubber.assert_no_pending_responses()
+    assert artifact.url == f"{S3_URL_PREFIX}bucket/{key}"
+
+
+def test_upload_from_path_skips_object_with_same_digest_metadata(
+    s3_stub, stub_settings, stub_session, tmp_path
+):
+    client, stubber = s3_stub
+    file_path = tmp_path / "root.json"
+    file_path.write_text(BODY)
+    assert get_file_digest(str(file_path)) == get_body_digest(BODY)
+    stubber.add_response("head_object", {"Metadata": {"sha256": get_body_digest(BODY)}})
+    settings = stub_settings(
+        session=stub_session(client), content_addressed_uploads=True
+    )
+    url = upload_file_from_path(str(file_path), "bucket", "root.json", settings)
+    assert url.endswith("/root.json")
+    stubber.assert_no_pending_responses()
+
+
+def test_write_template_streams_same_body(tmp_path):
+    template = Template("Streamed template")
+    template.add_resource(
+        Queue("Queue", QueueName=Sub("${AWS::StackName}-queue"), DelaySeconds=5)
+    )
+    template.add_resource(Queue("LongNamedQueue", QueueName=Sub(LONG_QUEUE_NAME)))
+    json_path = tmp_path / "root.json"
+    with open(json_path, "w") as template_fd:
+        write_template(template, template_fd, JSON_MIME)
+    assert json_path.read_text() == template.to_json()
+    assert get_file_content_digest(str(json_path)) == get_content_digest(
+        template.to_json()
+    )
+
+    yaml_path = tmp_path / "root.yaml"
+    with open(yaml_path, "w") as template_fd:
+        write_template(template, template_fd, YAML_MIME)
+    assert yaml_path.read_text() == template.to_yaml(clean_up=True, long_form=True)
+
+
+def test_fast_serializer_is_semantically_identical(tmp_path):
+    template = Template("Fast template")
+    template.add_resource(
+        Queue("Queue", QueueName=Sub("${AWS::StackName}-queue"), DelaySeconds=5)
+    )
+    json_path = tmp_path / "root.json"
+    with open(json_path, "w") as template_fd:
+        write_template(template, template_fd, JSON_MIME, FAST_SERIALIZER)
+    assert json.loads(json_path.read_text()) == template.to_dict()
+
+    yaml_path = tmp_path / "root.yaml"
+    with open(yaml_path, "w") as template_fd:
+        write_template(template, template_fd, YAML_MIME, FAST_SERIALIZER)
+    assert yaml.safe_load(yaml_path.read_text()) == yaml.safe_load(
+        template.to_yaml(clean_up=True, long_form=True)
+    )
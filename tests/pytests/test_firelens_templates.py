@@ -0,0 +1,58 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from os import environ
+
+from pytest import fixture
+
+from ecs_composex.ecs.ecs_firelens.ecs_firelens_advanced.jinja_templates import (
+    FAMILY_CONFIG_TEMPLATE,
+    FIRELENS_TEMPLATES,
+    SERVICE_CONFIG_TEMPLATE,
+)
+
+
+@fixture
+def compiled(monkeypatch):
+    FIRELENS_TEMPLATES.clear()
+    environment = FIRELENS_TEMPLATES.environment
+    templates = []
+    compile_template = environment.compile
+
+    def compile_and_count(source, name=None, *args, **kwargs):
+        templates.append(name)
+        return compile_template(source, name, *args, **kwargs)
+
+    monkeypatch.setattr(environment, "compile", compile_and_count)
+    yield templates
+    FIRELENS_TEMPLATES.clear()
+
+
+def test_families_configs_compiled_once(compiled):
+    families_configs = []
+    for family in range(10):
+        services_content = [
+            FIRELENS_TEMPLATES.render(
+                SERVICE_CONFIG_TEMPLATE,
+                env=environ,
+                firelens_firehose_destinations=[],
+                firelens_data_streams_destinations=[],
+                source_file=f"# family{family} service{service} settings",
+                service_match=f"family{family}-service{service}-firelens*",
+            )
+            for service in range(3)
+        ]
+        families_configs.append(
+            FIRELENS_TEMPLATES.render(
+                FAMILY_CONFIG_TEMPLATE,
+                env=environ,
+                enable_health_check=True,
+                grace_period=30 + family,
+                services_content=services_content,
+                parser_files=[],
+            )
+        )
+    assert sorted(compiled) == [FAMILY_CONFIG_TEMPLATE, SERVICE_CONFIG_TEMPLATE]
+    assert len(set(families_configs)) == 10
+    assert "# family9 service2 settings" in families_configs[9]
+    assert "Grace 39" in families_configs[9]
@@ -0,0 +1,50 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import json
+from unittest.mock import patch
+
+from pytest import fixture
+
+from ecs_composex.iam.import_sam_policies import (
+    POLICIES_CATALOG,
+    get_access_types,
+    import_and_cleanse_sam_policies,
+)
+
+
+@fixture
+def catalog():
+    POLICIES_CATALOG.clear()
+    yield POLICIES_CATALOG
+    POLICIES_CATALOG.clear()
+
+
+def test_files_are_parsed_once(catalog, tmp_path):
+    perms_path = tmp_path.joinpath("test_perms.json")
+    perms_path.write_text(
+        json.dumps({"ReadOnly": {"Action": ["test:Get*"], "Effect": "Allow"}})
+    )
+    with patch(
+        "ecs_composex.iam.import_sam_policies.json.loads", wraps=json.loads
+    ) as loads:
+        policies = get_access_types("test", str(perms_path))
+        assert get_access_types("test", str(perms_path)) == policies
+        assert import_and_cleanse_sam_policies()
+        assert loads.call_count == 2
+    assert policies["ReadOnly"]["Action"] == ["test:Get*"]
+    assert "SQSPollerPolicy" in policies
+
+
+def test_policies_are_copy_on_write(catalog):
+    policies = get_access_types("sqs")
+    policies["SQSPollerPolicy"] = {"Action": ["sqs:*"]}
+    del policies["SQSSendMessagePolicy"]
+    policies = get_access_types("sqs")
+    assert policies["SQSPollerPolicy"]["Action"] != ["sqs:*"]
+    assert "SQSSendMessagePolicy" in policies
+
+
+def test_missing_perms_file(catalog, tmp_path):
+    policies = get_access_types("test", str(tmp_path.joinpath("nope.json")))
+    assert policies == import_and_cleanse_sam_policies()
@@ -0,0 +1,57 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from pytest import fixture
+
+from ecs_composex.common.aws_cache import AWS_CACHE
+from ecs_composex.compose.compose_services.service_image.image_digests import (
+    IMAGES_DIGESTS,
+)
+
+DIGEST = "sha256:0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+
+
+class DockerClient:
+    def __init__(self):
+        self.calls = []
+        self._lock = Lock()
+
+    def inspect_distribution(self, image):
+        with self._lock:
+            self.calls.append(image)
+        return {
+            "Descriptor": {
+                "mediaType": "application/vnd.docker.distribution.manifest.list.v2+json",
+                "digest": DIGEST,
+            }
+        }
+
+
+@fixture
+def docker_client():
+    AWS_CACHE.clear()
+    IMAGES_DIGESTS.clear()
+    client = DockerClient()
+    IMAGES_DIGESTS._client = client
+    yield client
+    IMAGES_DIGESTS.clear()
+    AWS_CACHE.clear()
+
+
+def test_images_inspected_once(docker_client):
+    images = ["nginx:latest", "public.ecr.aws/xray/aws-xray-daemon:latest"] * 10
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        descriptors = list(executor.map(IMAGES_DIGESTS.get_descriptor, images))
+    assert all(descriptor["digest"] == DIGEST for descriptor in descriptors)
+    assert sorted(docker_client.calls) == sorted(set(images))
+
+
+def test_descriptors_persisted(docker_client, tmp_path):
+    AWS_CACHE.set_persistent_cache(str(tmp_path))
+    IMAGES_DIGESTS.get_descriptor("nginx:latest")
+    IMAGES_DIGESTS.descriptors.clear()
+    assert IMAGES_DIGESTS.get_descriptor("nginx:latest")["digest"] == DIGEST
+    assert docker_client.calls == ["nginx:latest"]
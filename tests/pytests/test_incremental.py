@@ -0,0 +1,31 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from ecs_composex.common import DATE
+from ecs_composex.common.incremental import RenderState, get_content_digest
+
+
+def test_content_digest_ignores_generation_date():
+    assert get_content_digest(f"GeneratedOn: {DATE}") == get_content_digest(
+        "GeneratedOn: "
+    )
+
+
+def test_render_state(tmp_path):
+    state_file = str(tmp_path / "state" / "test.json")
+    state = RenderState(state_file, "fingerprint")
+    assert not state.get("root.yaml", "digest")
+    state.record("root.yaml", "digest", Url="s3://bucket/root.yaml")
+    state.record("root.yaml", "digest", Validation="local")
+    state.save()
+
+    state = RenderState(state_file, "fingerprint")
+    assert state.get("root.yaml", "digest") == {
+        "Digest": "digest",
+        "Url": "s3://bucket/root.yaml",
+        "Validation": "local",
+    }
+    assert not state.get("root.yaml", "changed")
+
+    state = RenderState(state_file, "other-fingerprint")
+    assert not state.get("root.yaml", "digest")
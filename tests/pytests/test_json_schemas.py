@@ -0,0 +1,42 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from importlib_resources import files as pkg_files
+from jsonschema.exceptions import ValidationError
+from pytest import fixture, raises
+
+from ecs_composex.common.json_schemas import SCHEMAS_VALIDATORS
+
+
+@fixture
+def sqs_schema_path():
+    SCHEMAS_VALIDATORS.clear()
+    yield str(pkg_files("ecs_composex").joinpath("sqs/x-sqs.spec.json"))
+    SCHEMAS_VALIDATORS.clear()
+
+
+def test_validator_is_compiled_once(sqs_schema_path):
+    validator = SCHEMAS_VALIDATORS.get_validator(sqs_schema_path)
+    assert SCHEMAS_VALIDATORS.get_validator(sqs_schema_path) is validator
+    assert f"{SCHEMAS_VALIDATORS.base_uri}x-resources.common.spec.json" in (
+        SCHEMAS_VALIDATORS.store
+    )
+
+
+def test_validate_many(sqs_schema_path):
+    definitions = {
+        "queue-a": {"Properties": {}},
+        "queue-b": {"Lookup": {"Tags": [{"name": "queue-b"}]}},
+        "queue-c": {"Properties": "not-a-mapping"},
+        "queue-d": {"Lookup": {"Name": "queue-d"}},
+    }
+    errors = SCHEMAS_VALIDATORS.validate_many(sqs_schema_path, definitions)
+    assert list(errors.keys()) == ["queue-c", "queue-d"]
+    with raises(ValidationError):
+        SCHEMAS_VALIDATORS.validate(sqs_schema_path, definitions["queue-c"])
+
+
+def test_missing_schema(tmp_path):
+    schema_path = str(tmp_path.joinpath("x-none.spec.json"))
+    assert SCHEMAS_VALIDATORS.get_validator(schema_path) is None
+    SCHEMAS_VALIDATORS.validate(schema_path, {"Properties": "anything"})
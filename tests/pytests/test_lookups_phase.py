@@ -0,0 +1,89 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from threading import Barrier, current_thread
+
+from pytest import raises
+
+from ecs_composex.compose.x_resources import XResource
+from ecs_composex.mods_manager import ModManager
+
+
+class StubResource:
+    resolve_lookup = XResource.resolve_lookup
+
+    def __init__(self, name: str, barrier: Barrier = None, lookup: dict = None):
+        self.name = name
+        self.module = None
+        self.lookup = lookup if lookup is not None else {"Tags": [{"name": name}]}
+        self.lookup_resolved = False
+        self.lookup_error = None
+        self.barrier = barrier
+        self.threads = []
+
+    @property
+    def lookup_arguments(self) -> dict:
+        return {"arn_re": None, "native_lookup_function": None}
+
+    def lookup_resource(self, arn_re, native_lookup_function):
+        self.threads.append(current_thread().name)
+        if self.barrier:
+            self.barrier.wait(timeout=5)
+        if self.name == "failing":
+            raise LookupError("Failed to find the AWS Resource with given tags")
+
+
+def set_modules(manager: ModManager, stub_module, modules_resources: dict) -> None:
+    manager.modules = {}
+    for res_key, resources in modules_resources.items():
+        module = stub_module(res_key, resources)
+        for resource in resources:
+            resource.module = module
+        manager.modules[res_key] = module
+
+
+def test_resolve_lookups_concurrently(stub_settings, stub_module):
+    barrier = Barrier(3)
+    resources = [StubResource(f"queue{count}", barrier) for count in range(3)]
+    not_lookup = StubResource("new", lookup={})
+    failing = StubResource("failing")
+    settings = stub_settings(compose_content={}, lookup_workers=3)
+    manager = ModManager(settings)
+    set_modules(
+        manager,
+        stub_module,
+        {"x-sqs": resources + [not_lookup], "x-sns": [failing]},
+    )
+    manager.resolve_lookups(settings)
+    for resource in resources + [failing]:
+        assert len(resource.threads) == 1
+        assert resource.threads[0].startswith("lookup")
+    assert not not_lookup.threads
+
+
+def test_resolve_lookups_results_reused(stub_settings, stub_module):
+    """
+    The modules processing the resources re-use the lookups phase results, and raise its errors
+    """
+    resource = StubResource("queue")
+    failing = StubResource("failing")
+    settings = stub_settings(compose_content={}, lookup_workers=2)
+    manager = ModManager(settings)
+    set_modules(manager, stub_module, {"x-sqs": [resource, failing]})
+    manager.resolve_lookups(settings)
+    resource.resolve_lookup()
+    with raises(LookupError):
+        failing.resolve_lookup()
+    assert len(resource.threads) == 1
+    assert len(failing.threads) == 1
+
+
+def test_resolve_lookups_sequential_is_deferred(stub_settings, stub_module):
+    resource = StubResource("queue")
+    settings = stub_settings(compose_content={}, lookup_workers=1)
+    manager = ModManager(settings)
+    set_modules(manager, stub_module, {"x-sqs": [resource]})
+    manager.resolve_lookups(settings)
+    assert not resource.threads
+    resource.resolve_lookup()
+    assert len(resource.threads) == 1
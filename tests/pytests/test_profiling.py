@@ -0,0 +1,54 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import json
+
+import boto3
+from botocore.stub import Stubber
+
+from ecs_composex.common.profiling import FAMILIES, PHASES, ExecutionProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = ExecutionProfiler()
+    profiler.reset()
+    with profiler.phase("generate_full_template"):
+        pass
+    assert not profiler.timings[PHASES]
+    assert profiler.finish() is None
+
+
+def test_profiler_report(tmp_path):
+    output_file = str(tmp_path / "profile.json")
+    profiler = ExecutionProfiler()
+    profiler.reset(output_file=output_file)
+    session = boto3.session.Session(
+        region_name="eu-west-1", aws_access_key_id="x", aws_secret_access_key="x"
+    )
+    profiler.watch_session(session)
+    client = session.client("sts")
+    with profiler.phase("generate_full_template"):
+        with profiler.phase("families"):
+            for _ in range(2):
+                with profiler.phase("app01", FAMILIES):
+                    pass
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                "get_caller_identity",
+                {
+                    "Account": "012345678912",
+                    "UserId": "AIDA",
+                    "Arn": "arn:aws:iam::012345678912:user/test",
+                },
+            )
+            client.get_caller_identity()
+
+    report = profiler.finish()
+    assert list(report[PHASES]) == [
+        "generate_full_template.families",
+        "generate_full_template",
+    ]
+    assert report[FAMILIES]["app01"]["Count"] == 2
+    assert report["AwsApiCalls"]["sts.GetCallerIdentity"]["Count"] == 1
+    with open(output_file) as output_fd:
+        assert json.load(output_fd)[PHASES] == report[PHASES]
@@ -0,0 +1,34 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from os import path
+
+from ecs_composex.common.stacks import process_stacks
+from ecs_composex.ecs_composex import generate_full_template
+
+COMPOSE = {
+    "version": "3.8",
+    "services": {
+        "app01": {
+            "image": "public.ecr.aws/nginx/nginx:latest",
+            "ports": [{"target": 80, "published": 80, "protocol": "tcp"}],
+            "deploy": {
+                "resources": {"reservations": {"cpus": "0.25", "memory": "512M"}}
+            },
+        }
+    },
+    "x-sqs": {
+        "queue01": {"Properties": {}, "Services": {"app01": {"Access": "RWMessages"}}}
+    },
+}
+
+
+def test_render_without_vpc(render_settings, tmp_path):
+    """
+    Without x-vpc, the x-vpc module is loaded without resources, and the VPC resource is created from its defaults.
+    """
+    settings = render_settings(COMPOSE, name="no-vpc")
+    root_stack = generate_full_template(settings)
+    process_stacks(root_stack, settings)
+    assert "vpc" in root_stack.stack_template.resources
+    assert path.exists(tmp_path / "outputs" / "no-vpc.yaml")
@@ -0,0 +1,58 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from ecs_composex.common.resources_registry import ResourcesRegistry
+from ecs_composex.mods_manager import ModManager
+
+FAMILIES_TARGETS_COMPOSE = {
+    "version": "3.8",
+    "services": {
+        "app01": {
+            "image": "public.ecr.aws/nginx/nginx:latest",
+            "deploy": {
+                "resources": {"reservations": {"cpus": "0.25", "memory": "512M"}}
+            },
+        }
+    },
+    "x-sqs": {
+        "queue01": {"Properties": {}, "Services": {"app01": {"Access": "RWMessages"}}}
+    },
+}
+
+
+def test_registry_indexes_resources_in_modules_order(stub_module, stub_resource):
+    registry = ResourcesRegistry()
+    sqs = stub_module("x-sqs")
+    sns = stub_module("x-sns")
+    queue_a = stub_resource("queue-a", sqs)
+    sqs.add_resource(queue_a.name, queue_a)
+    registry.register_module(sqs)
+    registry.register_module(sns)
+    topic = stub_resource("topic", sns)
+    sns.add_resource(topic.name, topic)
+    queue_b = stub_resource("queue-b", sqs)
+    sqs.add_resource(queue_b.name, queue_b)
+
+    assert registry.x_resources == [queue_a, queue_b, topic]
+    assert registry.get_x_resource("x-sqs", "queue-b") is queue_b
+    assert registry.get_x_resource("x-sns", "queue-b") is None
+    assert registry.get_x_resource_from_logical_name("queuea") is queue_a
+
+    registry.remove_module_resources("x-sqs")
+    assert registry.x_resources == [topic]
+    assert registry.get_x_resource("x-sqs", "queue-a") is None
+
+    registry.clear_modules()
+    assert not registry.x_resources
+
+
+def test_families_targets_index(render_settings):
+    settings = render_settings(FAMILIES_TARGETS_COMPOSE)
+    settings.mod_manager = ModManager(settings)
+    settings.mod_manager.init_mods_resources(settings)
+    queue = settings.resources_registry.get_x_resource("x-sqs", "queue01")
+    assert queue.is_family_target("app01")
+    assert not queue.is_family_target("app02")
+    queue.families_targets.clear()
+    queue.index_families_targets()
+    assert not queue.is_family_target("app01")
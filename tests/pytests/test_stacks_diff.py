@@ -0,0 +1,95 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+import boto3
+from botocore.stub import Stubber
+
+from ecs_composex.common.stacks_diff import (
+    ADD,
+    MODIFY,
+    REMOVE,
+    diff_resources,
+    diff_values,
+    get_deployed_template,
+)
+
+DEPLOYED = {
+    "Queue": {
+        "Type": "AWS::SQS::Queue",
+        "Properties": {"QueueName": "jobs", "VisibilityTimeout": 30},
+    },
+    "Topic": {"Type": "AWS::SNS::Topic"},
+    "Service": {
+        "Type": "AWS::ECS::Service",
+        "DependsOn": "Queue",
+        "Properties": {"DesiredCount": 1, "Cluster": {"Ref": "Cluster"}},
+    },
+    "app": {
+        "Type": "AWS::CloudFormation::Stack",
+        "Properties": {"TemplateURL": "https://bucket/old/app.json"},
+    },
+}
+
+
+def test_diff_values():
+    assert diff_values({"Port": 80}, {"Port": "80"}) == []
+    assert diff_values({"Enabled": True}, {"Enabled": "true"}) == []
+    assert diff_values(
+        {"Containers": [{"Image": "nginx:1"}]}, {"Containers": [{"Image": "nginx:2"}]}
+    ) == ["Containers.0.Image"]
+    assert diff_values({"Subnets": ["a"]}, {"Subnets": ["a", "b"]}) == ["Subnets"]
+
+
+def test_diff_resources():
+    rendered = {
+        "Queue": {
+            "Type": "AWS::SQS::Queue",
+            "Properties": {"QueueName": "jobs-v2", "VisibilityTimeout": "30"},
+        },
+        "Service": {
+            "Type": "AWS::ECS::Service",
+            "DependsOn": ["Queue"],
+            "Properties": {"DesiredCount": 2, "Cluster": {"Ref": "Cluster"}},
+        },
+        "app": {
+            "Type": "AWS::CloudFormation::Stack",
+            "Properties": {"TemplateURL": "https://bucket/new/app.json"},
+        },
+        "Key": {"Type": "AWS::KMS::Key"},
+    }
+    changes = {
+        change.logical_id: change
+        for change in diff_resources(DEPLOYED, rendered, prefix="root")
+    }
+    assert set(changes) == {"root/Queue", "root/Service", "root/Topic", "root/Key"}
+    assert changes["root/Queue"].action == MODIFY
+    assert changes["root/Queue"].properties == ["QueueName"]
+    assert changes["root/Queue"].replacement
+    assert changes["root/Service"].properties == ["DesiredCount"]
+    assert not changes["root/Service"].replacement
+    assert changes["root/Topic"].action == REMOVE
+    assert changes["root/Key"].action == ADD
+
+
+def test_get_deployed_template():
+    client = boto3.client(
+        "cloudformation",
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "get_template",
+            {"TemplateBody": "Resources:\n  Topic:\n    Type: AWS::SNS::Topic\n"},
+            {"StackName": "root", "TemplateStage": "Original"},
+        )
+        stubber.add_client_error(
+            "get_template",
+            service_error_code="ValidationError",
+            service_message="Stack with id missing does not exist",
+        )
+        assert get_deployed_template(client, "root") == {
+            "Resources": {"Topic": {"Type": "AWS::SNS::Topic"}}
+        }
+        assert get_deployed_template(client, "missing") is None
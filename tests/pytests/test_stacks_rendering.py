@@ -0,0 +1,72 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from threading import Lock
+
+from pytest import fixture, raises
+from troposphere import Template
+
+from ecs_composex.common.cfn_params import ROOT_STACK_NAME_T
+from ecs_composex.common.stacks import ComposeXStack, process_stacks
+
+
+@fixture
+def stacks_tree():
+    """
+    root -> (a -> (a1, a2), b)
+    """
+    root = ComposeXStack("root", stack_template=Template())
+    stack_a = ComposeXStack("a", stack_template=Template())
+    stack_b = ComposeXStack("b", stack_template=Template())
+    stack_a1 = ComposeXStack("a1", stack_template=Template())
+    stack_a2 = ComposeXStack("a2", stack_template=Template())
+    stack_a.stack_template.add_resource(stack_a1)
+    stack_a.stack_template.add_resource(stack_a2)
+    root.stack_template.add_resource(stack_a)
+    root.stack_template.add_resource(stack_b)
+    return root, [stack_a, stack_b, stack_a1, stack_a2]
+
+
+@fixture
+def rendered(monkeypatch):
+    order = []
+    lock = Lock()
+
+    def render(self, settings):
+        with lock:
+            order.append(self.title)
+        setattr(self, "TemplateURL", f"/tmp/{self.title}.json")
+
+    monkeypatch.setattr(ComposeXStack, "render", render)
+    return order
+
+
+def test_process_stacks_concurrently(stacks_tree, rendered, stub_settings):
+    root, nested = stacks_tree
+    process_stacks(root, stub_settings(render_workers=4))
+    assert len(rendered) == 5
+    assert rendered[-1] == "root"
+    assert rendered.index("a") > rendered.index("a1")
+    assert rendered.index("a") > rendered.index("a2")
+    for stack in nested:
+        assert ROOT_STACK_NAME_T in stack.Parameters
+
+
+def test_process_stacks_same_parameters(stacks_tree, rendered, stub_settings):
+    root, nested = stacks_tree
+    process_stacks(root, stub_settings(render_workers=1))
+    sequential = {stack.title: stack.to_dict() for stack in nested}
+    process_stacks(root, stub_settings(render_workers=3))
+    assert sequential == {stack.title: stack.to_dict() for stack in nested}
+
+
+def test_process_stacks_concurrently_failure(stacks_tree, monkeypatch, stub_settings):
+    root, nested = stacks_tree
+
+    def render(self, settings):
+        if self.title == "a1":
+            raise ValueError("Template is invalid")
+
+    monkeypatch.setattr(ComposeXStack, "render", render)
+    with raises(ValueError):
+        process_stacks(root, stub_settings(render_workers=2))
@@ -0,0 +1,66 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from troposphere import Template
+from troposphere.sqs import Queue
+
+from ecs_composex.common.stacks import (
+    ComposeXStack,
+    StacksTreeVisitor,
+    set_parent_stack,
+)
+from ecs_composex.common.tagging import add_all_tags
+
+
+def get_stacks_tree():
+    """
+    root -> (RootQueue, a -> (AQueue, a1 -> (A1Queue)))
+    """
+    root = ComposeXStack("root", stack_template=Template())
+    stack_a = ComposeXStack("a", stack_template=Template())
+    stack_a1 = ComposeXStack("a1", stack_template=Template())
+    root.stack_template.add_resource(Queue("RootQueue"))
+    stack_a.stack_template.add_resource(Queue("AQueue"))
+    stack_a1.stack_template.add_resource(Queue("A1Queue"))
+    stack_a.stack_template.add_resource(stack_a1)
+    root.stack_template.add_resource(stack_a)
+    return root, stack_a, stack_a1
+
+
+def test_visitor_visits_each_node_once():
+    root, stack_a, stack_a1 = get_stacks_tree()
+    stacks = []
+    resources = []
+    visitor = StacksTreeVisitor()
+    visitor.add_stack_hook(
+        lambda stack, parent, depth: stacks.append((stack.title, depth))
+    )
+    visitor.add_resource_hook(
+        lambda resource, stack, depth: resources.append((resource.title, depth))
+    )
+    visitor.add_stack_hook(set_parent_stack)
+    visitor.visit(root)
+    assert stacks == [("root", 0), ("a", 1), ("a1", 2)]
+    assert sorted(resources) == [
+        ("A1Queue", 2),
+        ("AQueue", 1),
+        ("RootQueue", 0),
+        ("a", 0),
+        ("a1", 1),
+    ]
+    assert stack_a1.parent_stack is stack_a
+    assert stack_a.parent_stack is root
+
+
+def test_add_all_tags_nested_stacks(stub_settings):
+    root, stack_a, stack_a1 = get_stacks_tree()
+    add_all_tags(
+        root.stack_template,
+        stub_settings(compose_content={"x-tags": {"costcentre": "lambda"}}),
+    )
+    assert not hasattr(root.stack_template.resources["RootQueue"], "Tags")
+    for template in [stack_a.stack_template, stack_a1.stack_template]:
+        assert "CostcentreTag" in template.parameters
+    a_queue_tags = stack_a.stack_template.resources["AQueue"].Tags.to_dict()
+    assert {"Key": "costcentre", "Value": {"Ref": "CostcentreTag"}} in a_queue_tags
+    assert stack_a1.stack_template.resources["A1Queue"].Tags.to_dict() == a_queue_tags
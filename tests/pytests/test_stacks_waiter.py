@@ -0,0 +1,179 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from botocore.stub import Stubber
+from pytest import fixture
+
+from ecs_composex.common import stacks_waiter
+from ecs_composex.common.stacks_waiter import (
+    AdaptiveInterval,
+    get_change_set_changes,
+    wait_for_stack,
+)
+
+ROOT_ID = "arn:aws:cloudformation:eu-west-1:012345678912:stack/root/1"
+NESTED_ID = "arn:aws:cloudformation:eu-west-1:012345678912:stack/root-app/2"
+START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+def stack_event(event_id, stack_id, logical_id, status, seconds, **kwargs):
+    return dict(
+        {
+            "EventId": event_id,
+            "StackId": stack_id,
+            "StackName": stack_id.split("/")[1],
+            "LogicalResourceId": logical_id,
+            "ResourceType": "AWS::SNS::Topic",
+            "ResourceStatus": status,
+            "Timestamp": START + timedelta(seconds=seconds),
+        },
+        **kwargs,
+    )
+
+
+def stack_status(status):
+    return {
+        "Stacks": [
+            {
+                "StackName": "root",
+                "StackId": ROOT_ID,
+                "CreationTime": START,
+                "StackStatus": status,
+            }
+        ]
+    }
+
+
+@fixture
+def client(monkeypatch):
+    monkeypatch.setattr(stacks_waiter, "sleep", lambda _: None)
+    return boto3.client(
+        "cloudformation",
+        region_name="eu-west-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+
+
+def test_adaptive_interval():
+    interval = AdaptiveInterval(min_interval=2, max_interval=5, rate=2)
+    assert interval.next(False) == 4
+    assert interval.next(False) == 5
+    assert interval.next(True) == 2
+
+
+def test_wait_for_stack_follows_nested_stacks(client, capsys):
+    old_event = stack_event("old", ROOT_ID, "root", "UPDATE_COMPLETE", -60)
+    nested_created = stack_event(
+        "root-2",
+        ROOT_ID,
+        "app",
+        "CREATE_IN_PROGRESS",
+        2,
+        ResourceType="AWS::CloudFormation::Stack",
+        PhysicalResourceId=NESTED_ID,
+    )
+    root_started = stack_event(
+        "root-1",
+        ROOT_ID,
+        "root",
+        "UPDATE_IN_PROGRESS",
+        1,
+        ResourceType="AWS::CloudFormation::Stack",
+        PhysicalResourceId=ROOT_ID,
+    )
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [nested_created, root_started, old_event]},
+            {"StackName": ROOT_ID},
+        )
+        stubber.add_response(
+            "describe_stacks",
+            stack_status("UPDATE_IN_PROGRESS"),
+            {"StackName": ROOT_ID},
+        )
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [nested_created, root_started]},
+            {"StackName": ROOT_ID},
+        )
+        stubber.add_response(
+            "describe_stack_events",
+            {
+                "StackEvents": [
+                    stack_event(
+                        "nested-1",
+                        NESTED_ID,
+                        "Topic",
+                        "CREATE_FAILED",
+                        3,
+                        ResourceStatusReason="Access Denied",
+                    )
+                ]
+            },
+            {"StackName": NESTED_ID},
+        )
+        stubber.add_response(
+            "describe_stacks",
+            stack_status("UPDATE_ROLLBACK_COMPLETE"),
+            {"StackName": ROOT_ID},
+        )
+        assert wait_for_stack(client, ROOT_ID, since=START) == 1
+        stubber.assert_no_pending_responses()
+    output = capsys.readouterr().out.splitlines()
+    assert len(output) == 3
+    assert "UPDATE_IN_PROGRESS" in output[0]
+    assert "Access Denied" in output[2]
+
+
+def test_change_set_changes_pagination_and_nested(client):
+    def resource_change(logical_id, **kwargs):
+        return {
+            "Type": "Resource",
+            "ResourceChange": dict(
+                {
+                    "Action": "Add",
+                    "LogicalResourceId": logical_id,
+                    "ResourceType": "AWS::SNS::Topic",
+                },
+                **kwargs,
+            ),
+        }
+
+    nested_cs = "arn:aws:cloudformation:eu-west-1:012345678912:changeSet/nested/1"
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "describe_change_set",
+            {
+                "Changes": [
+                    resource_change(
+                        "app",
+                        ResourceType="AWS::CloudFormation::Stack",
+                        ChangeSetId=nested_cs,
+                    )
+                ],
+                "NextToken": "page2",
+            },
+            {"ChangeSetName": "plan", "StackName": "root"},
+        )
+        stubber.add_response(
+            "describe_change_set",
+            {"Changes": [resource_change("Topic")]},
+            {"ChangeSetName": nested_cs},
+        )
+        stubber.add_response(
+            "describe_change_set",
+            {"Changes": [resource_change("Queue")]},
+            {"ChangeSetName": "plan", "StackName": "root", "NextToken": "page2"},
+        )
+        changes = get_change_set_changes(client, "plan", stack_name="root")
+        stubber.assert_no_pending_responses()
+    assert [change["ResourceChange"]["LogicalResourceId"] for change in changes] == [
+        "app",
+        "app/Topic",
+        "Queue",
+    ]
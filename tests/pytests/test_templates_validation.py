@@ -0,0 +1,72 @@
+#  SPDX-License-Identifier: MPL-2.0
+#  Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from pytest import raises
+from troposphere import FindInMap, GetAtt, If, Output, Parameter, Ref, Sub, Template
+from troposphere.cloudformation import Stack, WaitConditionHandle
+
+from ecs_composex.common.templates_validation import (
+    TemplateValidator,
+    get_nested_stack_interface,
+    validate_template_locally,
+)
+from ecs_composex.exceptions import TemplateValidationError
+
+
+def nested_template() -> Template:
+    template = Template()
+    template.add_parameter(Parameter("VpcId", Type="AWS::EC2::VPC::Id"))
+    template.add_parameter(Parameter("Optional", Type="String", Default="none"))
+    template.add_resource(WaitConditionHandle("Handle"))
+    template.add_output(Output("HandleId", Value=Ref("Handle")))
+    return template
+
+
+def root_template(parameters: dict, output: str = "HandleId") -> Template:
+    template = Template()
+    template.add_parameter(Parameter("VpcId", Type="AWS::EC2::VPC::Id"))
+    template.add_mapping("Network", {"Vpc": {"Id": "vpc-123456"}})
+    template.add_condition("IsTrue", {"Fn::Equals": ["a", "a"]})
+    template.add_resource(
+        Stack("Nested", TemplateURL="/tmp/nested.json", Parameters=parameters)
+    )
+    template.add_resource(
+        WaitConditionHandle(
+            "Handle", Metadata={"Value": GetAtt("Nested", f"Outputs.{output}")}
+        )
+    )
+    return template
+
+
+def test_valid_nested_stack_template():
+    template = root_template({"VpcId": FindInMap("Network", "Vpc", "Id")})
+    template.add_output(
+        Output(
+            "Value",
+            Value=If("IsTrue", Sub("${Handle}-${AWS::Region}"), Ref("VpcId")),
+        )
+    )
+    validate_template_locally(
+        "root",
+        template.to_dict(),
+        {"Nested": get_nested_stack_interface(nested_template())},
+    )
+
+
+def test_invalid_references():
+    template = root_template({"VpcId": FindInMap("Network", "Vpc", "Nope")})
+    template.add_output(Output("Value", Value=If("Nope", Ref("Nope"), "")))
+    errors = TemplateValidator("root", template.to_dict()).validate()
+    assert len(errors) == 3
+
+
+def test_nested_stack_parameters_and_outputs():
+    template = root_template({"Unknown": "value"}, output="Unknown")
+    with raises(TemplateValidationError) as error:
+        validate_template_locally(
+            "root",
+            template.to_dict(),
+            {"Nested": get_nested_stack_interface(nested_template())},
+        )
+    errors = error.value.args[-1]
+    assert len(errors) == 3